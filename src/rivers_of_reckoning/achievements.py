@@ -0,0 +1,145 @@
+"""Event-driven achievements for Rivers of Reckoning.
+
+Gameplay code publishes events (enemy defeated, potion used, ...) on a
+small in-process EventBus. An AchievementTracker subscribes to them and
+keeps one progress counter per kind of event; when an event fires, only
+the achievements watching its counter are checked. Nothing polls the
+player's state.
+
+Unlocks persist as a bitmask over map_data.ACHIEVEMENTS plus the
+counters, packed into a few bytes.
+"""
+
+import struct
+from typing import Callable, Dict, List, Optional, Set
+
+from .map_data import ACHIEVEMENTS
+
+# Gameplay events
+ENEMY_DEFEATED = "enemy_defeated"
+BOSS_DEFEATED = "boss_defeated"
+POTION_USED = "potion_used"
+TILE_EXPLORED = "tile_explored"
+PLAYER_DIED = "player_died"
+ACHIEVEMENT_UNLOCKED = "achievement_unlocked"
+
+# Progress counter driven by each event
+EVENT_COUNTERS = {
+    ENEMY_DEFEATED: "enemies_defeated",
+    BOSS_DEFEATED: "bosses_defeated",
+    POTION_USED: "potions_used",
+    TILE_EXPLORED: "tiles_explored",
+    PLAYER_DIED: "deaths",
+}
+
+# Persisted counters, in packing order
+COUNTERS = tuple(EVENT_COUNTERS.values())
+
+# unlock bitmask, then one uint32 per counter
+_PROGRESS = struct.Struct("<I" + "I" * len(COUNTERS))
+
+
+class EventBus:
+    """Synchronous publish/subscribe for gameplay events."""
+
+    def __init__(self):
+        self._handlers: Dict[str, List[Callable]] = {}
+
+    def subscribe(self, event: str, handler: Callable):
+        """Call a handler with an event's payload each time it is published."""
+        self._handlers.setdefault(event, []).append(handler)
+
+    def unsubscribe(self, event: str, handler: Callable):
+        """Stop calling a handler for an event."""
+        handlers = self._handlers.get(event)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+
+    def publish(self, event: str, **payload):
+        """Publish an event to its subscribers, in subscription order."""
+        for handler in self._handlers.get(event, ()):
+            handler(**payload)
+
+
+class AchievementTracker:
+    """Unlocks achievements from incremental counters fed by bus events."""
+
+    def __init__(
+        self,
+        bus: EventBus,
+        unlocked: Optional[Set[str]] = None,
+        counters: Optional[Dict[str, int]] = None,
+        definitions: List[dict] = ACHIEVEMENTS,
+    ):
+        """Initialize the tracker and subscribe it to the bus.
+
+        Args:
+            bus: EventBus carrying gameplay events
+            unlocked: Set of unlocked achievement names, updated in place (e.g. player.achievements)
+            counters: Saved progress counters
+            definitions: Achievement definitions with name, counter, goal and optional forbid
+        """
+        self.bus = bus
+        self.unlocked = unlocked if unlocked is not None else set()
+        self.definitions = definitions
+        self.counters = {name: 0 for name in COUNTERS}
+        if counters:
+            self.counters.update(counters)
+
+        # Pending achievements by the counter they wait on
+        self._watching: Dict[str, List[dict]] = {}
+        for definition in definitions:
+            if definition["name"] not in self.unlocked:
+                self._watching.setdefault(definition["counter"], []).append(definition)
+
+        self._handlers = {event: self._counter_handler(counter) for event, counter in EVENT_COUNTERS.items()}
+        for event, handler in self._handlers.items():
+            bus.subscribe(event, handler)
+
+    def _counter_handler(self, counter: str) -> Callable:
+        def handle(amount: int = 1, total: Optional[int] = None, **payload):
+            # Events carry either an increment or a new running total
+            if total is not None:
+                self.counters[counter] = max(self.counters[counter], total)
+            else:
+                self.counters[counter] += amount
+            self._check(counter)
+
+        return handle
+
+    def _check(self, counter: str):
+        pending = self._watching.get(counter)
+        if not pending:
+            return
+        value = self.counters[counter]
+        for definition in [d for d in pending if value >= d["goal"]]:
+            forbid = definition.get("forbid")
+            if forbid is not None and self.counters[forbid]:
+                continue
+            pending.remove(definition)
+            self.unlocked.add(definition["name"])
+            self.bus.publish(ACHIEVEMENT_UNLOCKED, name=definition["name"])
+
+    def detach(self):
+        """Unsubscribe from the bus, e.g. when the game is restarted."""
+        for event, handler in self._handlers.items():
+            self.bus.unsubscribe(event, handler)
+
+    def to_bytes(self) -> bytes:
+        """Pack the unlocks (as a bitmask) and counters."""
+        mask = 0
+        for idx, definition in enumerate(self.definitions):
+            if definition["name"] in self.unlocked:
+                mask |= 1 << idx
+        return _PROGRESS.pack(mask, *(self.counters[name] for name in COUNTERS))
+
+    @staticmethod
+    def unpack(data: bytes, definitions: List[dict] = ACHIEVEMENTS):
+        """Unpack data from to_bytes.
+
+        Returns:
+            Tuple of (set of unlocked names, dict of counters)
+        """
+        mask, *values = _PROGRESS.unpack_from(data, 0)
+        unlocked = {definition["name"] for idx, definition in enumerate(definitions) if mask & (1 << idx)}
+        return unlocked, dict(zip(COUNTERS, values))
@@ -1,9 +1,10 @@
 """Boss battle system using pygame-ce Engine."""
 import random
+from .achievements import BOSS_DEFEATED, PLAYER_DIED
 from .map_data import BOSS_NAMES
 
 
-def boss_battle(game, player, boss_num, boss_strength, boss_health):
+def boss_battle(game, player, boss_num, boss_strength, boss_health, rng=None):
     """Initialize boss battle state.
 
     Args:
@@ -12,6 +13,7 @@ def boss_battle(game, player, boss_num, boss_strength, boss_health):
         boss_num: Boss number (1-3)
         boss_strength: Base strength of the boss
         boss_health: Starting health of the boss
+        rng: Random stream for combat rolls (defaults to the random module)
 
     Returns:
         bool: True if boss is immediately defeated, False otherwise
@@ -36,6 +38,7 @@ def boss_battle(game, player, boss_num, boss_strength, boss_health):
         "boss_ability": boss_ability,
         "player": player,
         "pending_action": None,  # Track pending action for next update
+        "rng": rng if rng is not None else random,
     }
 
     return boss_cur_health <= 0
@@ -52,6 +55,7 @@ def update_boss_battle(game):
     """
     boss_data = game.boss_data
     player = boss_data["player"]
+    rng = boss_data.get("rng", random)
 
     if not game.engine:
         return False
@@ -59,14 +63,14 @@ def update_boss_battle(game):
     # Handle input using Engine
     if game.engine.btnp("a"):
         # Attack
-        dmg = random.randint(2, 4) + player.sword_level
+        dmg = rng.randint(2, 4) + player.sword_level
         boss_data["boss_cur_health"] -= dmg
         boss_data["message"] = f"You attack for {dmg}!"
 
     elif game.engine.btnp("s"):
         # Spell casting (simplified)
         if player.mana >= 3:
-            spell_dmg = random.randint(3, 6)
+            spell_dmg = rng.randint(3, 6)
             boss_data["boss_cur_health"] -= spell_dmg
             player.mana -= 3
             boss_data["message"] = f"Fireball hits for {spell_dmg}!"
@@ -85,7 +89,7 @@ def update_boss_battle(game):
         boss_strength = boss_data["boss_strength"]
 
         if boss_idx == 0:  # Hydra
-            bdmg = random.randint(2, 4) + boss_strength
+            bdmg = rng.randint(2, 4) + boss_strength
             player.take_damage(bdmg)
             player.take_damage(bdmg // 2)
             boss_data["message"] += f" Hydra lashes twice! {bdmg} and {bdmg // 2} damage!"
@@ -93,7 +97,7 @@ def update_boss_battle(game):
             boss_data["boss_ability"] = "shielded"
             boss_data["message"] += " Golem shields itself (half damage next turn)!"
         elif boss_idx == 2:  # Drake
-            bdmg = random.randint(4, 8) + boss_strength
+            bdmg = rng.randint(4, 8) + boss_strength
             player.take_damage(bdmg)
             boss_data["message"] += f" Drake breathes fire! {bdmg} damage!"
         boss_data["boss_ability_cd"] = 3
@@ -104,7 +108,7 @@ def update_boss_battle(game):
             boss_data["message"] += " You blocked the boss's attack!"
             player.block_next = False
         else:
-            bdmg = random.randint(3, 6) + boss_data["boss_strength"]
+            bdmg = rng.randint(3, 6) + boss_data["boss_strength"]
             if boss_data["boss_ability"] == "shielded":
                 bdmg //= 2
                 boss_data["boss_ability"] = None
@@ -118,9 +122,11 @@ def update_boss_battle(game):
     if boss_data["boss_cur_health"] <= 0:
         player.bosses_defeated += 1
         game.state = "playing"
+        game.bus.publish(BOSS_DEFEATED)
         return True
     elif player.health <= 0:
         game.state = "gameover"
+        game.bus.publish(PLAYER_DIED)
         return False
 
     return False
@@ -0,0 +1,167 @@
+"""Cave interiors for Rivers of Reckoning.
+
+Each surface cave entrance leads to its own underground layer: a square
+cavern centered on the entrance, in the same world coordinates. Layouts
+are grown with cellular-automata smoothing (NumPy neighbor counts over
+shifted slices), then flood-fill labeling removes tiny pockets and
+tunnels every remaining pocket to the entrance's cavern, so all floor is
+reachable. A CaveLayer serves the result through the same chunk cache
+and walkability/opacity queries as the surface world.
+"""
+
+from collections import deque
+from typing import Tuple
+
+import numpy as np
+
+from .rng import derive_seed
+from .world_gen import BIOME_CODES, CHUNK_SIZE, TILE_CODES, BiomeType, ChunkedLayer, TileType, WorldChunk, build_chunk
+
+# Half-width of a cavern in tiles
+CAVE_RADIUS = 32
+
+# Initial wall density and number of smoothing passes
+WALL_CHANCE = 0.45
+SMOOTHING_STEPS = 5
+
+# Floor pockets smaller than this are filled instead of tunneled to
+MIN_POCKET = 16
+
+# Radius kept open around the entrance
+ENTRANCE_CLEARING = 2
+
+
+def neighbor_counts(walls: np.ndarray) -> np.ndarray:
+    """Count wall neighbors (8-connected) of every cell; outside counts as wall."""
+    padded = np.pad(walls, 1, constant_values=True).astype(np.uint8)
+    height, width = walls.shape
+    counts = np.zeros(walls.shape, dtype=np.uint8)
+    for dy in (0, 1, 2):
+        for dx in (0, 1, 2):
+            if dx != 1 or dy != 1:
+                counts += padded[dy : dy + height, dx : dx + width]
+    return counts
+
+
+def smooth(walls: np.ndarray, steps: int = SMOOTHING_STEPS) -> np.ndarray:
+    """Apply the 4-5 cellular automaton rule: walls with 4+ wall neighbors stay, floors with 5+ fill."""
+    for _ in range(steps):
+        counts = neighbor_counts(walls)
+        walls = (counts >= 5) | (walls & (counts >= 4))
+    return walls
+
+
+def label_regions(floor: np.ndarray) -> Tuple[np.ndarray, int]:
+    """Label 4-connected floor regions by flood fill.
+
+    Args:
+        floor: Bool mask of open cells
+
+    Returns:
+        Tuple of (int label per cell, 0 for walls; number of regions)
+    """
+    height, width = floor.shape
+    open_cells = floor.ravel().tolist()
+    labels = [0] * (height * width)
+    count = 0
+    for seed in range(height * width):
+        if not open_cells[seed] or labels[seed]:
+            continue
+        count += 1
+        labels[seed] = count
+        queue = deque([seed])
+        while queue:
+            cell = queue.popleft()
+            x = cell % width
+            for neighbor, ok in ((cell - 1, x > 0), (cell + 1, x < width - 1), (cell - width, True), (cell + width, True)):
+                if ok and 0 <= neighbor < len(labels) and open_cells[neighbor] and not labels[neighbor]:
+                    labels[neighbor] = count
+                    queue.append(neighbor)
+    return np.array(labels, dtype=np.int32).reshape(floor.shape), count
+
+
+def _carve_tunnel(walls: np.ndarray, start: Tuple[int, int], end: Tuple[int, int]):
+    """Open an L-shaped tunnel between two (row, col) cells."""
+    (r0, c0), (r1, c1) = start, end
+    walls[r0, min(c0, c1) : max(c0, c1) + 1] = False
+    walls[min(r0, r1) : max(r0, r1) + 1, c1] = False
+
+
+def generate_cave(rng: np.random.Generator, size: int, entrance: Tuple[int, int]) -> np.ndarray:
+    """Generate a connected cave layout.
+
+    Args:
+        rng: NumPy generator for the initial noise
+        size: Width and height in tiles
+        entrance: (row, col) of the entrance, which is always open
+
+    Returns:
+        Bool wall mask [row, col]; every open cell is reachable from the entrance
+    """
+    walls = rng.random((size, size)) < WALL_CHANCE
+    walls[0, :] = walls[-1, :] = walls[:, 0] = walls[:, -1] = True
+    walls = smooth(walls)
+
+    rows, cols = np.ogrid[0:size, 0:size]
+    clearing = (rows - entrance[0]) ** 2 + (cols - entrance[1]) ** 2 <= ENTRANCE_CLEARING**2
+    walls &= ~clearing
+    walls[0, :] = walls[-1, :] = walls[:, 0] = walls[:, -1] = True
+
+    labels, count = label_regions(~walls)
+    sizes = np.bincount(labels.ravel(), minlength=count + 1)
+    main = labels == labels[entrance]
+    for label in range(1, count + 1):
+        region = labels == label
+        if region[entrance]:
+            continue
+        if sizes[label] < MIN_POCKET:
+            walls[region] = True
+            continue
+        # Tunnel from the pocket to the nearest cell of the main cavern
+        start = tuple(np.argwhere(region)[0])
+        targets = np.argwhere(main)
+        end = tuple(targets[np.abs(targets - start).sum(axis=1).argmin()])
+        before = walls.copy()
+        _carve_tunnel(walls, start, end)
+        main |= region | (before & ~walls)
+    return walls
+
+
+class CaveLayer(ChunkedLayer):
+    """Underground layer below one cave entrance.
+
+    Uses world coordinates; the cavern spans CAVE_RADIUS tiles around
+    the entrance and everything outside it is solid wall.
+    """
+
+    def __init__(self, world_seed: int, entrance: Tuple[int, int], radius: int = CAVE_RADIUS, max_chunks: int = 64):
+        """Generate the cave below an entrance.
+
+        Args:
+            world_seed: Seed of the surface world
+            entrance: (x, y) of the surface entrance tile
+            radius: Half-width of the cavern in tiles
+            max_chunks: Maximum number of chunks kept in the cache
+        """
+        super().__init__(max_chunks)
+        self.entrance = entrance
+        self.x0 = entrance[0] - radius
+        self.y0 = entrance[1] - radius
+        rng = np.random.default_rng(derive_seed(world_seed, f"cave:{entrance[0]}:{entrance[1]}"))
+        self.walls = generate_cave(rng, 2 * radius, (radius, radius))
+
+    def _generate_chunk_data(self, chunk_x: int, chunk_y: int) -> WorldChunk:
+        tiles = np.full((CHUNK_SIZE, CHUNK_SIZE), TILE_CODES[TileType.CAVE_WALL], dtype=np.uint8)
+        biomes = np.full((CHUNK_SIZE, CHUNK_SIZE), BIOME_CODES[BiomeType.CAVES], dtype=np.uint8)
+
+        # Overlap of the chunk with the cavern, in cavern-local coordinates
+        size = self.walls.shape[0]
+        lx0 = chunk_x * CHUNK_SIZE - self.x0
+        ly0 = chunk_y * CHUNK_SIZE - self.y0
+        cx0, cy0 = max(lx0, 0), max(ly0, 0)
+        cx1, cy1 = min(lx0 + CHUNK_SIZE, size), min(ly0 + CHUNK_SIZE, size)
+        if cx0 < cx1 and cy0 < cy1:
+            tiles[cy0 - ly0 : cy1 - ly0, cx0 - lx0 : cx1 - lx0] = np.where(
+                self.walls[cy0:cy1, cx0:cx1], TILE_CODES[TileType.CAVE_WALL], TILE_CODES[TileType.CAVE_FLOOR]
+            )
+        return build_chunk(chunk_x, chunk_y, tiles, biomes)
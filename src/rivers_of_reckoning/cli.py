@@ -3,27 +3,77 @@
 
 This provides a command-line interface that works the same as
 the main.py entry point, using async for pygbag compatibility.
+It can also record a session's input to a file and replay it headlessly.
 """
 
+import argparse
 import sys
 import asyncio
 
 
-async def run_game():
-    """Run the game asynchronously."""
+async def run_game(seed=None, record=None, save=None):
+    """Run the game asynchronously.
+
+    Args:
+        seed: Optional session seed
+        record: Optional path to write the session's input log to
+        save: Optional save file to resume from and autosave to
+    """
+    import os
     from .game import Game
+    from .savegame import load_game, road_cache_dir
 
-    game = Game()
+    game = Game(seed=seed, road_cache_dir=road_cache_dir(save) if save else None)
     if game.engine:
+        if save:
+            if os.path.exists(save):
+                load_game(save, game)
+            game.enable_autosave(save)
+        if record:
+            game.engine.start_recording(game.seed)
         await game.engine.run(game.update, game.draw)
+        if record:
+            game.engine.stop_recording().save(record)
+            print(f"Input log saved to {record}")
+        if game.autosaver:
+            game.autosaver.autosave(game)
+            game.autosaver.close()
+    game.close()
+
+
+def replay_game(path, realtime=False):
+    """Replay a recorded input log headlessly.
+
+    Args:
+        path: Input log file
+        realtime: Play at 60 FPS instead of as fast as possible
+    """
+    from .replay import InputLog, ReplayDriver
 
+    driver = ReplayDriver(InputLog.load(path))
+    game = driver.run(realtime=realtime)
+    print(f"Replayed {driver.frame} frames (seed {driver.log.seed}), final state: {game.state}")
+    game.close()
 
-def main():
+
+def main(argv=None):
     """Main CLI entry point."""
+    parser = argparse.ArgumentParser(prog="rivers-of-reckoning")
+    parser.add_argument("--seed", type=int, help="session seed for a reproducible world")
+    parser.add_argument("--record", metavar="PATH", help="record input to PATH")
+    parser.add_argument("--replay", metavar="PATH", help="replay a recorded input log headlessly")
+    parser.add_argument("--realtime", action="store_true", help="replay at real-time pace")
+    parser.add_argument("--save", metavar="PATH", help="resume from and autosave to PATH")
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        replay_game(args.replay, realtime=args.realtime)
+        return
+
     print("Starting Rivers of Reckoning...")
 
     try:
-        asyncio.run(run_game())
+        asyncio.run(run_game(seed=args.seed, record=args.record, save=args.save))
     except KeyboardInterrupt:
         print("\nGame interrupted by user")
         sys.exit(0)
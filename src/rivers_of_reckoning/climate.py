@@ -0,0 +1,108 @@
+"""Coarse-lattice sampling of the low-frequency climate fields.
+
+Moisture and temperature vary more slowly than the terrain, so evaluating
+their noise at every tile is largely redundant. A ClimateLattice evaluates
+them only every ``step`` tiles, caches those lattice points per region,
+and bilinearly interpolates the tiles in between.
+
+The fields are not as smooth as their base scale suggests: the top
+moisture octave has a wavelength of about 3 tiles. Measured against
+full-resolution sampling over 512x512 tiles on several seeds:
+
+    step  max |error|  tiles changing biome  distance from an exact border
+    2     0.058        3.7%                  1 tile
+    4     0.158        12%                   2 tiles
+    8     0.288        26%                   -
+
+Biome regions keep their shape; interpolation only smooths out the
+speckle along their borders. INTERPOLATION_ERROR records the bounds.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Tuple
+
+import numpy as np
+
+CLIMATE_REGION_SHIFT = 6
+CLIMATE_REGION_SIZE = 1 << CLIMATE_REGION_SHIFT
+
+# Bound on |interpolated - exact| per lattice step, with margin over the measured maxima
+INTERPOLATION_ERROR = {1: 0.0, 2: 0.07, 4: 0.18, 8: 0.32}
+
+
+class ClimateLattice:
+    """Region-cached climate lattice with bilinear interpolation."""
+
+    def __init__(
+        self,
+        fields: Callable[[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]],
+        step: int = 4,
+        max_regions: int = 256,
+    ):
+        """Initialize the lattice.
+
+        Args:
+            fields: Function returning (moisture, temperature) for arrays of tile coordinates
+            step: Lattice spacing in tiles; must be a power of two up to the region size
+            max_regions: Maximum number of regions kept in the cache
+        """
+        if step < 1 or step & (step - 1) or step > CLIMATE_REGION_SIZE:
+            raise ValueError(f"Lattice step must be a power of two up to {CLIMATE_REGION_SIZE}, got {step}")
+        self.fields = fields
+        self.step = step
+        self.max_regions = max_regions
+        self._regions: "OrderedDict[Tuple[int, int], np.ndarray]" = OrderedDict()
+
+    def region(self, rx: int, ry: int) -> np.ndarray:
+        """Get a region's lattice, computing and caching it if needed.
+
+        Returns:
+            Array [2, n + 1, n + 1] of (moisture, temperature) lattice points,
+            including the points on the far edges shared with the next regions
+        """
+        key = (rx, ry)
+        lattice = self._regions.get(key)
+        if lattice is not None:
+            self._regions.move_to_end(key)
+            return lattice
+
+        points = CLIMATE_REGION_SIZE // self.step + 1
+        ys, xs = np.mgrid[0:points, 0:points] * self.step
+        lattice = np.stack(self.fields(xs + (rx << CLIMATE_REGION_SHIFT), ys + (ry << CLIMATE_REGION_SHIFT)))
+        self._regions[key] = lattice
+        while len(self._regions) > self.max_regions:
+            self._regions.popitem(last=False)
+        return lattice
+
+    def sample(self, x0: int, y0: int, width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Interpolate moisture and temperature over a rectangle of tiles.
+
+        Args:
+            x0: Left tile X coordinate
+            y0: Top tile Y coordinate
+            width: Width in tiles
+            height: Height in tiles
+
+        Returns:
+            Tuple of (moisture, temperature) arrays of shape (height, width)
+        """
+        out = np.empty((2, height, width))
+        for ry in range(y0 >> CLIMATE_REGION_SHIFT, ((y0 + height - 1) >> CLIMATE_REGION_SHIFT) + 1):
+            for rx in range(x0 >> CLIMATE_REGION_SHIFT, ((x0 + width - 1) >> CLIMATE_REGION_SHIFT) + 1):
+                lattice = self.region(rx, ry)
+                wx0 = max(x0, rx << CLIMATE_REGION_SHIFT)
+                wy0 = max(y0, ry << CLIMATE_REGION_SHIFT)
+                wx1 = min(x0 + width, (rx + 1) << CLIMATE_REGION_SHIFT)
+                wy1 = min(y0 + height, (ry + 1) << CLIMATE_REGION_SHIFT)
+
+                # Region-local tile offsets -> lattice cell and fractional position
+                lx = np.arange(wx0, wx1) - (rx << CLIMATE_REGION_SHIFT)
+                ly = np.arange(wy0, wy1) - (ry << CLIMATE_REGION_SHIFT)
+                ix, fx = lx // self.step, (lx % self.step) / self.step
+                iy, fy = ly // self.step, (ly % self.step) / self.step
+                iy, ix, fy, fx = iy[:, None], ix[None, :], fy[:, None], fx[None, :]
+
+                top = lattice[:, iy, ix] * (1 - fx) + lattice[:, iy, ix + 1] * fx
+                bottom = lattice[:, iy + 1, ix] * (1 - fx) + lattice[:, iy + 1, ix + 1] * fx
+                out[:, wy0 - y0 : wy1 - y0, wx0 - x0 : wx1 - x0] = top * (1 - fy) + bottom * fy
+        return out[0], out[1]
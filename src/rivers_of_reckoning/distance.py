@@ -0,0 +1,45 @@
+"""Distance transforms for per-chunk distance fields.
+
+A chunk's field ("how far to the nearest water tile", ...) is computed
+from the chunk's tiles padded with a halo of tiles from its neighbours,
+so values near chunk edges see features across the seam. Distances are
+exact Euclidean, from the separable two-pass transform: the first pass
+finds each cell's vertical distance to the nearest feature in its
+column, the second combines those along each row. Both passes are
+vectorized over the whole padded block.
+
+Squared distances up to DISTANCE_CAP**2 fit a uint8, so fields store
+them capped there; with a halo of at least DISTANCE_CAP tiles every
+value below the cap is exact.
+"""
+
+import numpy as np
+
+DISTANCE_CAP = 15
+
+
+def distance_transform(features: np.ndarray, halo: int) -> np.ndarray:
+    """Squared distance from each interior cell to the nearest feature.
+
+    Args:
+        features: Bool feature mask of the padded block, indexed [y, x]
+        halo: Padding width on every side; the interior is the rest
+
+    Returns:
+        uint8 squared distances for the interior cells, capped at DISTANCE_CAP**2
+    """
+    height, width = features.shape
+    far = DISTANCE_CAP + 1
+
+    # Pass 1: vertical distance to the nearest feature in each column, from above and below
+    rows = np.arange(height)[:, None]
+    above = np.maximum.accumulate(np.where(features, rows, -far), axis=0)
+    below = np.minimum.accumulate(np.where(features, rows, height + far)[::-1], axis=0)[::-1]
+    vertical = np.minimum(np.minimum(rows - above, below - rows), far)[halo : height - halo]
+
+    # Pass 2: nearest over each row of (horizontal offset)**2 + (vertical distance)**2
+    columns = np.arange(width)
+    interior = columns[halo : width - halo]
+    offsets = (interior[:, None] - columns[None, :]) ** 2
+    squared = (offsets[None, :, :] + (vertical**2)[:, None, :]).min(axis=2)
+    return np.minimum(squared, DISTANCE_CAP**2).astype(np.uint8)
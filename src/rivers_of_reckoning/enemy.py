@@ -3,9 +3,9 @@ from .map_data import ENEMY_TYPES
 
 
 class Enemy:
-    def __init__(self, strength=1, etype=None):
+    def __init__(self, strength=1, etype=None, rng=None):
         if etype is None:
-            etype = random.choice(ENEMY_TYPES)
+            etype = (rng if rng is not None else random).choice(ENEMY_TYPES)
         self.type = etype
         self.name = etype["name"]
         self.strength = strength + etype["dmg_mod"]
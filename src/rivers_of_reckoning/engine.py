@@ -32,6 +32,23 @@ PALETTE = {
     15: (255, 204, 170),  # Peach
 }
 
+# Logical button names mapped to pygame key codes. The order of this
+# mapping is also the bit order used by recorded input logs.
+KEY_MAP = {
+    "up": pygame.K_UP,
+    "down": pygame.K_DOWN,
+    "left": pygame.K_LEFT,
+    "right": pygame.K_RIGHT,
+    "space": pygame.K_SPACE,
+    "enter": pygame.K_RETURN,
+    "escape": pygame.K_ESCAPE,
+    "q": pygame.K_q,
+    "w": pygame.K_w,
+    "a": pygame.K_a,
+    "s": pygame.K_s,
+    "m": pygame.K_m,
+}
+
 
 class Engine:
     """Responsive pygame engine with auto-scaling for web deployment.
@@ -40,12 +57,30 @@ class Engine:
     maintains aspect ratio and works with pygbag for browser games.
     """
 
-    def __init__(self, title="Rivers of Reckoning"):
+    def __init__(self, title="Rivers of Reckoning", headless=False):
         """Initialize the responsive engine.
 
         Args:
             title: Window title
+            headless: Skip the display, clock and font (see HeadlessEngine)
         """
+        self.running = True
+        self.width = LOGICAL_WIDTH
+        self.height = LOGICAL_HEIGHT
+        self.screen = None
+        self.clock = None
+        self.font = None
+
+        # Input state for proper btnp (button pressed this frame)
+        self._keys_pressed = set()
+        self._keys_just_pressed = set()
+
+        # Optional InputRecorder capturing per-frame input for replay
+        self.recorder = None
+
+        if headless:
+            return
+
         pygame.init()
 
         # Use SCALED for automatic scaling + RESIZABLE for window flexibility
@@ -57,16 +92,35 @@ class Engine:
         pygame.display.set_caption(title)
 
         self.clock = pygame.time.Clock()
-        self.running = True
-        self.width = LOGICAL_WIDTH
-        self.height = LOGICAL_HEIGHT
 
         # Font for text rendering (scaled appropriately)
         self.font = pygame.font.Font(None, 8)  # Small font for 256x256 logical
 
-        # Input state for proper btnp (button pressed this frame)
-        self._keys_pressed = set()
-        self._keys_just_pressed = set()
+    def start_recording(self, seed):
+        """Start recording per-frame input into an input log.
+
+        Args:
+            seed: Session seed of the game being recorded
+
+        Returns:
+            The active InputRecorder
+        """
+        from .replay import InputRecorder
+
+        self.recorder = InputRecorder(seed)
+        return self.recorder
+
+    def stop_recording(self):
+        """Stop recording and return the captured input log.
+
+        Returns:
+            The recorded InputLog, or None if nothing was being recorded
+        """
+        if self.recorder is None:
+            return None
+        log = self.recorder.finish()
+        self.recorder = None
+        return log
 
     async def run(self, update, draw):
         """Run the async game loop (pygbag compatible).
@@ -91,6 +145,9 @@ class Engine:
                     # pygame.SCALED handles this automatically
                     pass
 
+            if self.recorder is not None:
+                self.recorder.record_frame(self._keys_pressed, self._keys_just_pressed)
+
             # Game update
             if update:
                 update()
@@ -116,20 +173,7 @@ class Engine:
         Returns:
             True if key was just pressed
         """
-        key_map = {
-            "up": pygame.K_UP,
-            "down": pygame.K_DOWN,
-            "left": pygame.K_LEFT,
-            "right": pygame.K_RIGHT,
-            "space": pygame.K_SPACE,
-            "enter": pygame.K_RETURN,
-            "escape": pygame.K_ESCAPE,
-            "q": pygame.K_q,
-            "w": pygame.K_w,
-            "a": pygame.K_a,
-            "s": pygame.K_s,
-        }
-        pygame_key = key_map.get(key)
+        pygame_key = KEY_MAP.get(key)
         if pygame_key:
             return pygame_key in self._keys_just_pressed
         return False
@@ -143,20 +187,7 @@ class Engine:
         Returns:
             True if key is held
         """
-        key_map = {
-            "up": pygame.K_UP,
-            "down": pygame.K_DOWN,
-            "left": pygame.K_LEFT,
-            "right": pygame.K_RIGHT,
-            "space": pygame.K_SPACE,
-            "enter": pygame.K_RETURN,
-            "escape": pygame.K_ESCAPE,
-            "q": pygame.K_q,
-            "w": pygame.K_w,
-            "a": pygame.K_a,
-            "s": pygame.K_s,
-        }
-        pygame_key = key_map.get(key)
+        pygame_key = KEY_MAP.get(key)
         if pygame_key:
             return pygame_key in self._keys_pressed
         return False
@@ -243,3 +274,96 @@ class Engine:
         """
         c = PALETTE.get(col, (255, 255, 255))
         pygame.draw.line(self.screen, c, (x1, y1), (x2, y2))
+
+    def make_surface(self, pixels):
+        """Render an array of palette indices to a reusable surface.
+
+        Args:
+            pixels: uint8 array of palette indices, indexed [y, x]
+
+        Returns:
+            8-bit pygame.Surface using the game palette
+        """
+        height, width = pixels.shape
+        surface = pygame.Surface((width, height), depth=8)
+        surface.set_palette([PALETTE.get(i, (0, 0, 0)) for i in range(256)])
+        pygame.surfarray.blit_array(surface, pixels.T)
+        return surface
+
+    def blit(self, surface, x, y):
+        """Draw a surface made by make_surface.
+
+        Args:
+            surface: Surface to draw
+            x: X position
+            y: Y position
+        """
+        self.screen.blit(surface, (x, y))
+
+
+class HeadlessEngine(Engine):
+    """Engine without a window, driven by injected input.
+
+    Used for replays, benchmarks and tests. Drawing goes to an offscreen
+    surface when ``render`` is True and is skipped entirely otherwise.
+    """
+
+    def __init__(self, render=False):
+        """Initialize the headless engine.
+
+        Args:
+            render: Draw to an offscreen surface instead of discarding draws
+        """
+        super().__init__(headless=True)
+        self.render = render
+        if render:
+            pygame.font.init()
+            self.screen = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT))
+            self.font = pygame.font.Font(None, 8)
+
+    def set_input(self, pressed, just_pressed):
+        """Replace the input state for the next frame.
+
+        Args:
+            pressed: Iterable of pygame key codes currently held
+            just_pressed: Iterable of pygame key codes pressed this frame
+        """
+        self._keys_pressed = set(pressed)
+        self._keys_just_pressed = set(just_pressed)
+
+    def cls(self, color):
+        if self.render:
+            super().cls(color)
+
+    def text(self, x, y, s, col):
+        if self.render:
+            super().text(x, y, s, col)
+
+    def rect(self, x, y, w, h, col):
+        if self.render:
+            super().rect(x, y, w, h, col)
+
+    def rectb(self, x, y, w, h, col):
+        if self.render:
+            super().rectb(x, y, w, h, col)
+
+    def circ(self, x, y, r, col):
+        if self.render:
+            super().circ(x, y, r, col)
+
+    def circb(self, x, y, r, col):
+        if self.render:
+            super().circb(x, y, r, col)
+
+    def line(self, x1, y1, x2, y2, col):
+        if self.render:
+            super().line(x1, y1, x2, y2, col)
+
+    def make_surface(self, pixels):
+        if self.render:
+            return super().make_surface(pixels)
+        return None
+
+    def blit(self, surface, x, y):
+        if self.render and surface is not None:
+            super().blit(surface, x, y)
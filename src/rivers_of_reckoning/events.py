@@ -0,0 +1,245 @@
+"""Data-driven random events for Rivers of Reckoning.
+
+Events and per-biome weighted event tables are loaded from a JSON file
+(data/events.json by default). Each table is compiled into a Walker
+alias table when loaded: drawing an event is one uniform index plus one
+biased coin flip, however many events the table holds.
+
+Effects are declarative operations such as ``["add", "gold", 5]`` instead
+of callables, so event data can be validated up front, serialized and
+applied in bulk by headless simulations.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+EVENT_DATA_PATH = os.path.join(os.path.dirname(__file__), "data", "events.json")
+
+# Table used for biomes without one of their own
+DEFAULT_TABLE = "default"
+
+# Effect operations and their argument counts:
+#   add attr amount               attr += amount
+#   add_capped attr amount cap    attr = min(attr + amount, cap attribute)
+#   damage amount                 player.take_damage(amount)
+#   set attr value                attr = value
+EFFECT_OPS = {"add": 2, "add_capped": 3, "damage": 1, "set": 2}
+
+
+@dataclass(frozen=True)
+class GameEvent:
+    """A random event and its declarative effects."""
+
+    key: str
+    name: str
+    desc: str
+    effects: Tuple[tuple, ...] = ()
+
+
+def build_alias_table(weights: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+    """Build a Walker alias table for a discrete distribution (Vose's method).
+
+    Args:
+        weights: Positive weights, one per outcome
+
+    Returns:
+        Tuple of (probability of keeping each column, alias of each column)
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    n = len(weights)
+    scaled = weights * n / weights.sum()
+    prob = np.ones(n)
+    alias = np.arange(n)
+    small = [i for i in range(n) if scaled[i] < 1.0]
+    large = [i for i in range(n) if scaled[i] >= 1.0]
+    while small and large:
+        less = small.pop()
+        more = large.pop()
+        prob[less] = scaled[less]
+        alias[less] = more
+        scaled[more] -= 1.0 - scaled[less]
+        (small if scaled[more] < 1.0 else large).append(more)
+    # Whatever is left is 1 up to rounding error and keeps its own column
+    return prob, alias
+
+
+class EventTable:
+    """A weighted event table compiled for constant-time sampling."""
+
+    def __init__(self, events: List[GameEvent], weights: Sequence[float]):
+        """Compile a table.
+
+        Args:
+            events: Events of the table
+            weights: Relative weight of each event
+        """
+        self.events = events
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.prob, self.alias = build_alias_table(self.weights)
+        # Plain lists are faster than numpy arrays for single draws
+        self._prob = self.prob.tolist()
+        self._alias = self.alias.tolist()
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def sample(self, rng) -> GameEvent:
+        """Draw one event.
+
+        Args:
+            rng: random.Random-like stream
+
+        Returns:
+            The drawn GameEvent
+        """
+        i = rng.randrange(len(self.events))
+        if rng.random() >= self._prob[i]:
+            i = self._alias[i]
+        return self.events[i]
+
+    def sample_many(self, rng, n: int) -> np.ndarray:
+        """Draw many events at once, e.g. for a headless simulation.
+
+        Args:
+            rng: RNGStream (its numpy generator is used)
+            n: Number of draws
+
+        Returns:
+            int array of indices into events
+        """
+        generator = rng.generator
+        columns = generator.integers(0, len(self.events), size=n)
+        keep = generator.random(n) < self.prob[columns]
+        return np.where(keep, columns, self.alias[columns])
+
+
+def apply_effects(player, effects: Sequence[tuple]):
+    """Apply declarative effects to a player.
+
+    Args:
+        player: Player (or any object with the named attributes)
+        effects: Sequence of (operation, *arguments)
+    """
+    for op, *args in effects:
+        if op == "add":
+            attr, amount = args
+            setattr(player, attr, getattr(player, attr) + amount)
+        elif op == "add_capped":
+            attr, amount, cap = args
+            setattr(player, attr, min(getattr(player, attr) + amount, getattr(player, cap)))
+        elif op == "damage":
+            player.take_damage(args[0])
+        elif op == "set":
+            attr, value = args
+            setattr(player, attr, value)
+
+
+def _compile_effects(key: str, effects) -> Tuple[tuple, ...]:
+    compiled = []
+    for effect in effects:
+        op, *args = effect
+        if EFFECT_OPS.get(op) != len(args):
+            raise ValueError(f"Event '{key}' has an invalid effect {effect!r}")
+        compiled.append((op, *args))
+    return tuple(compiled)
+
+
+class EventEngine:
+    """Per-biome random event tables."""
+
+    def __init__(self, events: Dict[str, GameEvent], tables: Dict[str, EventTable]):
+        """Initialize the engine.
+
+        Args:
+            events: Events by key
+            tables: Compiled tables by biome name (lowercase), including DEFAULT_TABLE
+        """
+        self.events = events
+        self.tables = tables
+
+    @classmethod
+    def from_data(cls, data: dict) -> "EventEngine":
+        """Validate and compile event data.
+
+        Args:
+            data: Mapping with "events" (key -> name, desc, effects) and
+                "tables" (biome -> event key -> weight)
+
+        Returns:
+            EventEngine
+
+        Raises:
+            ValueError: If an effect, event reference or weight is invalid
+        """
+        events = {
+            key: GameEvent(key, spec["name"], spec["desc"], _compile_effects(key, spec.get("effects", ())))
+            for key, spec in data["events"].items()
+        }
+        if DEFAULT_TABLE not in data["tables"]:
+            raise ValueError(f"Event data has no '{DEFAULT_TABLE}' table")
+
+        tables = {}
+        for biome, entries in data["tables"].items():
+            for key, weight in entries.items():
+                if key not in events:
+                    raise ValueError(f"Table '{biome}' refers to unknown event '{key}'")
+                if weight <= 0:
+                    raise ValueError(f"Table '{biome}' gives event '{key}' a non-positive weight")
+            if not entries:
+                raise ValueError(f"Table '{biome}' is empty")
+            tables[biome] = EventTable([events[key] for key in entries], list(entries.values()))
+        return cls(events, tables)
+
+    @classmethod
+    def load(cls, path: str = EVENT_DATA_PATH) -> "EventEngine":
+        """Load and compile event data from a JSON file."""
+        with open(path, encoding="utf-8") as f:
+            return cls.from_data(json.load(f))
+
+    def to_data(self) -> dict:
+        """Get the engine's events and tables as JSON-serializable data."""
+        return {
+            "events": {
+                key: {"name": event.name, "desc": event.desc, "effects": [list(effect) for effect in event.effects]}
+                for key, event in self.events.items()
+            },
+            "tables": {
+                biome: {event.key: float(weight) for event, weight in zip(table.events, table.weights)}
+                for biome, table in self.tables.items()
+            },
+        }
+
+    def table(self, biome) -> EventTable:
+        """Get the table of a biome (a BiomeType or name), or the default table."""
+        name = biome.name.lower() if hasattr(biome, "name") else str(biome).lower()
+        return self.tables.get(name, self.tables[DEFAULT_TABLE])
+
+    def trigger(self, player, biome, rng) -> GameEvent:
+        """Draw an event for a biome and apply its effects to the player.
+
+        Args:
+            player: Player affected by the event
+            biome: BiomeType (or name) whose table is used
+            rng: random.Random-like stream
+
+        Returns:
+            The GameEvent that happened
+        """
+        event = self.table(biome).sample(rng)
+        apply_effects(player, event.effects)
+        return event
+
+
+_default_engine = None
+
+
+def default_event_engine() -> EventEngine:
+    """Get the engine for the bundled event data, loading it once."""
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = EventEngine.load()
+    return _default_engine
@@ -0,0 +1,190 @@
+"""Chunked bitset exploration store (fog of war) for Rivers of Reckoning.
+
+Explored tiles are kept as one 256-bit bitset per 16x16 chunk instead of
+a set of coordinate tuples: one bit per tile rather than 100+ bytes,
+O(1) mark and query, and a running count so "how much has the player
+explored" never requires a scan.
+"""
+
+import struct
+import zlib
+from typing import Dict, Iterable, Iterator, Tuple
+
+import numpy as np
+
+CHUNK_SHIFT = 4
+CHUNK_SIZE = 1 << CHUNK_SHIFT
+CHUNK_MASK = CHUNK_SIZE - 1
+CHUNK_BYTES = CHUNK_SIZE * CHUNK_SIZE // 8
+
+_FULL_CHUNK = b"\xff" * CHUNK_BYTES
+_ENCODING_VERSION = 1
+# chunk x, chunk y, 1 if fully explored (no payload follows)
+_CHUNK_ENTRY = struct.Struct("<ii?")
+
+
+class ExplorationMap:
+    """Set of explored tiles stored as per-chunk bitsets.
+
+    Supports the parts of the ``set`` API the game used for
+    ``Player.explored`` (``add``, ``update``, ``in``, ``len``, iteration).
+    """
+
+    def __init__(self):
+        """Initialize an empty exploration map."""
+        self._chunks: Dict[Tuple[int, int], bytearray] = {}
+        self._count = 0
+
+    def mark(self, x: int, y: int) -> bool:
+        """Mark a tile as explored.
+
+        Args:
+            x: World X coordinate
+            y: World Y coordinate
+
+        Returns:
+            True if the tile was not explored before
+        """
+        key = (x >> CHUNK_SHIFT, y >> CHUNK_SHIFT)
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            chunk = bytearray(CHUNK_BYTES)
+            self._chunks[key] = chunk
+        idx = ((y & CHUNK_MASK) << CHUNK_SHIFT) | (x & CHUNK_MASK)
+        bit = 1 << (idx & 7)
+        if chunk[idx >> 3] & bit:
+            return False
+        chunk[idx >> 3] |= bit
+        self._count += 1
+        return True
+
+    def mark_area(self, x: int, y: int, radius: int) -> int:
+        """Mark the square of tiles within ``radius`` of a point.
+
+        Args:
+            x: Center X coordinate
+            y: Center Y coordinate
+            radius: Half-width of the square
+
+        Returns:
+            Number of newly explored tiles
+        """
+        mark = self.mark
+        new = 0
+        for ty in range(y - radius, y + radius + 1):
+            for tx in range(x - radius, x + radius + 1):
+                new += mark(tx, ty)
+        return new
+
+    def is_explored(self, x: int, y: int) -> bool:
+        """Check whether a tile has been explored."""
+        chunk = self._chunks.get((x >> CHUNK_SHIFT, y >> CHUNK_SHIFT))
+        if chunk is None:
+            return False
+        idx = ((y & CHUNK_MASK) << CHUNK_SHIFT) | (x & CHUNK_MASK)
+        return bool(chunk[idx >> 3] & (1 << (idx & 7)))
+
+    @property
+    def count(self) -> int:
+        """Number of explored tiles (O(1))."""
+        return self._count
+
+    @property
+    def chunk_count(self) -> int:
+        """Number of chunks with at least one explored tile."""
+        return len(self._chunks)
+
+    # set-compatible API ----------------------------------------------------
+
+    def add(self, pos: Tuple[int, int]):
+        self.mark(pos[0], pos[1])
+
+    def update(self, positions: Iterable[Tuple[int, int]]):
+        for x, y in positions:
+            self.mark(x, y)
+
+    def __contains__(self, pos) -> bool:
+        return self.is_explored(pos[0], pos[1])
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for (cx, cy), chunk in self._chunks.items():
+            bits = np.unpackbits(np.frombuffer(chunk, dtype=np.uint8), bitorder="little")
+            for idx in np.flatnonzero(bits).tolist():
+                yield (cx << CHUNK_SHIFT) | (idx & CHUNK_MASK), (cy << CHUNK_SHIFT) | (idx >> CHUNK_SHIFT)
+
+    # queries ---------------------------------------------------------------
+
+    def viewport_mask(self, x0: int, y0: int, width: int, height: int) -> np.ndarray:
+        """Get explored flags for a rectangular region, e.g. the camera view.
+
+        Args:
+            x0: Left world X coordinate
+            y0: Top world Y coordinate
+            width: Region width in tiles
+            height: Region height in tiles
+
+        Returns:
+            Boolean array of shape (height, width), indexed [y, x]
+        """
+        mask = np.zeros((height, width), dtype=bool)
+        for cy in range(y0 >> CHUNK_SHIFT, ((y0 + height - 1) >> CHUNK_SHIFT) + 1):
+            for cx in range(x0 >> CHUNK_SHIFT, ((x0 + width - 1) >> CHUNK_SHIFT) + 1):
+                chunk = self._chunks.get((cx, cy))
+                if chunk is None:
+                    continue
+                bits = np.unpackbits(np.frombuffer(chunk, dtype=np.uint8), bitorder="little")
+                bits = bits.reshape(CHUNK_SIZE, CHUNK_SIZE).astype(bool)
+                # Overlap of this chunk with the requested region, in world coordinates
+                wx0 = max(x0, cx << CHUNK_SHIFT)
+                wy0 = max(y0, cy << CHUNK_SHIFT)
+                wx1 = min(x0 + width, (cx + 1) << CHUNK_SHIFT)
+                wy1 = min(y0 + height, (cy + 1) << CHUNK_SHIFT)
+                mask[wy0 - y0 : wy1 - y0, wx0 - x0 : wx1 - x0] = bits[
+                    wy0 & CHUNK_MASK : ((wy1 - 1) & CHUNK_MASK) + 1, wx0 & CHUNK_MASK : ((wx1 - 1) & CHUNK_MASK) + 1
+                ]
+        return mask
+
+    # encoding --------------------------------------------------------------
+
+    def to_bytes(self) -> bytes:
+        """Encode the map compactly for saving.
+
+        Fully explored chunks are stored as a flag only; the rest store
+        their raw bitset. The whole payload is then deflate-compressed,
+        which collapses the long runs typical of explored regions.
+        """
+        out = [struct.pack("<BI", _ENCODING_VERSION, len(self._chunks))]
+        for (cx, cy), chunk in sorted(self._chunks.items()):
+            full = chunk == _FULL_CHUNK
+            out.append(_CHUNK_ENTRY.pack(cx, cy, full))
+            if not full:
+                out.append(bytes(chunk))
+        return zlib.compress(b"".join(out))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ExplorationMap":
+        """Decode a map produced by to_bytes.
+
+        Raises:
+            ValueError: If the data uses an unknown encoding version
+        """
+        raw = zlib.decompress(data)
+        version, count = struct.unpack_from("<BI", raw, 0)
+        if version != _ENCODING_VERSION:
+            raise ValueError(f"Unsupported exploration encoding {version}")
+        explored = cls()
+        offset = 5
+        for _ in range(count):
+            cx, cy, full = _CHUNK_ENTRY.unpack_from(raw, offset)
+            offset += _CHUNK_ENTRY.size
+            if full:
+                chunk = bytearray(_FULL_CHUNK)
+            else:
+                chunk = bytearray(raw[offset : offset + CHUNK_BYTES])
+                offset += CHUNK_BYTES
+            explored._chunks[(cx, cy)] = chunk
+            explored._count += int.from_bytes(chunk, "little").bit_count()
+        return explored
@@ -0,0 +1,162 @@
+"""Shared flow field toward a target tile (normally the player).
+
+One breadth-first integration field over the walkable tiles around the
+target is shared by every chaser: each enemy just looks up the next tile
+toward the target at its own position. The field is recomputed only
+when the target changes tile, so a horde of chasers costs one field
+update per player step instead of one path search per enemy.
+
+Querying the window's walkability is most of the cost of a fresh field.
+The window follows the target, so its walkability is kept and shifted
+with it, and only the newly uncovered rows and columns are queried. The BFS
+itself is redone in full: a one-tile move of the target changes the
+distance of about half the tiles in the field, so a local repair would
+not touch fewer tiles than the vectorized wavefront. Cached walkability
+is dropped when a chunk under the window is evicted (e.g. on a season
+change).
+"""
+
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .world_gen import CHUNK_SHIFT, CHUNK_SIZE
+
+Tile = Tuple[int, int]
+
+# Neighbor offsets in tie-break order (dx, dy)
+_STEPS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+class FlowField:
+    """BFS distance field and next-step directions around a target tile."""
+
+    def __init__(self, world, radius: int = 32):
+        """Initialize the flow field.
+
+        Args:
+            world: ProceduralWorld providing walkability
+            radius: Half-width in tiles of the square region the field covers
+        """
+        self.world = world
+        self.radius = radius
+        self.target: Optional[Tile] = None
+        self.origin: Tile = (0, 0)
+        size = 2 * radius + 1
+        self.distance = np.full((size, size), -1, dtype=np.int32)  # [y, x], -1 if unreachable
+        self.step_x = np.zeros((size, size), dtype=np.int8)
+        self.step_y = np.zeros((size, size), dtype=np.int8)
+        self._walkable: Optional[np.ndarray] = None  # walkability of the window at self.origin
+        world.add_eviction_listener(self.invalidate_chunk)
+
+    def close(self):
+        """Stop listening to the world's evictions, e.g. when this field is discarded."""
+        self.world.remove_eviction_listener(self.invalidate_chunk)
+
+    def invalidate_chunk(self, chunk_x: int, chunk_y: int):
+        """Drop the cached walkability and field if an evicted chunk lies under the window."""
+        size = 2 * self.radius + 1
+        x0, y0 = chunk_x << CHUNK_SHIFT, chunk_y << CHUNK_SHIFT
+        ox, oy = self.origin
+        if x0 < ox + size and ox < x0 + CHUNK_SIZE and y0 < oy + size and oy < y0 + CHUNK_SIZE:
+            self._walkable = None
+            self.target = None
+
+    def _window_walkable(self, origin: Tile) -> np.ndarray:
+        """Walkability of the window at an origin, reusing the overlap with the previous window."""
+        size = 2 * self.radius + 1
+        walkable = np.empty((size, size), dtype=bool)
+        missing = np.ones((size, size), dtype=bool)
+        if self._walkable is not None:
+            dx = origin[0] - self.origin[0]
+            dy = origin[1] - self.origin[1]
+            if abs(dx) < size and abs(dy) < size:
+                # New [y, x] is old [y + dy, x + dx] where both windows overlap
+                x0, x1 = max(0, -dx), min(size, size - dx)
+                y0, y1 = max(0, -dy), min(size, size - dy)
+                walkable[y0:y1, x0:x1] = self._walkable[y0 + dy : y1 + dy, x0 + dx : x1 + dx]
+                missing[y0:y1, x0:x1] = False
+        ys, xs = np.nonzero(missing)
+        if len(xs):
+            walkable[ys, xs] = self.world.is_walkable_many(xs + origin[0], ys + origin[1])
+        return walkable
+
+    def update(self, target: Tile) -> bool:
+        """Recompute the field if the target moved to another tile.
+
+        Args:
+            target: Tile the field flows toward
+
+        Returns:
+            True if the field was recomputed
+        """
+        if target == self.target:
+            return False
+        origin = (target[0] - self.radius, target[1] - self.radius)
+        walkable = self._window_walkable(origin)
+        self.target = target
+        self.origin = origin
+        self._walkable = walkable
+        size = 2 * self.radius + 1
+
+        # Wavefront BFS: grow the frontier one step per iteration over the whole region
+        distance = np.full((size, size), -1, dtype=np.int32)
+        frontier = np.zeros((size, size), dtype=bool)
+        frontier[self.radius, self.radius] = True
+        distance[self.radius, self.radius] = 0
+        step = 0
+        while frontier.any():
+            step += 1
+            grown = np.zeros_like(frontier)
+            grown[1:, :] |= frontier[:-1, :]
+            grown[:-1, :] |= frontier[1:, :]
+            grown[:, 1:] |= frontier[:, :-1]
+            grown[:, :-1] |= frontier[:, 1:]
+            frontier = grown & walkable & (distance < 0)
+            distance[frontier] = step
+
+        # Each reached tile points at a neighbor one step closer to the target
+        padded = np.pad(distance, 1, constant_values=-1)
+        step_x = np.zeros((size, size), dtype=np.int8)
+        step_y = np.zeros((size, size), dtype=np.int8)
+        unassigned = distance > 0
+        for dx, dy in _STEPS:
+            neighbor = padded[1 + dy : 1 + dy + size, 1 + dx : 1 + dx + size]
+            downhill = unassigned & (neighbor == distance - 1)
+            step_x[downhill] = dx
+            step_y[downhill] = dy
+            unassigned &= ~downhill
+
+        self.distance = distance
+        self.step_x = step_x
+        self.step_y = step_y
+        return True
+
+    def distance_at(self, x: int, y: int) -> int:
+        """Steps from a tile to the target, or -1 if unreachable or outside the field."""
+        lx = x - self.origin[0]
+        ly = y - self.origin[1]
+        size = 2 * self.radius + 1
+        if self.target is None or not (0 <= lx < size and 0 <= ly < size):
+            return -1
+        return int(self.distance[ly, lx])
+
+    def sample(self, x: float, y: float) -> Optional[Tuple[float, float]]:
+        """Get the point an entity at (x, y) should steer toward.
+
+        Args:
+            x: Entity X position
+            y: Entity Y position
+
+        Returns:
+            Center of the next tile toward the target, or None if the
+            position is outside the field, unreachable, or on the target
+        """
+        tx = math.floor(x)
+        ty = math.floor(y)
+        if self.distance_at(tx, ty) <= 0:
+            return None
+        lx = tx - self.origin[0]
+        ly = ty - self.origin[1]
+        return tx + int(self.step_x[ly, lx]) + 0.5, ty + int(self.step_y[ly, lx]) + 0.5
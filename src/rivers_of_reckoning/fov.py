@@ -0,0 +1,168 @@
+"""Field of view via recursive shadowcasting.
+
+Visibility is computed from a viewer tile over the world's opacity mask
+(trees, rocks and stone block sight), limited to a circular radius. The
+result for each (viewer tile, radius) is memoized, so an unmoving viewer
+costs a dictionary lookup per frame; cached results covering a chunk are
+dropped when the world evicts that chunk.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+from .world_gen import CHUNK_SHIFT, ProceduralWorld
+
+# Octant transforms (xx, xy, yx, yy) for shadowcasting
+_OCTANTS = (
+    (1, 0, 0, 1),
+    (0, 1, 1, 0),
+    (0, -1, 1, 0),
+    (-1, 0, 0, 1),
+    (-1, 0, 0, -1),
+    (0, -1, -1, 0),
+    (0, 1, -1, 0),
+    (1, 0, 0, -1),
+)
+
+
+@dataclass
+class VisibilityMask:
+    """Tiles visible from a viewer, as a square around the viewer."""
+
+    x0: int  # world X of mask column 0
+    y0: int  # world Y of mask row 0
+    mask: np.ndarray  # bool [y, x]
+
+    def is_visible(self, x: int, y: int) -> bool:
+        """Check whether a world tile is visible."""
+        lx = x - self.x0
+        ly = y - self.y0
+        height, width = self.mask.shape
+        return 0 <= lx < width and 0 <= ly < height and bool(self.mask[ly, lx])
+
+    def viewport_mask(self, x0: int, y0: int, width: int, height: int) -> np.ndarray:
+        """Get visible flags for a rectangular region, e.g. the camera view.
+
+        Args:
+            x0: Left world X coordinate
+            y0: Top world Y coordinate
+            width: Region width in tiles
+            height: Region height in tiles
+
+        Returns:
+            Boolean array of shape (height, width), indexed [y, x]
+        """
+        out = np.zeros((height, width), dtype=bool)
+        mask_height, mask_width = self.mask.shape
+        wx0 = max(x0, self.x0)
+        wy0 = max(y0, self.y0)
+        wx1 = min(x0 + width, self.x0 + mask_width)
+        wy1 = min(y0 + height, self.y0 + mask_height)
+        if wx0 < wx1 and wy0 < wy1:
+            out[wy0 - y0 : wy1 - y0, wx0 - x0 : wx1 - x0] = self.mask[
+                wy0 - self.y0 : wy1 - self.y0, wx0 - self.x0 : wx1 - self.x0
+            ]
+        return out
+
+
+def _cast_light(opaque, visible, radius, row, start, end, xx, xy, yx, yy):
+    """Scan one octant from `row` outward between slopes start and end."""
+    if start < end:
+        return
+    radius_sq = radius * radius
+    new_start = start
+    for j in range(row, radius + 1):
+        dx = -j - 1
+        dy = -j
+        blocked = False
+        while dx <= 0:
+            dx += 1
+            left_slope = (dx - 0.5) / (dy + 0.5)
+            right_slope = (dx + 0.5) / (dy - 0.5)
+            if start < right_slope:
+                continue
+            if end > left_slope:
+                break
+
+            # Local coordinates in the (2r+1)^2 grid centered on the viewer
+            lx = radius + dx * xx + dy * xy
+            ly = radius + dx * yx + dy * yy
+            if dx * dx + dy * dy <= radius_sq:
+                visible[ly][lx] = True
+
+            if blocked:
+                if opaque[ly][lx]:
+                    new_start = right_slope
+                else:
+                    blocked = False
+                    start = new_start
+            elif opaque[ly][lx] and j < radius:
+                # Start of a blocker: scan the lit part beyond it, then skip the shadow
+                blocked = True
+                _cast_light(opaque, visible, radius, j + 1, start, left_slope, xx, xy, yx, yy)
+                new_start = right_slope
+        if blocked:
+            break
+
+
+class FieldOfView:
+    """Memoized shadowcasting field-of-view over a ProceduralWorld."""
+
+    def __init__(self, world: ProceduralWorld, cache_size: int = 64):
+        """Initialize the field of view.
+
+        Args:
+            world: World providing opacity; its chunk evictions invalidate cached results
+            cache_size: Number of (tile, radius) results kept
+        """
+        self.world = world
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[int, int, int], VisibilityMask]" = OrderedDict()
+        world.add_eviction_listener(self.invalidate_chunk)
+
+    def close(self):
+        """Stop listening to the world's evictions, e.g. when this field of view is discarded."""
+        self.world.remove_eviction_listener(self.invalidate_chunk)
+
+    def invalidate_chunk(self, chunk_x: int, chunk_y: int):
+        """Drop cached results whose area overlaps a chunk."""
+        for key in list(self._cache):
+            x, y, radius = key
+            overlaps_x = (x - radius) >> CHUNK_SHIFT <= chunk_x <= (x + radius) >> CHUNK_SHIFT
+            overlaps_y = (y - radius) >> CHUNK_SHIFT <= chunk_y <= (y + radius) >> CHUNK_SHIFT
+            if overlaps_x and overlaps_y:
+                del self._cache[key]
+
+    def compute(self, x: int, y: int, radius: int) -> VisibilityMask:
+        """Get the tiles visible from a tile.
+
+        Args:
+            x: Viewer X tile
+            y: Viewer Y tile
+            radius: Sight radius in tiles
+
+        Returns:
+            VisibilityMask centered on the viewer
+        """
+        key = (x, y, radius)
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache.move_to_end(key)
+            return result
+
+        size = 2 * radius + 1
+        ys, xs = np.mgrid[0:size, 0:size]
+        opaque = self.world.is_opaque_many(xs + (x - radius), ys + (y - radius)).tolist()
+        visible = [[False] * size for _ in range(size)]
+        visible[radius][radius] = True
+        for xx, xy, yx, yy in _OCTANTS:
+            _cast_light(opaque, visible, radius, 1, 1.0, 0.0, xx, xy, yx, yy)
+
+        result = VisibilityMask(x - radius, y - radius, np.array(visible, dtype=bool))
+        self._cache[key] = result
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
@@ -7,17 +7,28 @@ The game is fully procedurally generated using OpenSimplex noise for
 natural terrain, biomes, weather, and day/night cycles.
 """
 
-import random
+from .achievements import (
+    ACHIEVEMENT_UNLOCKED,
+    ENEMY_DEFEATED,
+    PLAYER_DIED,
+    TILE_EXPLORED,
+    AchievementTracker,
+    EventBus,
+)
 from .player import Player
-from .enemy import Enemy
-from .map_data import MAP_SIZE, EVENT_TYPES
+from .map_data import MAP_SIZE, REVEAL_RADIUS, draw_enemy_sprite
 from .engine import Engine, LOGICAL_WIDTH, LOGICAL_HEIGHT
+from .events import default_event_engine
+from .rng import RNGService
 from .systems import create_game_world
 from .world_gen import BIOME_CONFIGS, BiomeType
 
 # Event message display duration (frames at 60 FPS = 3 seconds)
 EVENT_MESSAGE_DURATION = 180
 
+# Frames between incremental autosaves (60 FPS = 10 seconds)
+AUTOSAVE_INTERVAL = 600
+
 
 class Game:
     """Rivers of Reckoning - Fully Procedural RPG
@@ -29,20 +40,36 @@ class Game:
     seamless web deployment through pygbag.
     """
 
-    def __init__(self, test_mode=False):
+    def __init__(self, test_mode=False, seed=None, engine=None, road_cache_dir=None):
+        """Create a game session.
+
+        Args:
+            test_mode: Run headless without creating an Engine window
+            seed: Session seed; the same seed and inputs replay the same session
+            engine: Engine to use instead of creating one (e.g. a HeadlessEngine)
+            road_cache_dir: Directory where planned road regions are cached on disk
+                (e.g. savegame.road_cache_dir beside the save file); no disk cache if None
+        """
+        # Per-subsystem random streams derived from the session seed
+        self.rng = RNGService(seed)
+        self.seed = self.rng.seed
+        self.road_cache_dir = road_cache_dir
+
         # Use logical dimensions from engine
         self.WINDOW_WIDTH = LOGICAL_WIDTH
         self.WINDOW_HEIGHT = LOGICAL_HEIGHT
 
         # Initialize responsive Engine (auto-scales to any screen)
-        if not test_mode:
+        if engine is not None:
+            self.engine = engine
+        elif not test_mode:
             self.engine = Engine()
         else:
             self.engine = None
 
         # Game state
         self.running = True
-        self.state = "title"  # 'title', 'playing', 'paused', 'gameover', 'boss'
+        self.state = "title"  # 'title', 'playing', 'paused', 'worldmap', 'gameover', 'boss'
 
         # ECS World for systems
         self.ecs_world = None
@@ -56,6 +83,19 @@ class Game:
         self.event_message = None
         self.event_timer = 0
         self.boss_data = None
+        self.world_map = None  # overview.WorldMapScreen, created on first use
+
+        # Gameplay events, and the achievements they drive
+        self.bus = EventBus()
+        self.bus.subscribe(ACHIEVEMENT_UNLOCKED, self._on_achievement_unlocked)
+        self.achievements = None
+        # Unlock announcements, shown one at a time apart from event messages so none is overwritten
+        self.announcements = []
+        self.announcement_timer = 0
+
+        # Optional savegame.Autosaver, driven from update_playing
+        self.autosaver = None
+        self._autosave_timer = 0
 
         # Game statistics
         self.distance_traveled = 0
@@ -85,6 +125,8 @@ class Game:
             self.update_playing()
         elif self.state == "paused":
             self.update_paused()
+        elif self.state == "worldmap":
+            self.update_worldmap()
         elif self.state == "gameover":
             self.update_gameover()
 
@@ -99,6 +141,8 @@ class Game:
                 self.draw_playing()
             elif self.state == "paused":
                 self.draw_paused()
+            elif self.state == "worldmap":
+                self.draw_worldmap()
             elif self.state == "gameover":
                 self.draw_gameover()
 
@@ -153,23 +197,31 @@ class Game:
 
     def start_game(self):
         """Initialize fully procedural game world"""
-        # Initialize ECS world with all systems
-        self.ecs_world = create_game_world()
+        # Create procedural map with a world seed drawn from the session
+        from .map import Map
+        seed = self.rng.stream("world").randint(1, 999999)
+        self.close()
+        self.map = Map(seed=seed, rng=self.rng.stream("map"), roads=True, road_cache_dir=self.road_cache_dir, seasonal=True)
+        self.world_map = None
 
-        # Create player
-        self.player = Player("Normal")
+        # Initialize ECS world with all systems, colliding against the map
+        self.ecs_world = create_game_world(rng=self.rng, world_gen=self.map.world)
 
-        # Create procedural map with random seed
-        from .map import Map
-        seed = random.randint(1, 999999)
-        self.map = Map(seed=seed)
+        # Create player
+        # Deaths carry over from earlier runs of this session (and its saves), so Untouchable can be lost
+        deaths = self.achievements.counters["deaths"] if self.achievements is not None else 0
+        self.player = Player("Normal", rng=self.rng.stream("player"))
+        self.ecs_world.place_player(self.player.x + 0.5, self.player.y + 0.5)
+        self.track_achievements({"deaths": deaths})
 
         # Center camera on player spawn
         self.map.update_camera(self.player.x, self.player.y)
+        self.player.explored.mark_area(self.player.x, self.player.y, REVEAL_RADIUS)
 
         # Reset game state
         self.enemies = []
         self.event_message = None
+        self.announcements = []
         self.distance_traveled = 0
         self.enemies_defeated = 0
 
@@ -181,10 +233,24 @@ class Game:
         if self.engine.btnp("escape"):
             self.state = "paused"
             return
+        if self.engine.btnp("m"):
+            self.open_world_map()
+            return
 
-        # Update ECS systems
+        # Update ECS systems, then apply the hits enemies landed on the player
         if self.ecs_world:
             self.ecs_world.process(1 / 60)
+            for name, damage in self.ecs_world.take_player_hits():
+                self.player.take_damage(damage)
+                self.event_message = f"{name} attacks! -{damage} HP"
+                self.event_timer = EVENT_MESSAGE_DURATION
+            self._check_player_died()
+            if self.state != "playing":
+                return
+
+        # Collect road regions the planner thread finished, or plan a slice per frame without one
+        if self.map.surface.roads is not None:
+            self.map.surface.roads.step()
 
         # Handle movement
         dx, dy = 0, 0
@@ -206,33 +272,109 @@ class Game:
             if self.event_timer <= 0:
                 self.event_message = None
 
+        # Move on to the next unlock announcement after some time
+        if self.announcements:
+            self.announcement_timer -= 1
+            if self.announcement_timer <= 0:
+                self.announcements.pop(0)
+                self.announcement_timer = EVENT_MESSAGE_DURATION
+
+        # Incremental autosave (disk writes happen off the frame thread)
+        if self.autosaver is not None:
+            self._autosave_timer += 1
+            if self._autosave_timer >= AUTOSAVE_INTERVAL:
+                self._autosave_timer = 0
+                self.autosaver.autosave(self)
+
+    def close(self):
+        """Release the current map and ECS world (background road planning, listeners)."""
+        if self.map is not None:
+            self.map.close()
+        if self.ecs_world is not None:
+            self.ecs_world.close()
+
+    def enable_autosave(self, path):
+        """Autosave this session to a file every AUTOSAVE_INTERVAL frames.
+
+        Args:
+            path: Save file path
+        """
+        from .savegame import Autosaver
+
+        self.autosaver = Autosaver(path)
+        self._autosave_timer = 0
+
     def move_player(self, dx, dy):
-        """Move player through procedural world"""
+        """Move player through procedural world, attacking an enemy in reach on that side instead"""
+        target = self.ecs_world.enemy_in_reach(dx, dy)
+        if target is not None:
+            self._attack_enemy(target)
+            return
+
         new_x = self.player.x + dx
         new_y = self.player.y + dy
 
         if self.map.is_walkable(new_x, new_y):
             self.player.move(dx, dy, wrap=False)
+            self.ecs_world.place_player(self.player.x + 0.5, self.player.y + 0.5)
             self.distance_traveled += 1
 
+            # Stepping onto a cave entrance switches between surface and cave
+            if self.map.in_cave:
+                if (self.player.x, self.player.y) == self.map.world.entrance:
+                    self.map.exit_cave()
+                    self.ecs_world.set_terrain(self.map.world)
+                    self.event_message = "You climb back to the surface"
+                    self.event_timer = EVENT_MESSAGE_DURATION
+            elif self.map.surface.is_cave_entrance(self.player.x, self.player.y):
+                self.map.enter_cave(self.player.x, self.player.y)
+                self.ecs_world.set_terrain(self.map.world)
+                self.event_message = "You descend into a cave"
+                self.event_timer = EVENT_MESSAGE_DURATION
+
             # Update camera to follow player
             self.map.update_camera(self.player.x, self.player.y)
 
+            # Reveal fog of war around the player; the Explorer goal counts surface tiles
+            revealed = self.current_explored().mark_area(self.player.x, self.player.y, REVEAL_RADIUS)
+            if revealed and not self.map.in_cave:
+                self.bus.publish(TILE_EXPLORED, total=len(self.player.explored))
+
             # Update current biome
             self.current_biome = self.map.get_current_biome()
 
             # Trigger procedural random events based on biome
             event_chance = 0.15
-            if random.random() < event_chance:
+            if self.rng.stream("events").random() < event_chance:
                 self._trigger_random_event()
 
-            # Trigger enemy encounters based on biome spawn rate
-            spawn_chance = self.map.get_spawn_chance(self.player.x, self.player.y)
-            if random.random() < spawn_chance * 0.3:  # Scale down base rate
-                self._trigger_enemy_encounter()
+            self._check_player_died()
+
+    def _check_player_died(self):
+        """End the game once the player's health has run out"""
+        if self.player.health <= 0:
+            self.state = "gameover"
+            self.bus.publish(PLAYER_DIED)
 
-            if self.player.health <= 0:
-                self.state = "gameover"
+    def current_explored(self):
+        """Get the exploration map of the layer the player is on (surface or cave)."""
+        return self.player.explored_layer(self.map.world.entrance if self.map.in_cave else None)
+
+    def track_achievements(self, counters=None):
+        """Track the player's achievements from this game's events.
+
+        Args:
+            counters: Saved progress counters, e.g. from a savegame
+        """
+        if self.achievements is not None:
+            self.achievements.detach()
+        self.achievements = AchievementTracker(self.bus, unlocked=self.player.achievements, counters=counters)
+        self.player.bus = self.bus
+
+    def _on_achievement_unlocked(self, name):
+        if not self.announcements:
+            self.announcement_timer = EVENT_MESSAGE_DURATION
+        self.announcements.append(f"Achievement unlocked: {name}!")
 
     def _trigger_random_event(self):
         """Trigger a random event based on current biome"""
@@ -241,36 +383,29 @@ class Game:
             return
 
         # Biome-specific events
-        event = random.choice(EVENT_TYPES)
-        self.event_message = f"[{biome_config.name}] {event['desc']}"
+        event = default_event_engine().trigger(self.player, self.current_biome, self.rng.stream("events"))
+        self.event_message = f"[{biome_config.name}] {event.desc}"
         self.event_timer = EVENT_MESSAGE_DURATION
-        if event["effect"]:
-            event["effect"](self.player)
-
-    def _trigger_enemy_encounter(self):
-        """Trigger an enemy encounter based on biome"""
-        biome_config = BIOME_CONFIGS.get(self.current_biome)
-
-        # Scale enemy strength by distance traveled
-        base_strength = 1 + self.distance_traveled // 50
-        strength = random.randint(base_strength, base_strength + 2)
-
-        enemy = Enemy(strength=min(strength, 10))  # Cap at 10
-        dmg = random.randint(1, enemy.strength)
-        self.player.take_damage(dmg)
 
-        biome_name = biome_config.name if biome_config else "Unknown"
-        self.event_message = f"[{biome_name}] {enemy.name} attacks! -{dmg} HP"
+    def _attack_enemy(self, ent):
+        """Strike an ECS enemy; the sword adds to the player's attack damage"""
+        name, damage, killed = self.ecs_world.strike_enemy(ent, bonus=self.player.sword_level)
         self.event_timer = EVENT_MESSAGE_DURATION
-        self.enemies_defeated += 1
+        if killed:
+            self.event_message = f"{name} defeated!"
+            self.enemies_defeated += 1
+            self.bus.publish(ENEMY_DEFEATED)
+        else:
+            self.event_message = f"You hit the {name} for {damage}"
 
     def draw_playing(self):
         """Draw playing state with procedural world"""
         if not self.engine:
             return
 
-        # Draw procedural map
-        self.map.draw(self.engine)
+        # Draw procedural map with fog of war and the player's field of view
+        visible = self.ecs_world.visible_area(self.player.x, self.player.y) if self.ecs_world else None
+        self.map.draw(self.engine, explored=self.current_explored(), visible=visible)
 
         # Draw player at screen center (camera follows player)
         center_x = (MAP_SIZE // 2) * (self.WINDOW_WIDTH // MAP_SIZE)
@@ -278,6 +413,13 @@ class Game:
         tile_size = self.WINDOW_WIDTH // MAP_SIZE
         self.engine.rect(center_x, center_y, tile_size, tile_size, self.colors["player"])
 
+        # Draw enemies on tiles in sight
+        if self.ecs_world:
+            for x, y, renderable in self.ecs_world.enemies_in_view(self.map.camera_x, self.map.camera_y, MAP_SIZE, MAP_SIZE):
+                if visible is None or visible.is_visible(x, y):
+                    local_x, local_y = x - self.map.camera_x, y - self.map.camera_y
+                    draw_enemy_sprite(self.engine, local_x * tile_size, local_y * tile_size + 20, tile_size, renderable.color)
+
         # Draw HUD
         self.draw_enhanced_hud()
 
@@ -285,6 +427,11 @@ class Game:
         if self.event_message:
             self.draw_event_message()
 
+        # Draw the current unlock announcement below the HUD
+        if self.announcements:
+            self.engine.rect(0, 20, self.WINDOW_WIDTH, 12, self.colors["success"])
+            self.engine.text(5, 22, self.announcements[0], self.colors["text"])
+
     def draw_enhanced_hud(self):
         """Draw enhanced heads-up display with biome and world info"""
         if not self.engine:
@@ -348,6 +495,32 @@ class Game:
         for i, line in enumerate(msg_lines):
             self.engine.text(25, msg_y + 10 + i * 10, line, self.colors["text"])
 
+    def open_world_map(self):
+        """Show the world overview map centered on the player."""
+        from .overview import WorldMapScreen
+
+        if self.world_map is None or self.world_map.pyramid.world is not self.map.surface:
+            self.world_map = WorldMapScreen(self.map.surface)
+        self.world_map.open(self.player.x, self.player.y)
+        self.state = "worldmap"
+
+    def update_worldmap(self):
+        """Handle the world map state"""
+        if not self.engine:
+            return
+
+        if self.engine.btnp("m") or self.engine.btnp("escape"):
+            self.state = "playing"
+            return
+        self.world_map.update(self.engine)
+
+    def draw_worldmap(self):
+        """Draw the world overview map"""
+        if not self.engine:
+            return
+
+        self.world_map.draw(self.engine, player_pos=(self.player.x, self.player.y))
+
     def update_paused(self):
         """Handle paused state"""
         if not self.engine:
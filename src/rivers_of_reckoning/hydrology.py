@@ -0,0 +1,283 @@
+"""River generation from the terrain field (hydrology pass).
+
+The infinite world is split into square regions. For each region the
+terrain is sampled on a coarse grid (one cell per CELL_SIZE tiles) that
+extends HALO_CELLS beyond the region on every side. A priority-flood
+fills depressions and gives every cell a downhill receiver; flow
+accumulation then counts the cells draining through each cell, and cells
+above RIVER_THRESHOLD are river sources. Only the region's own cells are
+kept: the region owns their routing, and the halo only lets flow from
+neighbouring regions count toward it.
+
+A region's rivers are carved from the routing of the 3 x 3 block of
+regions around it, each cell routed by the region that owns it. Rivers
+continue downstream of every source in the block, also into cells whose
+own accumulation is below the threshold, and each segment runs from a
+river cell to its owner's receiver. A segment crossing a region seam is
+thus carved identically by the regions on both sides, and the river
+carries on beyond it. (Only a river that reaches a seam purely by
+inflow from two regions away is missed on the far side.)
+
+Regions are computed lazily and cached, and each tile's river state
+depends only on the seed, so results are the same whatever order chunks
+are generated in.
+"""
+
+import heapq
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Tuple
+
+import numpy as np
+
+REGION_SHIFT = 7
+REGION_SIZE = 1 << REGION_SHIFT
+
+CELL_SIZE = 4
+HALO_CELLS = 16
+REGION_CELLS = REGION_SIZE // CELL_SIZE
+GRID_CELLS = REGION_CELLS + 2 * HALO_CELLS
+
+# Terrain height below which the world already has lakes; rivers end there
+WATER_LEVEL = -0.3
+
+# Upstream cells (including itself) needed for a cell to carry a river
+RIVER_THRESHOLD = 40
+
+# Minimum rise per step when filling depressions, so every cell drains
+FILL_EPSILON = 1e-6
+
+_NEIGHBORS8 = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+@dataclass
+class RegionHydrology:
+    """Flow routing of one region's own cells. Coarse arrays are indexed [cy, cx]."""
+
+    rx: int
+    ry: int
+    filled: np.ndarray  # depression-filled coarse height
+    receiver_dx: np.ndarray  # int8 step to the downhill neighbour cell; (0, 0) for outlets
+    receiver_dy: np.ndarray
+    accumulation: np.ndarray  # cells draining through each cell, within the region plus halo
+    sources: np.ndarray  # bool, cells whose own accumulation makes them rivers
+
+
+def _neighbor_table(size: int):
+    table = []
+    for cy in range(size):
+        for cx in range(size):
+            table.append([(cy + dy) * size + cx + dx for dx, dy in _NEIGHBORS8 if 0 <= cx + dx < size and 0 <= cy + dy < size])
+    return table
+
+
+_GRID_NEIGHBORS = _neighbor_table(GRID_CELLS)
+
+
+def priority_flood(height: np.ndarray, outlets: np.ndarray) -> Tuple[np.ndarray, np.ndarray, list]:
+    """Fill depressions and route flow with a priority-flood.
+
+    Args:
+        height: Square coarse heightmap
+        outlets: Bool mask of cells that drain out of the map
+
+    Returns:
+        Tuple of (filled heights, receiver index per cell, cells in processing order)
+    """
+    size = height.shape[0]
+    neighbors = _GRID_NEIGHBORS if size == GRID_CELLS else _neighbor_table(size)
+    flat = height.ravel().tolist()
+    filled = list(flat)
+    receiver = [-1] * len(flat)
+    visited = outlets.ravel().tolist()
+    heap = [(flat[i], i) for i in np.flatnonzero(outlets).tolist()]
+    heapq.heapify(heap)
+
+    order = []
+    while heap:
+        level, cell = heapq.heappop(heap)
+        order.append(cell)
+        for neighbor in neighbors[cell]:
+            if not visited[neighbor]:
+                visited[neighbor] = True
+                filled[neighbor] = max(flat[neighbor], level + FILL_EPSILON)
+                receiver[neighbor] = cell
+                heapq.heappush(heap, (filled[neighbor], neighbor))
+
+    return np.array(filled).reshape(height.shape), np.array(receiver), order
+
+
+def flow_accumulation(receiver: np.ndarray, order: list) -> np.ndarray:
+    """Count the cells draining through each cell.
+
+    Args:
+        receiver: Receiver index per cell (-1 for outlets)
+        order: Cells ordered from outlets upstream, as returned by priority_flood
+
+    Returns:
+        Flat array of accumulated cell counts
+    """
+    receivers = receiver.tolist()
+    accumulation = [1] * len(receivers)
+    for cell in reversed(order):
+        target = receivers[cell]
+        if target >= 0:
+            accumulation[target] += accumulation[cell]
+    return np.array(accumulation)
+
+
+class Hydrology:
+    """Lazily computed, region-cached rivers for a terrain field."""
+
+    def __init__(self, terrain: Callable[[np.ndarray, np.ndarray], np.ndarray], max_regions: int = 64):
+        """Initialize the hydrology pass.
+
+        Args:
+            terrain: Function returning terrain height for arrays of tile coordinates
+            max_regions: Maximum number of regions (and of river masks) kept in the cache
+        """
+        self.terrain = terrain
+        self.max_regions = max_regions
+        self._regions: "OrderedDict[Tuple[int, int], RegionHydrology]" = OrderedDict()
+        self._rivers: "OrderedDict[Tuple[int, int], np.ndarray]" = OrderedDict()
+
+    def region(self, rx: int, ry: int) -> RegionHydrology:
+        """Get a region's flow routing, computing and caching it if needed."""
+        key = (rx, ry)
+        region = self._regions.get(key)
+        if region is not None:
+            self._regions.move_to_end(key)
+            return region
+
+        region = self._compute_region(rx, ry)
+        self._regions[key] = region
+        while len(self._regions) > self.max_regions:
+            self._regions.popitem(last=False)
+        return region
+
+    def _compute_region(self, rx: int, ry: int) -> RegionHydrology:
+        # Coarse grid over the region plus halo, sampled at cell centers
+        origin_x = (rx << REGION_SHIFT) - HALO_CELLS * CELL_SIZE
+        origin_y = (ry << REGION_SHIFT) - HALO_CELLS * CELL_SIZE
+        cys, cxs = np.mgrid[0:GRID_CELLS, 0:GRID_CELLS]
+        height = self.terrain(origin_x + cxs * CELL_SIZE + CELL_SIZE // 2, origin_y + cys * CELL_SIZE + CELL_SIZE // 2)
+
+        outlets = height < WATER_LEVEL
+        outlets[0, :] = outlets[-1, :] = outlets[:, 0] = outlets[:, -1] = True
+        filled, receiver, order = priority_flood(height, outlets)
+        accumulation = flow_accumulation(receiver, order)
+
+        flat = np.arange(GRID_CELLS * GRID_CELLS)
+        drains = receiver >= 0
+        receiver_dx = np.where(drains, receiver % GRID_CELLS - flat % GRID_CELLS, 0).reshape(height.shape)
+        receiver_dy = np.where(drains, receiver // GRID_CELLS - flat // GRID_CELLS, 0).reshape(height.shape)
+        sources = ((accumulation >= RIVER_THRESHOLD) & drains).reshape(height.shape) & ~outlets
+
+        own = slice(HALO_CELLS, HALO_CELLS + REGION_CELLS)
+        return RegionHydrology(
+            rx=rx,
+            ry=ry,
+            filled=filled[own, own],
+            receiver_dx=receiver_dx[own, own].astype(np.int8),
+            receiver_dy=receiver_dy[own, own].astype(np.int8),
+            accumulation=accumulation.reshape(height.shape)[own, own],
+            sources=sources[own, own],
+        )
+
+    def rivers(self, rx: int, ry: int) -> np.ndarray:
+        """Get a region's river tile mask [REGION_SIZE, REGION_SIZE], carving and caching it if needed."""
+        key = (rx, ry)
+        rivers = self._rivers.get(key)
+        if rivers is not None:
+            self._rivers.move_to_end(key)
+            return rivers
+
+        rivers = self._carve_region(rx, ry)
+        self._rivers[key] = rivers
+        while len(self._rivers) > self.max_regions:
+            self._rivers.popitem(last=False)
+        return rivers
+
+    def _carve_region(self, rx: int, ry: int) -> np.ndarray:
+        # Routing of the 3 x 3 block of regions around this one, each cell from its owner
+        size = 3 * REGION_CELLS
+        step_x = np.zeros((size, size), dtype=np.int64)
+        step_y = np.zeros((size, size), dtype=np.int64)
+        river = np.zeros((size, size), dtype=bool)
+        for by in range(3):
+            for bx in range(3):
+                region = self.region(rx + bx - 1, ry + by - 1)
+                block = (slice(by * REGION_CELLS, (by + 1) * REGION_CELLS), slice(bx * REGION_CELLS, (bx + 1) * REGION_CELLS))
+                step_x[block] = region.receiver_dx
+                step_y[block] = region.receiver_dy
+                river[block] = region.sources
+
+        # Rivers carry on downstream of every source, across seams and below the threshold
+        step_x, step_y = step_x.ravel().tolist(), step_y.ravel().tolist()
+        flags = river.ravel().tolist()
+        pending = [cell for cell, flag in enumerate(flags) if flag]
+        while pending:
+            cell = pending.pop()
+            dx, dy = step_x[cell], step_y[cell]
+            cx, cy = cell % size + dx, cell // size + dy
+            if (dx or dy) and 0 <= cx < size and 0 <= cy < size and not flags[cy * size + cx]:
+                flags[cy * size + cx] = True
+                pending.append(cy * size + cx)
+
+        # Segments from river cells within one cell of the region (a segment spans one cell at most)
+        rivers = np.zeros((REGION_SIZE, REGION_SIZE), dtype=bool)
+        near = range(REGION_CELLS - 1, 2 * REGION_CELLS + 1)
+        for cy in near:
+            for cx in near:
+                cell = cy * size + cx
+                if flags[cell] and (step_x[cell] or step_y[cell]):
+                    x0 = (cx - REGION_CELLS) * CELL_SIZE + CELL_SIZE // 2
+                    y0 = (cy - REGION_CELLS) * CELL_SIZE + CELL_SIZE // 2
+                    _carve_segment(rivers, x0, y0, x0 + step_x[cell] * CELL_SIZE, y0 + step_y[cell] * CELL_SIZE)
+        return rivers
+
+    def river_mask(self, x0: int, y0: int, width: int, height: int) -> np.ndarray:
+        """Get river flags for a rectangle of tiles (e.g. a chunk).
+
+        Args:
+            x0: Left tile X coordinate
+            y0: Top tile Y coordinate
+            width: Width in tiles
+            height: Height in tiles
+
+        Returns:
+            Bool array of shape (height, width), indexed [y, x]
+        """
+        mask = np.zeros((height, width), dtype=bool)
+        for ry in range(y0 >> REGION_SHIFT, ((y0 + height - 1) >> REGION_SHIFT) + 1):
+            for rx in range(x0 >> REGION_SHIFT, ((x0 + width - 1) >> REGION_SHIFT) + 1):
+                rivers = self.rivers(rx, ry)
+                wx0 = max(x0, rx << REGION_SHIFT)
+                wy0 = max(y0, ry << REGION_SHIFT)
+                wx1 = min(x0 + width, (rx + 1) << REGION_SHIFT)
+                wy1 = min(y0 + height, (ry + 1) << REGION_SHIFT)
+                mask[wy0 - y0 : wy1 - y0, wx0 - x0 : wx1 - x0] = rivers[
+                    wy0 - (ry << REGION_SHIFT) : wy1 - (ry << REGION_SHIFT),
+                    wx0 - (rx << REGION_SHIFT) : wx1 - (rx << REGION_SHIFT),
+                ]
+        return mask
+
+    def is_river(self, x: int, y: int) -> bool:
+        """Check whether a tile carries a river."""
+        rivers = self.rivers(x >> REGION_SHIFT, y >> REGION_SHIFT)
+        return bool(rivers[y & (REGION_SIZE - 1), x & (REGION_SIZE - 1)])
+
+
+def _carve_segment(rivers: np.ndarray, x0: int, y0: int, x1: int, y1: int):
+    """Rasterize a 4-connected line into the mask, clipped to its bounds."""
+    size = rivers.shape[0]
+    x, y = x0, y0
+    steps = max(abs(x1 - x0), abs(y1 - y0))
+    for i in range(1, steps + 1):
+        nx = x0 + round(i * (x1 - x0) / steps)
+        ny = y0 + round(i * (y1 - y0) / steps)
+        # Step along x before y so diagonal moves never leave a corner gap
+        for px, py in ((x, y), (nx, y), (nx, ny)):
+            if 0 <= px < size and 0 <= py < size:
+                rivers[py, px] = True
+        x, y = nx, ny
@@ -0,0 +1,129 @@
+"""Line-of-sight queries over the world's opacity bitmaps.
+
+Rays are traced with integer Bresenham-style stepping along the major
+axis: a ray of n steps visits, at step i, the tile rounded from
+``origin + i * delta / n``. Only tiles strictly between the endpoints
+are tested, so an enemy standing in a tree can still see out of it.
+
+``visible_many`` traces one ray per target in a single vectorized pass
+(one gathered opacity lookup for all of them). Answers are cached across
+ticks; when the world evicts or regenerates a chunk (e.g. on a season
+change), the answers for rays that may cross it are dropped.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Set, Tuple
+
+import numpy as np
+
+from .world_gen import CHUNK_SHIFT
+
+
+class LineOfSight:
+    """Batched line-of-sight queries with a chunk-invalidated cache."""
+
+    def __init__(self, world, cache_size: int = 4096):
+        """Initialize line-of-sight queries.
+
+        Args:
+            world: ProceduralWorld providing is_opaque_many; its chunk evictions invalidate cached answers
+            cache_size: Number of (origin, target) answers kept
+        """
+        self.world = world
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[int, int, int, int], bool]" = OrderedDict()
+        self._by_chunk: Dict[Tuple[int, int], Set[Tuple[int, int, int, int]]] = {}
+        world.add_eviction_listener(self.invalidate_chunk)
+
+    def close(self):
+        """Stop listening to the world's evictions, e.g. when this service is replaced."""
+        self.world.remove_eviction_listener(self.invalidate_chunk)
+
+    @staticmethod
+    def _chunks(key: Tuple[int, int, int, int]):
+        """Chunks overlapping the bounding box of a ray, which contains every tile it tests."""
+        x0, y0, x1, y1 = key
+        for cy in range(min(y0, y1) >> CHUNK_SHIFT, (max(y0, y1) >> CHUNK_SHIFT) + 1):
+            for cx in range(min(x0, x1) >> CHUNK_SHIFT, (max(x0, x1) >> CHUNK_SHIFT) + 1):
+                yield cx, cy
+
+    def _forget(self, key: Tuple[int, int, int, int]):
+        for chunk in self._chunks(key):
+            keys = self._by_chunk.get(chunk)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_chunk[chunk]
+
+    def invalidate_chunk(self, chunk_x: int, chunk_y: int):
+        """Drop cached answers for rays that may cross a chunk."""
+        for key in self._by_chunk.pop((chunk_x, chunk_y), ()):
+            if self._cache.pop(key, None) is not None:
+                self._forget(key)
+
+    def visible(self, x0: int, y0: int, x1: int, y1: int) -> bool:
+        """Check whether tile (x1, y1) can be seen from tile (x0, y0).
+
+        Args:
+            x0: Origin X tile
+            y0: Origin Y tile
+            x1: Target X tile
+            y1: Target Y tile
+
+        Returns:
+            True if no opaque tile lies between them
+        """
+        return bool(self.visible_many(x0, y0, [x1], [y1])[0])
+
+    def visible_many(self, x0: int, y0: int, xs, ys) -> np.ndarray:
+        """Check line of sight from one origin to many target tiles.
+
+        Args:
+            x0: Origin X tile
+            y0: Origin Y tile
+            xs: Target X tiles (array-like)
+            ys: Target Y tiles (array-like)
+
+        Returns:
+            Boolean array, True where the target is visible from the origin
+        """
+        xs = np.asarray(xs, dtype=np.int64)
+        ys = np.asarray(ys, dtype=np.int64)
+        result = np.ones(xs.shape, dtype=bool)
+        keys = [(x0, y0, x, y) for x, y in zip(xs.tolist(), ys.tolist())]
+        todo = []
+        for i, key in enumerate(keys):
+            cached = self._cache.get(key)
+            if cached is None:
+                todo.append(i)
+            else:
+                self._cache.move_to_end(key)
+                result[i] = cached
+        if not todo:
+            return result
+
+        todo = np.array(todo)
+        dx = xs[todo] - x0
+        dy = ys[todo] - y0
+        steps = np.maximum(np.abs(dx), np.abs(dy))
+        longest = int(steps.max())
+        if longest > 1:
+            # Interior steps 1..n-1 of every ray; rays shorter than the longest are masked
+            i = np.arange(1, longest)
+            n = np.maximum(steps, 1)[:, None]
+            inside = i < steps[:, None]
+            px = x0 + (2 * i * dx[:, None] + n) // (2 * n)
+            py = y0 + (2 * i * dy[:, None] + n) // (2 * n)
+            blocked = np.zeros(inside.shape, dtype=bool)
+            blocked[inside] = self.world.is_opaque_many(px[inside], py[inside])
+            result[todo] = ~blocked.any(axis=1)
+
+        for i in todo.tolist():
+            key = keys[i]
+            self._cache[key] = bool(result[i])
+            for chunk in self._chunks(key):
+                self._by_chunk.setdefault(chunk, set()).add(key)
+        while len(self._cache) > self.cache_size:
+            oldest, _ = self._cache.popitem(last=False)
+            self._forget(oldest)
+        return result
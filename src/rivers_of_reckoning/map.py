@@ -5,8 +5,19 @@ using the pygame-ce Engine abstraction with procedural world generation.
 """
 
 import random
-from .map_data import MAP_SIZE, TILE_COLORS
-from .world_gen import ProceduralWorld, TileType, BiomeType, BIOME_CONFIGS
+
+import numpy as np
+
+from .map_data import DIM_COLORS, MAP_SIZE, POI_COLORS, SHADE_COLORS, TILE_COLORS
+from .world_gen import CHUNK_MASK, CHUNK_SHIFT, SHADE_DARK, SHADE_LIT, ProceduralWorld, TileType, BiomeType, BIOME_CONFIGS
+
+# Palette lookup tables for baking chunk rasters: base color per tile code (a
+# TileType's value is its map character), then shaded color per [shade level, base color]
+TILE_COLOR_LUT = np.array([TILE_COLORS.get(tile.value, 0) for tile in TileType], dtype=np.uint8)
+SHADE_LUT = np.tile(np.arange(16, dtype=np.uint8), (3, 1))
+for _color, (_dark, _lit) in SHADE_COLORS.items():
+    SHADE_LUT[SHADE_DARK, _color] = _dark
+    SHADE_LUT[SHADE_LIT, _color] = _lit
 
 
 class Map:
@@ -18,7 +29,8 @@ class Map:
 
     Attributes:
         size: The visible map viewport size
-        world: ProceduralWorld instance for terrain generation
+        world: Terrain layer currently shown (the surface or a cave)
+        surface: ProceduralWorld instance for terrain generation
         camera_x: Camera X position in world coordinates
         camera_y: Camera Y position in world coordinates
         tile_size: Calculated tile size for rendering
@@ -35,16 +47,23 @@ class Map:
         TileType.ROCK: "R",
         TileType.CAVE_FLOOR: "_",
         TileType.CAVE_WALL: "X",
+        TileType.ROAD: "=",
     }
 
-    def __init__(self, seed: int = 42):
+    def __init__(self, seed: int = 42, rng=None, roads: bool = False, road_cache_dir=None, seasonal: bool = False):
         """Initialize the procedurally generated map.
 
         Args:
             seed: Random seed for world generation
+            rng: Random stream for movement effects (defaults to the random module)
+            roads: Whether the world has roads between points of interest
+            road_cache_dir: Directory where planned road regions are cached on disk
+            seasonal: Whether the world's climate shifts with in-game seasons
         """
+        self.rng = rng if rng is not None else random
         self.size = MAP_SIZE
-        self.world = ProceduralWorld(seed=seed)
+        self.surface = ProceduralWorld(seed=seed, roads=roads, road_cache_dir=road_cache_dir, seasonal=seasonal)
+        self.world = self.surface
         self.camera_x = 0
         self.camera_y = 0
         self.tile_size = 256 // MAP_SIZE
@@ -89,6 +108,10 @@ class Map:
         # Update current biome
         _, self._current_biome = self.world.get_tile(player_x, player_y)
 
+        # Plan the road regions around the player before they are walked into
+        if self.surface.roads is not None:
+            self.surface.roads.prefetch_around(player_x, player_y)
+
     def get_current_biome(self) -> BiomeType:
         """Get the biome at the player's current position.
 
@@ -105,6 +128,32 @@ class Map:
         """
         return BIOME_CONFIGS.get(self._current_biome)
 
+    @property
+    def in_cave(self) -> bool:
+        """Whether the map currently shows a cave interior."""
+        return self.world is not self.surface
+
+    def enter_cave(self, x: int, y: int):
+        """Switch to the cave below a surface entrance.
+
+        Args:
+            x: Entrance X coordinate
+            y: Entrance Y coordinate
+
+        Returns:
+            The CaveLayer now shown
+        """
+        self.world = self.surface.get_cave(x, y)
+        return self.world
+
+    def exit_cave(self):
+        """Switch back to the surface."""
+        self.world = self.surface
+
+    def close(self):
+        """Release the world's background work, e.g. when the game ends."""
+        self.surface.close()
+
     def is_walkable(self, x, y):
         """Check if a world position is walkable.
 
@@ -117,28 +166,67 @@ class Map:
         """
         return self.world.is_walkable(x, y)
 
-    def draw(self, engine):
+    def chunk_raster(self, chunk_x: int, chunk_y: int) -> np.ndarray:
+        """Get a chunk's hillshaded palette colors, baking them on first use.
+
+        The raster is stored on the chunk, so it is baked once and
+        discarded together with the chunk when the cache evicts it.
+
+        Args:
+            chunk_x: Chunk X coordinate
+            chunk_y: Chunk Y coordinate
+
+        Returns:
+            uint8 palette colors, indexed [local_y, local_x]
+        """
+        chunk = self.world.get_chunk(chunk_x, chunk_y)
+        if chunk.raster is None:
+            chunk.raster = SHADE_LUT[chunk.shade, TILE_COLOR_LUT[chunk.tiles]]
+        return chunk.raster
+
+    def draw(self, engine, explored=None, visible=None):
         """Draw the visible map using Engine.
 
         Args:
             engine: The Engine instance for rendering
+            explored: Optional ExplorationMap; unexplored tiles are drawn as fog
+            visible: Optional VisibilityMask; tiles out of sight are drawn dimmed
+                (or as fog if unexplored), tiles in sight are always drawn
         """
         if engine is None:
             return
 
+        fog = None
+        if explored is not None:
+            fog = ~explored.viewport_mask(self.camera_x, self.camera_y, self.size, self.size)
+        in_sight = None
+        if visible is not None:
+            in_sight = visible.viewport_mask(self.camera_x, self.camera_y, self.size, self.size)
+            if fog is not None:
+                fog &= ~in_sight
+
         for local_y in range(self.size):
             for local_x in range(self.size):
                 world_x = self.camera_x + local_x
                 world_y = self.camera_y + local_y
 
-                tile_type, biome = self.world.get_tile(world_x, world_y)
-                char = self.TILE_CHAR_MAP.get(tile_type, ".")
-                color = TILE_COLORS.get(char, 0)
-
                 # Calculate pixel position
                 px = local_x * self.tile_size
                 py = local_y * self.tile_size + 20  # Offset for HUD
 
+                if fog is not None and fog[local_y, local_x]:
+                    engine.rect(px, py, self.tile_size, self.tile_size, 0)
+                    continue
+
+                tile_type, biome = self.world.get_tile(world_x, world_y)
+                raster = self.chunk_raster(world_x >> CHUNK_SHIFT, world_y >> CHUNK_SHIFT)
+                color = int(raster[world_y & CHUNK_MASK, world_x & CHUNK_MASK])
+
+                if in_sight is not None and not in_sight[local_y, local_x]:
+                    # Remembered tile: dimmed, without detail
+                    engine.rect(px, py, self.tile_size, self.tile_size, DIM_COLORS.get(color, 1))
+                    continue
+
                 # Draw base tile
                 engine.rect(px, py, self.tile_size, self.tile_size, color)
 
@@ -156,6 +244,19 @@ class Map:
                     # Draw stone texture
                     engine.rect(px + 4, py + 4, 2, 2, 5)
 
+        # Mark points of interest on tiles in sight
+        for poi in self.world.pois_in_view(self.camera_x, self.camera_y, self.size, self.size):
+            local_x = poi.x - self.camera_x
+            local_y = poi.y - self.camera_y
+            color = POI_COLORS.get(poi.kind.name)
+            if color is None or (in_sight is not None and not in_sight[local_y, local_x]):
+                continue
+            if fog is not None and fog[local_y, local_x]:
+                continue
+            px = local_x * self.tile_size
+            py = local_y * self.tile_size + 20
+            engine.rect(px + 3, py + 3, self.tile_size - 6, self.tile_size - 6, color)
+
     def move_player(self, player, dx, dy):
         """Move player with world constraints.
 
@@ -166,8 +267,8 @@ class Map:
             dx: X direction (-1, 0, or 1)
             dy: Y direction (-1, 0, or 1)
         """
-        if player.confused > 0 and random.random() < 0.5:
-            dx, dy = random.choice([(0, 1), (0, -1), (1, 0), (-1, 0)])
+        if player.confused > 0 and self.rng.random() < 0.5:
+            dx, dy = self.rng.choice([(0, 1), (0, -1), (1, 0), (-1, 0)])
 
         new_x = player.x + dx
         new_y = player.y + dy
@@ -192,3 +293,15 @@ class Map:
             Spawn probability [0, 1]
         """
         return self.world.get_spawn_chance(x, y)
+
+    def get_stamina_modifier(self, x: int, y: int) -> float:
+        """Get the stamina drain multiplier for moving onto a world position.
+
+        Args:
+            x: World X coordinate
+            y: World Y coordinate
+
+        Returns:
+            Multiplier from the biome, reduced on roads
+        """
+        return self.world.get_stamina_modifier(x, y)
@@ -1,7 +1,8 @@
 """Map data, constants, and game configuration for Rivers of Reckoning.
 
 This module contains all static game data including map size, enemy types,
-event definitions, achievements, difficulty settings, and shop items.
+achievements, difficulty settings, and shop items. Random events are
+data-driven, see events.py and data/events.json.
 """
 
 MAP_SIZE = 11
@@ -13,31 +14,28 @@ ENEMY_TYPES = [
     {"name": "Wraith", "hp_mod": 0, "dmg_mod": 0, "effect": "curse"},
 ]
 
-EVENT_TYPES = [
-    {
-        "name": "Treasure",
-        "desc": "You found a hidden stash! +5 gold.",
-        "effect": lambda p: setattr(p, "gold", p.gold + 5),
-    },
-    {
-        "name": "Trap",
-        "desc": "A trap! Lose 3 HP.",
-        "effect": lambda p: p.take_damage(3),
-    },
+# Explored tiles needed for the Explorer achievement
+EXPLORER_TILE_GOAL = 1000
+
+# Each achievement unlocks once its progress counter reaches the goal,
+# unless its "forbid" counter is nonzero (see achievements.py). Deaths
+# count across the runs of a game session and its saves (see Game.start_game)
+ACHIEVEMENTS = [
+    {"name": "First Blood", "desc": "Defeat your first enemy.", "counter": "enemies_defeated", "goal": 1},
+    {"name": "Boss Slayer", "desc": "Defeat both bosses.", "counter": "bosses_defeated", "goal": 2},
+    {"name": "Potion Master", "desc": "Use 5 potions.", "counter": "potions_used", "goal": 5},
+    {"name": "Explorer", "desc": "Explore 1000 tiles of the world.", "counter": "tiles_explored", "goal": EXPLORER_TILE_GOAL},
     {
-        "name": "Wandering Merchant",
-        "desc": "A merchant offers a random item.",
-        "effect": None,
+        "name": "Untouchable",
+        "desc": "Win without dying once.",
+        "counter": "bosses_defeated",
+        "goal": 2,
+        "forbid": "deaths",
     },
 ]
 
-ACHIEVEMENTS = [
-    {"name": "First Blood", "desc": "Defeat your first enemy."},
-    {"name": "Boss Slayer", "desc": "Defeat both bosses."},
-    {"name": "Potion Master", "desc": "Use 5 potions."},
-    {"name": "Explorer", "desc": "Reveal the entire map."},
-    {"name": "Untouchable", "desc": "Win without dying once."},
-]
+# Tiles revealed around the player in each direction as they move
+REVEAL_RADIUS = 4
 
 # Direction constants for movement
 DIRECTIONS = {
@@ -56,6 +54,44 @@ TILE_COLORS = {
     "o": 12,  # water (blue)
     "T": 11,  # tree (light green)
     "R": 6,   # rock (light gray)
+    "_": 13,  # cave floor (indigo)
+    "X": 1,   # cave wall (dark blue)
+    "=": 15,  # road (peach)
+}
+
+# Marker colors for points of interest, by POIType name (cave mouths show as their tile)
+POI_COLORS = {
+    "CHEST": 10,   # yellow
+    "SHRINE": 7,   # white
+    "SHOP": 9,     # orange
+}
+
+# Darker palette colors for tiles remembered but currently out of sight
+DIM_COLORS = {
+    4: 2,    # brown -> dark purple
+    10: 4,   # yellow -> brown
+    5: 1,    # dark gray -> dark blue
+    3: 1,    # green -> dark blue
+    12: 1,   # blue -> dark blue
+    11: 3,   # light green -> green
+    6: 5,    # light gray -> dark gray
+    13: 2,   # indigo -> dark purple
+    1: 0,    # dark blue -> black
+    15: 4,   # peach -> brown
+    9: 4,    # orange -> brown
+    7: 6,    # white -> light gray
+    2: 0,    # dark purple -> black
+}
+
+# Hillshaded variants of tile colors: base color -> (slope facing away from
+# the light, slope facing it); colors not listed are drawn unshaded
+SHADE_COLORS = {
+    4: (2, 9),   # brown: dark purple / orange
+    10: (9, 7),  # yellow: orange / white
+    5: (1, 6),   # dark gray: dark blue / light gray
+    3: (1, 11),  # green: dark blue / light green
+    6: (5, 7),   # light gray: dark gray / white
+    15: (4, 7),  # peach: brown / white
 }
 
 
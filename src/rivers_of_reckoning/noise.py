@@ -0,0 +1,129 @@
+"""Vectorized OpenSimplex noise for whole-chunk generation.
+
+The ``opensimplex`` package evaluates noise one point at a time in pure
+Python (about 25 microseconds per call without numba). These functions
+evaluate the same algorithm over NumPy arrays, using an ``OpenSimplex``
+instance's permutation table, and return bit-identical values, so chunk
+generation can be vectorized without changing any generated world.
+"""
+
+import numpy as np
+from opensimplex import OpenSimplex
+from opensimplex.constants import GRADIENTS2, NORM_CONSTANT2, SQUISH_CONSTANT2, STRETCH_CONSTANT2
+
+
+def _extrapolate2(perm: np.ndarray, xsb: np.ndarray, ysb: np.ndarray, dx: np.ndarray, dy: np.ndarray) -> np.ndarray:
+    index = perm[(perm[xsb & 0xFF] + ysb) & 0xFF] & 0x0E
+    return GRADIENTS2[index] * dx + GRADIENTS2[index + 1] * dy
+
+
+def _contribution(perm, xsb, ysb, dx, dy) -> np.ndarray:
+    attn = 2 - dx * dx - dy * dy
+    positive = attn > 0
+    attn = np.where(positive, attn * attn, 0.0)
+    return np.where(positive, attn * attn * _extrapolate2(perm, xsb, ysb, dx, dy), 0.0)
+
+
+def noise2(noise: OpenSimplex, x, y) -> np.ndarray:
+    """Evaluate 2D OpenSimplex noise element-wise.
+
+    Args:
+        noise: OpenSimplex generator providing the permutation table
+        x: Array of X coordinates
+        y: Array of Y coordinates (broadcast against x)
+
+    Returns:
+        Array of noise values, identical to ``noise.noise2`` per element
+    """
+    perm = noise._perm
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64))
+
+    # Place input coordinates onto grid
+    stretch_offset = (x + y) * STRETCH_CONSTANT2
+    xs = x + stretch_offset
+    ys = y + stretch_offset
+
+    # Rhombus super-cell origin, skewed back to actual coordinates
+    xsb_f = np.floor(xs)
+    ysb_f = np.floor(ys)
+    squish_offset = (xsb_f + ysb_f) * SQUISH_CONSTANT2
+    xb = xsb_f + squish_offset
+    yb = ysb_f + squish_offset
+    xsb = xsb_f.astype(np.int64)
+    ysb = ysb_f.astype(np.int64)
+
+    xins = xs - xsb_f
+    yins = ys - ysb_f
+    in_sum = xins + yins
+
+    dx0 = x - xb
+    dy0 = y - yb
+
+    # Contributions (1,0) and (0,1)
+    value = _contribution(perm, xsb + 1, ysb + 0, dx0 - 1 - SQUISH_CONSTANT2, dy0 - 0 - SQUISH_CONSTANT2)
+    value = value + _contribution(perm, xsb + 0, ysb + 1, dx0 - 0 - SQUISH_CONSTANT2, dy0 - 1 - SQUISH_CONSTANT2)
+
+    lower = in_sum <= 1
+    x_major = xins > yins
+    zins_lower = 1 - in_sum
+    zins_upper = 2 - in_sum
+    origin_closest = np.where(
+        lower,
+        (zins_lower > xins) | (zins_lower > yins),
+        (zins_upper < xins) | (zins_upper < yins),
+    )
+
+    # Extra vertex, one of six cases (see opensimplex internals._noise2)
+    cases = [
+        lower & origin_closest & x_major,
+        lower & origin_closest & ~x_major,
+        lower & ~origin_closest,
+        ~lower & origin_closest & x_major,
+        ~lower & origin_closest & ~x_major,
+    ]
+    two_squish = 2 * SQUISH_CONSTANT2
+    xsv_ext = np.select(cases, [xsb + 1, xsb - 1, xsb + 1, xsb + 2, xsb + 0], xsb)
+    ysv_ext = np.select(cases, [ysb - 1, ysb + 1, ysb + 1, ysb + 0, ysb + 2], ysb)
+    dx_ext = np.select(cases, [dx0 - 1, dx0 + 1, dx0 - 1 - two_squish, dx0 - 2 - two_squish, dx0 + 0 - two_squish], dx0)
+    dy_ext = np.select(cases, [dy0 + 1, dy0 - 1, dy0 - 1 - two_squish, dy0 + 0 - two_squish, dy0 - 2 - two_squish], dy0)
+
+    # Contribution (0,0) or (1,1)
+    xsb = np.where(lower, xsb, xsb + 1)
+    ysb = np.where(lower, ysb, ysb + 1)
+    dx0 = np.where(lower, dx0, dx0 - 1 - two_squish)
+    dy0 = np.where(lower, dy0, dy0 - 1 - two_squish)
+    value = value + _contribution(perm, xsb, ysb, dx0, dy0)
+    value = value + _contribution(perm, xsv_ext, ysv_ext, dx_ext, dy_ext)
+
+    return value / NORM_CONSTANT2
+
+
+def fbm2(noise: OpenSimplex, x, y, octaves: int = 4, persistence: float = 0.5) -> np.ndarray:
+    """Fractal Brownian Motion over arrays, matching ``world_gen.fbm``.
+
+    Args:
+        noise: OpenSimplex generator
+        x: Array of X coordinates (already scaled)
+        y: Array of Y coordinates (already scaled)
+        octaves: Number of noise layers
+        persistence: Amplitude decay per octave
+
+    Returns:
+        Array of noise values in approximately [-1, 1]
+    """
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64))
+    frequencies = [2.0**i for i in range(octaves)]
+
+    # Evaluate every octave in one call to amortize NumPy overhead
+    layers = noise2(noise, np.stack([x * f for f in frequencies]), np.stack([y * f for f in frequencies]))
+
+    # Accumulate in the same order as the scalar version for identical results
+    value = 0.0
+    amplitude = 1.0
+    max_value = 0.0
+    for layer in layers:
+        value = value + amplitude * layer
+        max_value += amplitude
+        amplitude *= persistence
+
+    return value / max_value
@@ -0,0 +1,208 @@
+"""Zoomable world overview map.
+
+The overview is a mip pyramid over the procedural world. Level L has one
+sample every 2**L tiles and is split into square overview tiles of
+OVERVIEW_TILE samples. Every level is computed straight from the noise
+fields at its own resolution (climate, terrain and tile decoration at the
+sample points), never by aggregating full-resolution chunks, so a tile
+at any zoom costs the same. Rivers and caves come from per-chunk passes
+and are not shown.
+
+Overview tiles are cached with LRU eviction, and the map screen renders
+each to a surface once and reuses it while it stays cached. New tiles
+are built within a per-frame time budget, so panning never stalls a frame
+on a burst of generation.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+from .world_gen import COLOR_LUT, ProceduralWorld, determine_biomes, generate_tiles
+
+OVERVIEW_TILE = 32
+MIN_LEVEL = 1
+MAX_LEVEL = 7
+
+# Map viewport in logical pixels (below the HUD bar)
+VIEW_TOP = 20
+VIEW_WIDTH = 256
+VIEW_HEIGHT = 224
+
+# Pixels panned per frame while an arrow key is held
+PAN_SPEED = 4
+
+# Time per frame spent building missing overview tiles
+BUILD_BUDGET = 0.006
+
+
+@dataclass
+class OverviewTile:
+    """One OVERVIEW_TILE x OVERVIEW_TILE block of a pyramid level, indexed [y, x]."""
+
+    level: int
+    tx: int
+    ty: int
+    biomes: np.ndarray  # biome codes
+    colors: np.ndarray  # palette indices
+
+
+class BiomePyramid:
+    """LRU-cached multi-resolution biome and tile summaries of a world."""
+
+    def __init__(self, world: ProceduralWorld, max_tiles: int = 256):
+        """Initialize the pyramid.
+
+        Args:
+            world: World whose noise fields are sampled
+            max_tiles: Maximum number of overview tiles kept across all levels
+        """
+        self.world = world
+        self.max_tiles = max_tiles
+        self._tiles: "OrderedDict[Tuple[int, int, int], OverviewTile]" = OrderedDict()
+
+    def tile_span(self, level: int) -> int:
+        """World tiles covered by one overview tile side at a level."""
+        return OVERVIEW_TILE << level
+
+    def get(self, level: int, tx: int, ty: int) -> OverviewTile:
+        """Get an overview tile, building and caching it if needed."""
+        key = (level, tx, ty)
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            return tile
+
+        tile = self._build(level, tx, ty)
+        self._tiles[key] = tile
+        while len(self._tiles) > self.max_tiles:
+            self._tiles.popitem(last=False)
+        return tile
+
+    def cached(self, level: int, tx: int, ty: int) -> bool:
+        """Check whether an overview tile is already built."""
+        return (level, tx, ty) in self._tiles
+
+    def _build(self, level: int, tx: int, ty: int) -> OverviewTile:
+        # Sample at the center of each 2**level tile block
+        step = 1 << level
+        ys, xs = np.mgrid[0:OVERVIEW_TILE, 0:OVERVIEW_TILE] * step + step // 2
+        xs = xs + tx * self.tile_span(level)
+        ys = ys + ty * self.tile_span(level)
+
+        moisture, temperature = self.world._climate_fields(xs, ys)
+        biomes = determine_biomes(moisture, temperature)
+        tiles = generate_tiles(xs, ys, biomes, self.world._terrain_field(xs, ys), self.world.seed)
+        return OverviewTile(level, tx, ty, biomes.astype(np.uint8), COLOR_LUT[biomes, tiles])
+
+
+class WorldMapScreen:
+    """Pannable, zoomable overview map drawn from a BiomePyramid."""
+
+    def __init__(self, world: ProceduralWorld, max_surfaces: int = 128):
+        """Initialize the map screen.
+
+        Args:
+            world: World to show
+            max_surfaces: Maximum number of rendered overview tiles kept
+        """
+        self.pyramid = BiomePyramid(world)
+        self.max_surfaces = max_surfaces
+        self._surfaces: OrderedDict = OrderedDict()  # (level, tx, ty) -> surface
+        self.level = 3
+        self.center_x = 0
+        self.center_y = 0
+
+    def open(self, x: int, y: int):
+        """Center the map on a world position (e.g. the player)."""
+        self.center_x = x
+        self.center_y = y
+
+    def zoom(self, delta: int):
+        """Change the zoom level; positive zooms out."""
+        self.level = max(MIN_LEVEL, min(MAX_LEVEL, self.level + delta))
+
+    def pan(self, dx: int, dy: int):
+        """Pan by a number of screen pixels."""
+        self.center_x += dx << self.level
+        self.center_y += dy << self.level
+
+    def update(self, engine):
+        """Handle panning and zooming input.
+
+        Args:
+            engine: Engine providing input
+        """
+        if engine.btnp("w"):
+            self.zoom(-1)
+        elif engine.btnp("s"):
+            self.zoom(1)
+
+        dx = engine.btn("right") - engine.btn("left")
+        dy = engine.btn("down") - engine.btn("up")
+        if dx or dy:
+            self.pan(dx * PAN_SPEED, dy * PAN_SPEED)
+
+    def visible_tiles(self):
+        """Get the overview tiles covering the viewport.
+
+        Returns:
+            List of ((level, tx, ty), (screen x, screen y)), nearest the center first
+        """
+        span = self.pyramid.tile_span(self.level)
+        # World position of the viewport's top-left pixel
+        left = self.center_x - (VIEW_WIDTH // 2 << self.level)
+        top = self.center_y - (VIEW_HEIGHT // 2 << self.level)
+        tiles = []
+        for ty in range(top // span, (top + (VIEW_HEIGHT << self.level) - 1) // span + 1):
+            for tx in range(left // span, (left + (VIEW_WIDTH << self.level) - 1) // span + 1):
+                sx = (tx * span - left) >> self.level
+                sy = ((ty * span - top) >> self.level) + VIEW_TOP
+                tiles.append(((self.level, tx, ty), (sx, sy)))
+        middle = (VIEW_WIDTH - OVERVIEW_TILE) // 2, VIEW_TOP + (VIEW_HEIGHT - OVERVIEW_TILE) // 2
+        tiles.sort(key=lambda item: abs(item[1][0] - middle[0]) + abs(item[1][1] - middle[1]))
+        return tiles
+
+    def _surface(self, engine, key):
+        if key in self._surfaces:
+            self._surfaces.move_to_end(key)
+            return self._surfaces[key]
+        surface = engine.make_surface(self.pyramid.get(*key).colors)
+        self._surfaces[key] = surface
+        while len(self._surfaces) > self.max_surfaces:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def draw(self, engine, player_pos=None):
+        """Draw the overview map.
+
+        Tiles not built yet are built nearest-first until the frame's
+        BUILD_BUDGET is spent (at least one per frame); the rest show as
+        blank until a later frame.
+
+        Args:
+            engine: Engine to draw with
+            player_pos: Optional (x, y) of the player to mark
+        """
+        deadline = time.perf_counter() + BUILD_BUDGET
+        built = False
+        for key, (sx, sy) in self.visible_tiles():
+            if key not in self._surfaces and not self.pyramid.cached(*key):
+                if built and time.perf_counter() > deadline:
+                    continue
+                built = True
+            engine.blit(self._surface(engine, key), sx, sy)
+
+        if player_pos is not None:
+            px = ((player_pos[0] - self.center_x) >> self.level) + VIEW_WIDTH // 2
+            py = ((player_pos[1] - self.center_y) >> self.level) + VIEW_HEIGHT // 2 + VIEW_TOP
+            if 0 <= px < VIEW_WIDTH and VIEW_TOP <= py < VIEW_TOP + VIEW_HEIGHT:
+                engine.rect(px - 1, py - 1, 3, 3, 8)
+
+        engine.rect(0, 0, VIEW_WIDTH, VIEW_TOP, 6)
+        engine.text(5, 5, f"World map  1:{1 << self.level}  ({self.center_x}, {self.center_y})", 7)
+        engine.rect(0, VIEW_TOP + VIEW_HEIGHT, VIEW_WIDTH, 12, 1)
+        engine.text(5, VIEW_TOP + VIEW_HEIGHT + 2, "Arrows: pan  W/S: zoom  M: close", 7)
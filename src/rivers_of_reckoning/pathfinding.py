@@ -0,0 +1,250 @@
+"""Hierarchical pathfinding (HPA*) over the procedural world.
+
+The world is abstracted chunk by chunk into a graph of portals: walkable
+tiles on a chunk border that connect to a walkable tile across it. Each
+chunk's portal graph (portal-to-portal distances inside the chunk) is
+built lazily on first use and cached until the world evicts the chunk.
+
+A query runs A* over the portal graph, then refines only the chunks on
+the chosen route into a tile-by-tile path. Movement is 4-connected.
+"""
+
+import heapq
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .world_gen import CHUNK_MASK, CHUNK_SHIFT, CHUNK_SIZE, ProceduralWorld
+
+Tile = Tuple[int, int]
+
+# Border runs at least this long get a portal at each end instead of one in the middle
+LONG_RUN = 6
+
+_CELLS = CHUNK_SIZE * CHUNK_SIZE
+# Neighbor indices of every local tile index (ly * CHUNK_SIZE + lx), 4-connected
+_LOCAL_NEIGHBORS = [
+    [
+        ny * CHUNK_SIZE + nx
+        for nx, ny in ((lx + 1, ly), (lx - 1, ly), (lx, ly + 1), (lx, ly - 1))
+        if 0 <= nx < CHUNK_SIZE and 0 <= ny < CHUNK_SIZE
+    ]
+    for ly in range(CHUNK_SIZE)
+    for lx in range(CHUNK_SIZE)
+]
+
+
+def _local_index(x: int, y: int) -> int:
+    return ((y & CHUNK_MASK) << CHUNK_SHIFT) | (x & CHUNK_MASK)
+
+
+def _bfs(walkable: List[int], start: int, target: int = -1) -> Tuple[List[int], List[int]]:
+    """Breadth-first search inside one chunk.
+
+    The start tile is always expanded, even if it is not walkable, so an
+    entity standing on a blocked tile can still find its way out.
+
+    Returns:
+        Tuple of (distance per local index, -1 if unreachable; parent per local index)
+    """
+    dist = [-1] * _CELLS
+    parent = [-1] * _CELLS
+    dist[start] = 0
+    queue = deque([start])
+    while queue:
+        current = queue.popleft()
+        if current == target:
+            break
+        next_dist = dist[current] + 1
+        for neighbor in _LOCAL_NEIGHBORS[current]:
+            if dist[neighbor] < 0 and walkable[neighbor]:
+                dist[neighbor] = next_dist
+                parent[neighbor] = current
+                queue.append(neighbor)
+    return dist, parent
+
+
+@dataclass
+class ChunkGraph:
+    """Abstract portal graph of one chunk."""
+
+    cx: int
+    cy: int
+    walkable: List[int]  # 1 per walkable local tile
+    portals: Dict[Tile, List[Tile]]  # portal -> tiles across the border it connects to
+    edges: Dict[Tile, List[Tuple[Tile, int]]]  # portal -> (other portal, path length) inside the chunk
+
+    def tile(self, index: int) -> Tile:
+        """World tile of a local index."""
+        return (self.cx << CHUNK_SHIFT) | (index & CHUNK_MASK), (self.cy << CHUNK_SHIFT) | (index >> CHUNK_SHIFT)
+
+    def distances_from(self, tile: Tile) -> Dict[Tile, int]:
+        """Path lengths from a tile in this chunk to every reachable portal."""
+        dist, _ = _bfs(self.walkable, _local_index(*tile))
+        return {portal: dist[_local_index(*portal)] for portal in self.portals if dist[_local_index(*portal)] >= 0}
+
+
+class HierarchicalPathfinder:
+    """HPA* path queries over a ProceduralWorld's walkability."""
+
+    def __init__(self, world: ProceduralWorld, max_expansions: int = 5000):
+        """Initialize the pathfinder.
+
+        Args:
+            world: World providing walkability; its chunk evictions invalidate cached graphs
+            max_expansions: Abstract nodes expanded before a query gives up
+        """
+        self.world = world
+        self.max_expansions = max_expansions
+        self._graphs: Dict[Tuple[int, int], ChunkGraph] = {}
+        world.add_eviction_listener(self.invalidate_chunk)
+
+    def close(self):
+        """Stop listening to the world's evictions, e.g. when this pathfinder is discarded."""
+        self.world.remove_eviction_listener(self.invalidate_chunk)
+
+    def invalidate_chunk(self, chunk_x: int, chunk_y: int):
+        """Drop the cached portal graph of a chunk."""
+        self._graphs.pop((chunk_x, chunk_y), None)
+
+    def _walkable(self, chunk_x: int, chunk_y: int) -> List[int]:
+        chunk = self.world.get_chunk(chunk_x, chunk_y)
+        return np.unpackbits(chunk.walkable, bitorder="little").tolist()
+
+    def graph(self, chunk_x: int, chunk_y: int) -> ChunkGraph:
+        """Get the portal graph of a chunk, building it if needed."""
+        graph = self._graphs.get((chunk_x, chunk_y))
+        if graph is None:
+            graph = self._build_graph(chunk_x, chunk_y)
+            self._graphs[(chunk_x, chunk_y)] = graph
+        return graph
+
+    def _build_graph(self, chunk_x: int, chunk_y: int) -> ChunkGraph:
+        walkable = self._walkable(chunk_x, chunk_y)
+        graph = ChunkGraph(chunk_x, chunk_y, walkable, {}, {})
+        last = CHUNK_SIZE - 1
+
+        # (neighbor chunk offset, local index of border tile i here, local index of the tile across)
+        borders = [
+            ((1, 0), lambda i: i * CHUNK_SIZE + last, lambda i: i * CHUNK_SIZE),
+            ((-1, 0), lambda i: i * CHUNK_SIZE, lambda i: i * CHUNK_SIZE + last),
+            ((0, 1), lambda i: last * CHUNK_SIZE + i, lambda i: i),
+            ((0, -1), lambda i: i, lambda i: last * CHUNK_SIZE + i),
+        ]
+        for (dx, dy), here, across in borders:
+            other = self._walkable(chunk_x + dx, chunk_y + dy)
+            open_tiles = [bool(walkable[here(i)] and other[across(i)]) for i in range(CHUNK_SIZE)]
+
+            # Portals per maximal run of open border tiles; both chunks see the same runs
+            i = 0
+            while i < CHUNK_SIZE:
+                if not open_tiles[i]:
+                    i += 1
+                    continue
+                start = i
+                while i < CHUNK_SIZE and open_tiles[i]:
+                    i += 1
+                end = i - 1
+                picks = (start, end) if end - start + 1 >= LONG_RUN else ((start + end) // 2,)
+                for pick in picks:
+                    portal = graph.tile(here(pick))
+                    graph.portals.setdefault(portal, []).append((portal[0] + dx, portal[1] + dy))
+
+        for portal in graph.portals:
+            graph.edges[portal] = [(other, d) for other, d in graph.distances_from(portal).items() if other != portal]
+        return graph
+
+    def _local_path(self, graph: ChunkGraph, start: Tile, goal: Tile) -> Optional[List[Tile]]:
+        """Tile path between two tiles of the same chunk, staying inside it."""
+        start_index = _local_index(*start)
+        goal_index = _local_index(*goal)
+        dist, parent = _bfs(graph.walkable, start_index, goal_index)
+        if dist[goal_index] < 0:
+            return None
+        path = []
+        index = goal_index
+        while index != start_index:
+            path.append(graph.tile(index))
+            index = parent[index]
+        path.append(start)
+        path.reverse()
+        return path
+
+    def find_path(self, start: Tile, goal: Tile) -> Optional[List[Tile]]:
+        """Find a 4-connected walkable path between two tiles.
+
+        Args:
+            start: Starting tile (need not be walkable itself)
+            goal: Destination tile
+
+        Returns:
+            List of tiles from start to goal inclusive, or None if no path
+            was found within max_expansions
+        """
+        if start == goal:
+            return [start]
+        if not self.world.is_walkable(*goal):
+            return None
+
+        start_chunk = (start[0] >> CHUNK_SHIFT, start[1] >> CHUNK_SHIFT)
+        goal_chunk = (goal[0] >> CHUNK_SHIFT, goal[1] >> CHUNK_SHIFT)
+        start_graph = self.graph(*start_chunk)
+        if start_chunk == goal_chunk:
+            path = self._local_path(start_graph, start, goal)
+            if path is not None:
+                return path
+
+        # Abstract graph: start and goal joined to the portals of their chunks
+        start_edges = [(p, d) for p, d in start_graph.distances_from(start).items() if p != start]
+        goal_dist, _ = _bfs(self.graph(*goal_chunk).walkable, _local_index(*goal))
+
+        def heuristic(tile: Tile) -> int:
+            return abs(tile[0] - goal[0]) + abs(tile[1] - goal[1])
+
+        best = {start: 0}
+        parent: Dict[Tile, Tile] = {}
+        heap = [(heuristic(start), 0, 0, start)]
+        counter = 1
+        expansions = 0
+        while heap:
+            _, _, cost, node = heapq.heappop(heap)
+            if node == goal:
+                break
+            if cost > best[node]:
+                continue
+            expansions += 1
+            if expansions > self.max_expansions:
+                return None
+
+            chunk = (node[0] >> CHUNK_SHIFT, node[1] >> CHUNK_SHIFT)
+            graph = self.graph(*chunk)
+            neighbors = list(start_edges) if node == start else list(graph.edges.get(node, ()))
+            neighbors.extend((across, 1) for across in graph.portals.get(node, ()))
+            if chunk == goal_chunk and goal_dist[_local_index(*node)] >= 0:
+                neighbors.append((goal, goal_dist[_local_index(*node)]))
+
+            for neighbor, step in neighbors:
+                new_cost = cost + step
+                if new_cost < best.get(neighbor, new_cost + 1):
+                    best[neighbor] = new_cost
+                    parent[neighbor] = node
+                    heapq.heappush(heap, (new_cost + heuristic(neighbor), counter, new_cost, neighbor))
+                    counter += 1
+        else:
+            return None
+
+        abstract = [goal]
+        while abstract[-1] != start:
+            abstract.append(parent[abstract[-1]])
+        abstract.reverse()
+
+        # Refine only the chunks on the route
+        path = [start]
+        for a, b in zip(abstract, abstract[1:]):
+            if (a[0] >> CHUNK_SHIFT, a[1] >> CHUNK_SHIFT) == (b[0] >> CHUNK_SHIFT, b[1] >> CHUNK_SHIFT):
+                path.extend(self._local_path(self.graph(a[0] >> CHUNK_SHIFT, a[1] >> CHUNK_SHIFT), a, b)[1:])
+            else:
+                path.append(b)
+        return path
@@ -1,9 +1,13 @@
 import random
+from .achievements import POTION_USED
+from .exploration import ExplorationMap
 from .map_data import DIFFICULTY_LEVELS, MAP_SIZE
 
 
 class Player:
-    def __init__(self, difficulty="Easy"):
+    def __init__(self, difficulty="Easy", rng=None):
+        # Random stream (an RNGStream, or the global random module by default)
+        self.rng = rng if rng is not None else random
         self.x = MAP_SIZE // 2  # Center player horizontally
         self.y = MAP_SIZE // 2  # Center player vertically
         self.health = DIFFICULTY_LEVELS[difficulty]["max_health"]
@@ -63,7 +67,19 @@ class Player:
         self.achievements = set()
         self.potions_used = 0
         self.bosses_defeated = 0
-        self.explored = set()
+        self.explored = ExplorationMap()  # surface tiles
+        self.cave_explored = {}  # cave entrance (x, y) -> ExplorationMap of that cave
+        # Optional achievements.EventBus notified of gameplay events
+        self.bus = None
+
+    def explored_layer(self, entrance=None):
+        """Get the exploration map of the surface, or of the cave below an entrance."""
+        if entrance is None:
+            return self.explored
+        explored = self.cave_explored.get(entrance)
+        if explored is None:
+            explored = self.cave_explored[entrance] = ExplorationMap()
+        return explored
 
     def move(self, dx, dy, wrap=False):
         """Move the player in the world.
@@ -73,8 +89,8 @@ class Player:
             dy: Y direction (-1, 0, or 1)
             wrap: If True, wrap around map edges (legacy mode)
         """
-        if self.confused > 0 and random.random() < 0.5:
-            dx, dy = random.choice([(0, 1), (0, -1), (1, 0), (-1, 0)])
+        if self.confused > 0 and self.rng.random() < 0.5:
+            dx, dy = self.rng.choice([(0, 1), (0, -1), (1, 0), (-1, 0)])
 
         if wrap:
             self.x = (self.x + dx) % MAP_SIZE
@@ -93,10 +109,12 @@ class Player:
     def heal(self, amt):
         self.health += amt
         self.potions_used += 1
+        if self.bus is not None:
+            self.bus.publish(POTION_USED)
         if not DIFFICULTY_LEVELS[self.difficulty]["overheal_penalty"]:
             self.health = min(self.health, self.max_health)
         elif self.health > self.max_health:
-            self.confused = random.randint(2, 5)
+            self.confused = self.rng.randint(2, 5)
             self.health = self.max_health
 
     def add_bonus(self):
@@ -123,7 +141,7 @@ class Player:
             return "Not enough mana!"
         self.mana -= spell["cost"]
         if spell["effect"] == "fireball":
-            dmg = random.randint(4, 7)
+            dmg = self.rng.randint(4, 7)
             enemy.health -= dmg
             return f"You cast Fireball! {dmg} damage."
         elif spell["effect"] == "heal":
@@ -10,7 +10,13 @@ import random
 class ProceduralEnemyGenerator:
     """Procedural enemy generation system."""
 
-    def __init__(self):
+    def __init__(self, rng=None):
+        """Initialize the generator.
+
+        Args:
+            rng: Random stream to draw from (defaults to the random module)
+        """
+        self.rng = rng if rng is not None else random
         self.enemy_types = [
             "Goblin",
             "Orc",
@@ -45,12 +51,12 @@ class ProceduralEnemyGenerator:
         Returns:
             A dictionary with enemy attributes.
         """
-        base_type = random.choice(self.enemy_types)
-        color = random.choice(self.color_variants)
+        base_type = self.rng.choice(self.enemy_types)
+        color = self.rng.choice(self.color_variants)
 
         # Scale stats with level
-        hp = random.randint(3, 8) + level
-        damage = random.randint(1, 3) + (level // 2)
+        hp = self.rng.randint(3, 8) + level
+        damage = self.rng.randint(1, 3) + (level // 2)
 
         return {
             "name": f"{base_type} (Level {level})",
@@ -71,7 +77,7 @@ class ProceduralEnemyGenerator:
             A dictionary with boss attributes.
         """
         boss_types = ["Dragon", "Minotaur", "Demon Lord", "Lich King"]
-        boss_type = random.choice(boss_types)
+        boss_type = self.rng.choice(boss_types)
 
         return {
             "name": f"{boss_type} (Boss)",
@@ -0,0 +1,241 @@
+"""Input recording and frame-accurate replay for Rivers of Reckoning.
+
+An input log stores the session seed plus, for every frame, the set of
+held and just-pressed buttons as two 16-bit masks. Identical consecutive
+frames are run-length encoded on disk, so long idle stretches cost a few
+bytes. Feeding a log back through a HeadlessEngine reproduces the
+session exactly, either as fast as possible or at real-time pace.
+"""
+
+import struct
+import time
+from array import array
+from typing import FrozenSet, Iterable, Optional, Tuple
+
+from .engine import KEY_MAP, HeadlessEngine
+
+LOG_MAGIC = b"RORI"
+LOG_VERSION = 1
+FRAME_RATE = 60
+
+# magic, version, key count, seed, frame count, run count
+_HEADER = struct.Struct("<4sBBQII")
+# frames in run, held mask, just-pressed mask
+_RUN = struct.Struct("<IHH")
+
+_KEY_CODES = list(KEY_MAP.values())
+_KEY_BITS = {code: 1 << i for i, code in enumerate(_KEY_CODES)}
+_decoded_masks = {}
+
+
+def encode_keys(keys: Iterable[int]) -> int:
+    """Pack pygame key codes into a button bitmask.
+
+    Keys the game does not bind are ignored.
+
+    Args:
+        keys: Iterable of pygame key codes
+
+    Returns:
+        Bitmask with one bit per entry of KEY_MAP
+    """
+    mask = 0
+    for key in keys:
+        mask |= _KEY_BITS.get(key, 0)
+    return mask
+
+
+def decode_keys(mask: int) -> FrozenSet[int]:
+    """Unpack a button bitmask into pygame key codes.
+
+    Args:
+        mask: Bitmask produced by encode_keys
+
+    Returns:
+        Frozen set of pygame key codes
+    """
+    keys = _decoded_masks.get(mask)
+    if keys is None:
+        keys = frozenset(code for code, bit in _KEY_BITS.items() if mask & bit)
+        _decoded_masks[mask] = keys
+    return keys
+
+
+class InputLog:
+    """Recorded per-frame input for one session."""
+
+    def __init__(self, seed: int, held: Optional[array] = None, pressed: Optional[array] = None):
+        """Initialize the log.
+
+        Args:
+            seed: Session seed the recording started from
+            held: Per-frame held-button masks
+            pressed: Per-frame just-pressed masks
+        """
+        self.seed = seed
+        self.held = held if held is not None else array("H")
+        self.pressed = pressed if pressed is not None else array("H")
+
+    def __len__(self) -> int:
+        return len(self.held)
+
+    def frame(self, index: int) -> Tuple[FrozenSet[int], FrozenSet[int]]:
+        """Get the (held, just_pressed) key sets for a frame."""
+        return decode_keys(self.held[index]), decode_keys(self.pressed[index])
+
+    def to_bytes(self) -> bytes:
+        """Serialize the log to its compact binary form."""
+        runs = []
+        count = 0
+        prev = None
+        for frame in zip(self.held, self.pressed):
+            if frame == prev:
+                count += 1
+                continue
+            if prev is not None:
+                runs.append(_RUN.pack(count, *prev))
+            prev = frame
+            count = 1
+        if prev is not None:
+            runs.append(_RUN.pack(count, *prev))
+
+        header = _HEADER.pack(LOG_MAGIC, LOG_VERSION, len(_KEY_CODES), self.seed, len(self), len(runs))
+        return header + b"".join(runs)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "InputLog":
+        """Deserialize a log produced by to_bytes.
+
+        Raises:
+            ValueError: If the data is not a supported input log
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Input log is truncated")
+        magic, version, key_count, seed, frame_count, run_count = _HEADER.unpack_from(data, 0)
+        if magic != LOG_MAGIC:
+            raise ValueError("Not an input log")
+        # Keys are only ever appended to KEY_MAP, so logs recorded with fewer keys keep their bit layout
+        if version != LOG_VERSION or key_count > len(_KEY_CODES):
+            raise ValueError(f"Unsupported input log version {version}")
+        if len(data) < _HEADER.size + run_count * _RUN.size:
+            raise ValueError("Input log is truncated")
+
+        body = memoryview(data)[_HEADER.size : _HEADER.size + run_count * _RUN.size]
+        held = array("H")
+        pressed = array("H")
+        for count, held_mask, pressed_mask in _RUN.iter_unpack(body):
+            held.extend([held_mask] * count)
+            pressed.extend([pressed_mask] * count)
+        if len(held) != frame_count:
+            raise ValueError("Input log frame count mismatch")
+        return cls(seed, held, pressed)
+
+    def save(self, path):
+        """Write the log to a file."""
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path) -> "InputLog":
+        """Read a log from a file."""
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class InputRecorder:
+    """Captures Engine input state once per frame."""
+
+    def __init__(self, seed: int):
+        """Initialize the recorder.
+
+        Args:
+            seed: Session seed of the game being recorded
+        """
+        self._log = InputLog(seed)
+
+    @property
+    def frame_count(self) -> int:
+        """Number of frames recorded so far."""
+        return len(self._log)
+
+    def record_frame(self, pressed: Iterable[int], just_pressed: Iterable[int]):
+        """Append one frame of input.
+
+        Args:
+            pressed: Key codes held this frame
+            just_pressed: Key codes pressed this frame
+        """
+        self._log.held.append(encode_keys(pressed))
+        self._log.pressed.append(encode_keys(just_pressed))
+
+    def finish(self) -> InputLog:
+        """Return the recorded log."""
+        return self._log
+
+
+class ReplayDriver:
+    """Feeds a recorded InputLog back through a game, frame by frame."""
+
+    def __init__(self, log: InputLog, render: bool = False):
+        """Initialize the driver.
+
+        Args:
+            log: Input log to play back
+            render: Also run the game's draw pass onto an offscreen surface
+        """
+        self.log = log
+        self.engine = HeadlessEngine(render=render)
+        self.frame = 0
+
+    def create_game(self):
+        """Create a game seeded and wired for this replay."""
+        from .game import Game
+
+        return Game(seed=self.log.seed, engine=self.engine)
+
+    @property
+    def finished(self) -> bool:
+        """True once every recorded frame has been played."""
+        return self.frame >= len(self.log)
+
+    def step(self, game) -> bool:
+        """Play a single frame.
+
+        Args:
+            game: Game created by create_game
+
+        Returns:
+            False if the log is exhausted or the game stopped running
+        """
+        if self.finished or not game.running:
+            return False
+        self.engine.set_input(*self.log.frame(self.frame))
+        game.update()
+        if self.engine.render:
+            game.draw()
+        self.frame += 1
+        return True
+
+    def run(self, game=None, realtime: bool = False, until_frame: Optional[int] = None):
+        """Play the log back.
+
+        Args:
+            game: Game to drive (a fresh one from create_game if None)
+            realtime: Pace playback at FRAME_RATE instead of as fast as possible
+            until_frame: Stop after this frame, e.g. just before a reported bug
+
+        Returns:
+            The game in its state after the last played frame
+        """
+        if game is None:
+            game = self.create_game()
+        end = len(self.log) if until_frame is None else min(until_frame, len(self.log))
+        start = time.perf_counter()
+        first = self.frame
+
+        while self.frame < end and self.step(game):
+            if realtime:
+                delay = start + (self.frame - first) / FRAME_RATE - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+        return game
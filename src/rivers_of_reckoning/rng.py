@@ -0,0 +1,221 @@
+"""Seedable random number streams for Rivers of Reckoning.
+
+Every subsystem draws from its own stream, derived from the session seed
+plus a subsystem key, so one system's draws never shift another's and a
+whole session can be reproduced from a single integer.
+
+Streams subclass ``random.Random`` and are drop-in replacements for the
+global ``random`` module. Batch draws for vectorized code paths come from
+a NumPy PCG64 generator seeded from the same derived seed.
+
+Positional randomness (tile decoration, per-tile rolls) instead comes
+from a stateless counter-based hash keyed by (seed, x, y, channel): the
+same position always gets the same value, in any order, and whole chunk
+arrays are hashed in one NumPy pass.
+"""
+
+import hashlib
+import random
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+_MASK64 = (1 << 64) - 1
+
+# Hash channels, so independent per-position rolls never correlate
+CHANNEL_TILES = 0
+CHANNEL_ENEMIES = 1
+CHANNEL_POI = 2
+
+
+def splitmix64(x: int) -> int:
+    """Mix a 64-bit integer with the SplitMix64 finalizer.
+
+    Args:
+        x: Input value (only the low 64 bits are used)
+
+    Returns:
+        Well-mixed 64-bit integer
+    """
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+def splitmix64_array(x: np.ndarray) -> np.ndarray:
+    """Vectorized splitmix64 over a uint64 array (arithmetic wraps like the scalar version)."""
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def hash_position(seed: int, x: int, y: int, channel: int = CHANNEL_TILES) -> int:
+    """Hash a tile position into a well-mixed 64-bit integer.
+
+    Args:
+        seed: World seed
+        x: X coordinate
+        y: Y coordinate
+        channel: Independent stream per use (CHANNEL_TILES, CHANNEL_ENEMIES...)
+
+    Returns:
+        64-bit hash, identical to hash_positions for the same inputs
+    """
+    h = splitmix64((seed & _MASK64) ^ splitmix64(channel))
+    h = splitmix64(h ^ (x & _MASK64))
+    return splitmix64(h ^ (y & _MASK64))
+
+
+def hash_positions(seed: int, xs, ys, channel: int = CHANNEL_TILES) -> np.ndarray:
+    """Vectorized hash_position over arrays of coordinates.
+
+    Args:
+        seed: World seed
+        xs: Integer X coordinates (array-like)
+        ys: Integer Y coordinates (array-like)
+        channel: Independent stream per use
+
+    Returns:
+        uint64 array of hashes, shaped like the broadcast coordinates
+    """
+    key = np.uint64(splitmix64((seed & _MASK64) ^ splitmix64(channel)))
+    xs = np.asarray(xs, dtype=np.int64).view(np.uint64)
+    ys = np.asarray(ys, dtype=np.int64).view(np.uint64)
+    return splitmix64_array(splitmix64_array(key ^ xs) ^ ys)
+
+
+def random_at(seed: int, x: int, y: int, channel: int = CHANNEL_TILES) -> float:
+    """Get the deterministic float in [0, 1) for a position and channel."""
+    return (hash_position(seed, x, y, channel) >> 11) * 2.0**-53
+
+
+def random_at_many(seed: int, xs, ys, channel: int = CHANNEL_TILES) -> np.ndarray:
+    """Vectorized random_at; element-for-element equal to the scalar version."""
+    return (hash_positions(seed, xs, ys, channel) >> np.uint64(11)) * 2.0**-53
+
+
+def derive_seed(seed: int, key: str) -> int:
+    """Derive an independent 64-bit seed for a subsystem.
+
+    Args:
+        seed: Parent (world or session) seed
+        key: Subsystem key, e.g. ``"weather"`` or ``"ai"``
+
+    Returns:
+        64-bit seed unique to this (seed, key) pair
+    """
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return splitmix64(splitmix64(seed & _MASK64) ^ int.from_bytes(digest, "little"))
+
+
+class RNGStream(random.Random):
+    """Independent random stream for one subsystem.
+
+    Scalar draws (``random``, ``randint``, ``choice``...) behave exactly like
+    the ``random`` module. The ``*_array`` methods draw batches from a
+    separate NumPy sub-stream, so mixing the two never disturbs either.
+    """
+
+    def __init__(self, seed: Optional[int] = None, key: str = ""):
+        """Initialize the stream.
+
+        Args:
+            seed: Stream seed (None for OS entropy)
+            key: Subsystem key this stream was derived for
+        """
+        self.key = key
+        self._np: Optional[np.random.Generator] = None
+        super().__init__(seed)
+
+    def seed(self, a=None, version=2):
+        """Reseed both the scalar and the batch generator."""
+        super().seed(a, version)
+        self.stream_seed = a if isinstance(a, int) else None
+        self._np = None
+
+    @property
+    def generator(self) -> np.random.Generator:
+        """NumPy generator used for batch draws."""
+        if self._np is None:
+            self._np = np.random.Generator(np.random.PCG64(self.stream_seed))
+        return self._np
+
+    def random_array(self, n: int) -> np.ndarray:
+        """Draw ``n`` floats in [0, 1)."""
+        return self.generator.random(n)
+
+    def uniform_array(self, low: float, high: float, n: int) -> np.ndarray:
+        """Draw ``n`` floats uniformly in [low, high)."""
+        return self.generator.uniform(low, high, n)
+
+    def randint_array(self, low: int, high: int, n: int) -> np.ndarray:
+        """Draw ``n`` integers in [low, high], inclusive like ``randint``."""
+        return self.generator.integers(low, high, n, endpoint=True)
+
+    def choice_array(self, seq: Sequence, n: int, weights: Optional[Sequence[float]] = None) -> np.ndarray:
+        """Draw ``n`` indices into ``seq``, optionally weighted.
+
+        Args:
+            seq: Population to choose from
+            n: Number of draws
+            weights: Optional relative weights (need not sum to 1)
+
+        Returns:
+            Array of indices into ``seq``
+        """
+        p = None
+        if weights is not None:
+            p = np.asarray(weights, dtype=np.float64)
+            p = p / p.sum()
+        return self.generator.choice(len(seq), size=n, p=p)
+
+    def spawn(self, key: str) -> "RNGStream":
+        """Derive a child stream, e.g. one per parallel simulation worker."""
+        return RNGStream(derive_seed(self.stream_seed or 0, key), key=f"{self.key}/{key}")
+
+
+class RNGService:
+    """Hands out one independently seeded stream per subsystem.
+
+    Example:
+        rng = RNGService(seed=1234)
+        weather_rng = rng.stream("weather")
+        ai_rng = rng.stream("ai")
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        """Initialize the service.
+
+        Args:
+            seed: Session seed (None picks one from OS entropy)
+        """
+        if seed is None:
+            seed = random.SystemRandom().randint(1, 999999)
+        self.seed = seed
+        self._streams: Dict[str, RNGStream] = {}
+
+    def stream(self, key: str) -> RNGStream:
+        """Get the stream for a subsystem, creating it on first use.
+
+        Args:
+            key: Subsystem key
+
+        Returns:
+            The subsystem's RNGStream (same object on every call)
+        """
+        stream = self._streams.get(key)
+        if stream is None:
+            stream = RNGStream(derive_seed(self.seed, key), key=key)
+            self._streams[key] = stream
+        return stream
+
+    def fork(self, key: str) -> "RNGService":
+        """Create an independent service, e.g. for a parallel simulation."""
+        return RNGService(derive_seed(self.seed, f"fork:{key}"))
+
+    def reset(self):
+        """Rewind every stream handed out so far to its initial state."""
+        for key, stream in self._streams.items():
+            stream.seed(derive_seed(self.seed, key))
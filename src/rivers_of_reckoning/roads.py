@@ -0,0 +1,399 @@
+"""Road network between points of interest.
+
+Roads are planned per square region of ROAD_REGION_SIZE tiles. Each region's
+nodes are its points of interest plus one gate on each of its four
+borders; a gate's position along a border comes from a hash of the
+seed and that border, so the regions on either side agree on it and
+their roads meet. The nodes are joined by a minimum spanning tree whose
+edges are routed with cost-weighted A* over the region's base terrain:
+grass and dirt are cheap, trees and sand dearer, rock and water very
+expensive (roads bridge them only when going around costs more), and
+tiles already on a road are cheapest so routes merge.
+
+Planning a region needs its base tiles (the world without roads), so a
+RoadNetwork owns a private road-free ProceduralWorld and plans regions
+on a background thread. Without threads (e.g. under pygbag) prefetched
+regions are planned a step at a time within a per-frame budget. Finished regions are kept in an LRU and, when a
+cache directory is given, written to disk so a region is planned once
+per seed and world options.
+"""
+
+import heapq
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .rng import hash_position
+from .world_gen import CHUNK_SHIFT, CHUNK_SIZE, TILE_TYPES, ProceduralWorld, TileType
+
+ROAD_REGION_SHIFT = 7
+ROAD_REGION_SIZE = 1 << ROAD_REGION_SHIFT
+
+# Regions are shifted by half a region so the origin (where play starts)
+# lies in the middle of one instead of on the corner of four
+ROAD_REGION_OFFSET = ROAD_REGION_SIZE // 2
+
+# Neighbouring regions are prefetched once the player is this close to them
+PREFETCH_MARGIN = 48
+
+# Seconds per frame spent planning prefetched regions when there is no planner thread
+PLAN_BUDGET = 0.004
+
+# Version of the planned regions on disk; bump when planning changes what a region holds
+ROAD_CACHE_VERSION = 2
+
+# Gates keep this far from region corners
+GATE_MARGIN = 8
+
+# Hash channel for gate positions
+CHANNEL_ROADS = 3
+
+# Cost of stepping onto each tile type when routing
+_ROUTE_COSTS = {
+    TileType.GRASS: 1.0,
+    TileType.DIRT: 1.0,
+    TileType.CAVE_FLOOR: 1.0,
+    TileType.SAND: 1.5,
+    TileType.TREE: 4.0,
+    TileType.STONE: 6.0,
+    TileType.ROCK: 12.0,
+    TileType.WATER: 12.0,
+    TileType.CAVE_WALL: 50.0,
+    TileType.ROAD: 0.5,
+}
+ROUTE_COST_LUT = np.array([_ROUTE_COSTS[tile] for tile in TILE_TYPES])
+
+Tile = Tuple[int, int]
+
+
+def region_of(x: int, y: int) -> Tuple[int, int]:
+    """Road region containing a tile."""
+    return (x + ROAD_REGION_OFFSET) >> ROAD_REGION_SHIFT, (y + ROAD_REGION_OFFSET) >> ROAD_REGION_SHIFT
+
+
+def region_origin(rx: int, ry: int) -> Tile:
+    """Top-left tile of a road region."""
+    return (rx << ROAD_REGION_SHIFT) - ROAD_REGION_OFFSET, (ry << ROAD_REGION_SHIFT) - ROAD_REGION_OFFSET
+
+
+def region_gates(seed: int, rx: int, ry: int) -> List[Tile]:
+    """Gate tiles of a region: west, east, north and south, in world coordinates.
+
+    The gate on a shared border is hashed from the border itself, so the
+    neighbouring region's gate sits on the adjacent tile across it.
+    """
+    span = ROAD_REGION_SIZE - 2 * GATE_MARGIN
+
+    def offset(border_x: int, border_y: int, horizontal: int) -> int:
+        return GATE_MARGIN + hash_position(seed, 2 * border_x + horizontal, border_y, CHANNEL_ROADS) % span
+
+    x0, y0 = region_origin(rx, ry)
+    x1, y1 = x0 + ROAD_REGION_SIZE - 1, y0 + ROAD_REGION_SIZE - 1
+    return [
+        (x0, y0 + offset(rx, ry, 0)),  # border with the west neighbour
+        (x1, y0 + offset(rx + 1, ry, 0)),  # border with the east neighbour
+        (x0 + offset(rx, ry, 1), y0),  # border with the north neighbour
+        (x0 + offset(rx, ry + 1, 1), y1),  # border with the south neighbour
+    ]
+
+
+def minimum_spanning_tree(points: List[Tile]) -> List[Tuple[int, int]]:
+    """Prim's algorithm over straight-line distances.
+
+    Args:
+        points: Node positions
+
+    Returns:
+        List of (i, j) index pairs, one per tree edge
+    """
+    if not points:
+        return []
+    coords = np.array(points, dtype=np.float64)
+    in_tree = np.zeros(len(points), dtype=bool)
+    in_tree[0] = True
+    best = np.hypot(*(coords - coords[0]).T)
+    parent = np.zeros(len(points), dtype=np.int64)
+    edges = []
+    for _ in range(len(points) - 1):
+        candidates = np.where(in_tree, np.inf, best)
+        j = int(candidates.argmin())
+        edges.append((int(parent[j]), j))
+        in_tree[j] = True
+        distance = np.hypot(*(coords - coords[j]).T)
+        closer = distance < best
+        best[closer] = distance[closer]
+        parent[closer] = j
+    return edges
+
+
+def route(cost: np.ndarray, start: Tile, goal: Tile) -> List[Tile]:
+    """Cheapest 4-connected path over a cost grid with A*.
+
+    Args:
+        cost: Cost of entering each cell, indexed [row, col]
+        start: (row, col) start
+        goal: (row, col) goal
+
+    Returns:
+        List of (row, col) from start to goal inclusive
+    """
+    height, width = cost.shape
+    flat = cost.ravel().tolist()
+    floor = float(cost.min())
+    goal_index = goal[0] * width + goal[1]
+    start_index = start[0] * width + start[1]
+    gr, gc = goal
+
+    g = {start_index: 0.0}
+    parent = {start_index: -1}
+    heap = [(0.0, start_index)]
+    while heap:
+        _, current = heapq.heappop(heap)
+        if current == goal_index:
+            break
+        base = g[current]
+        r, c = divmod(current, width)
+        for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if 0 <= nr < height and 0 <= nc < width:
+                neighbor = nr * width + nc
+                cost_here = base + flat[neighbor]
+                if cost_here < g.get(neighbor, float("inf")):
+                    g[neighbor] = cost_here
+                    parent[neighbor] = current
+                    heapq.heappush(heap, (cost_here + floor * (abs(nr - gr) + abs(nc - gc)), neighbor))
+
+    path = []
+    node = goal_index
+    while node != -1:
+        path.append(divmod(node, width))
+        node = parent[node]
+    return path[::-1]
+
+
+def plan_region_steps(world: ProceduralWorld, rx: int, ry: int) -> Iterator[Optional[np.ndarray]]:
+    """Plan the roads of one region a step at a time (see plan_region).
+
+    Yields None after each chunk of base tiles read and each edge routed
+    (a few milliseconds apiece), then the road mask.
+    """
+    x0, y0 = region_origin(rx, ry)
+    chunks = ROAD_REGION_SIZE // CHUNK_SIZE
+    tiles = np.empty((ROAD_REGION_SIZE, ROAD_REGION_SIZE), dtype=np.uint8)
+    for ly in range(chunks):
+        for lx in range(chunks):
+            chunk = world.get_chunk((x0 >> CHUNK_SHIFT) + lx, (y0 >> CHUNK_SHIFT) + ly)
+            tiles[ly * CHUNK_SIZE : (ly + 1) * CHUNK_SIZE, lx * CHUNK_SIZE : (lx + 1) * CHUNK_SIZE] = chunk.tiles
+            yield None
+    cost = ROUTE_COST_LUT[tiles]
+
+    pois = sorted(world.pois_in_view(x0, y0, ROAD_REGION_SIZE, ROAD_REGION_SIZE), key=lambda poi: (poi.y, poi.x))
+    nodes = region_gates(world.seed, rx, ry) + [(poi.x, poi.y) for poi in pois]
+
+    roads = np.zeros((ROAD_REGION_SIZE, ROAD_REGION_SIZE), dtype=bool)
+    for i, j in minimum_spanning_tree(nodes):
+        start = (nodes[i][1] - y0, nodes[i][0] - x0)
+        goal = (nodes[j][1] - y0, nodes[j][0] - x0)
+        for r, c in route(cost, start, goal):
+            roads[r, c] = True
+            cost[r, c] = _ROUTE_COSTS[TileType.ROAD]
+        yield None
+    yield roads
+
+
+def plan_region(world: ProceduralWorld, rx: int, ry: int) -> np.ndarray:
+    """Plan the roads of one region over a road-free world.
+
+    Args:
+        world: ProceduralWorld without roads
+        rx: Region X
+        ry: Region Y
+
+    Returns:
+        Bool road mask [ROAD_REGION_SIZE, ROAD_REGION_SIZE], indexed [y, x]
+    """
+    for roads in plan_region_steps(world, rx, ry):
+        pass
+    return roads
+
+
+class RoadNetwork:
+    """Region-cached road masks planned off the frame thread, or a slice per frame without threads."""
+
+    def __init__(
+        self,
+        seed: int,
+        climate_step: int = 1,
+        rivers: bool = True,
+        cache_dir: Optional[str] = None,
+        threaded: Optional[bool] = None,
+        max_regions: int = 64,
+    ):
+        """Initialize the road network.
+
+        Args:
+            seed: World seed
+            climate_step: Climate lattice step of the world (so base tiles match it)
+            rivers: Whether the world carves rivers (so base tiles and POIs match it)
+            cache_dir: Directory for planned regions on disk (no disk cache if None)
+            threaded: Plan regions on a background thread (default: when available)
+            max_regions: Maximum number of region masks kept in memory
+        """
+        from .savegame import THREADS_AVAILABLE
+
+        self.seed = seed
+        self.climate_step = climate_step
+        self.rivers = rivers
+        self.cache_dir = cache_dir
+        self.max_regions = max_regions
+        self.threaded = THREADS_AVAILABLE if threaded is None else threaded
+        self._base = ProceduralWorld(seed=seed, rivers=rivers, climate_step=climate_step, roads=False, max_chunks=256)
+        self._regions: "OrderedDict[Tuple[int, int], np.ndarray]" = OrderedDict()
+        self._pending: Dict[Tuple[int, int], Future] = {}
+        # Without threads: prefetched regions being planned by step(), oldest first
+        self._planning: "OrderedDict[Tuple[int, int], Iterator[Optional[np.ndarray]]]" = OrderedDict()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="roads") if self.threaded else None
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, rx: int, ry: int) -> str:
+        # Every option that changes the base tiles is part of the name, so worlds never share regions
+        options = f"v{ROAD_CACHE_VERSION}-{self.seed}-c{self.climate_step}-r{int(self.rivers)}"
+        return os.path.join(self.cache_dir, f"roads-{options}-{rx}-{ry}.bin")
+
+    def _load_or_plan_steps(self, rx: int, ry: int) -> Iterator[Optional[np.ndarray]]:
+        """Read a region from the disk cache, or plan it and write it there, a step at a time.
+
+        Yields None after each planning step, then the road mask.
+        """
+        size = ROAD_REGION_SIZE * ROAD_REGION_SIZE
+        if self.cache_dir is not None:
+            try:
+                with open(self._path(rx, ry), "rb") as f:
+                    packed = np.frombuffer(f.read(), dtype=np.uint8)
+                if len(packed) * 8 == size:
+                    yield np.unpackbits(packed, bitorder="little").astype(bool).reshape(ROAD_REGION_SIZE, ROAD_REGION_SIZE)
+                    return
+            except OSError:
+                pass
+
+        for roads in plan_region_steps(self._base, rx, ry):
+            if roads is None:
+                yield None
+        if self.cache_dir is not None:
+            # Write then rename, so a half-written file is never read back
+            tmp = self._path(rx, ry) + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(np.packbits(roads.ravel(), bitorder="little").tobytes())
+            os.replace(tmp, self._path(rx, ry))
+        yield roads
+
+    def _load_or_plan(self, rx: int, ry: int) -> np.ndarray:
+        """Read a region from the disk cache, or plan it and write it there."""
+        for roads in self._load_or_plan_steps(rx, ry):
+            pass
+        return roads
+
+    def _store(self, key: Tuple[int, int], roads: np.ndarray):
+        self._regions[key] = roads
+        while len(self._regions) > self.max_regions:
+            self._regions.popitem(last=False)
+
+    def prefetch(self, rx: int, ry: int):
+        """Start planning a region in the background (or queue it for step) if it is not ready."""
+        key = (rx, ry)
+        if key in self._regions or key in self._pending or key in self._planning:
+            return
+        if self._executor is not None:
+            self._pending[key] = self._executor.submit(self._load_or_plan, rx, ry)
+        else:
+            self._planning[key] = self._load_or_plan_steps(rx, ry)
+
+    def prefetch_around(self, x: int, y: int):
+        """Start planning the regions within PREFETCH_MARGIN of a tile, so walking into them does not wait."""
+        for dy in (-PREFETCH_MARGIN, 0, PREFETCH_MARGIN):
+            for dx in (-PREFETCH_MARGIN, 0, PREFETCH_MARGIN):
+                self.prefetch(*region_of(x + dx, y + dy))
+
+    def step(self, budget: float = PLAN_BUDGET) -> int:
+        """Collect or plan prefetched regions; call once per frame.
+
+        With a planner thread, regions it has finished are moved into the
+        LRU. Without one, queued prefetches are planned within the time
+        budget: at least one step is taken, then planning stops before the
+        next step would likely overrun the budget.
+
+        Args:
+            budget: Seconds to spend planning without a planner thread
+
+        Returns:
+            Number of regions finished
+        """
+        finished = 0
+        for key in [key for key, future in self._pending.items() if future.done()]:
+            future = self._pending.pop(key)
+            if not future.cancelled():
+                self._store(key, future.result())
+                finished += 1
+
+        start = time.perf_counter()
+        steps = 0
+        while self._planning:
+            # Stop before a step that would likely overrun the budget
+            elapsed = time.perf_counter() - start
+            if steps and elapsed * (steps + 1) / steps > budget:
+                break
+            key, plan = next(iter(self._planning.items()))
+            roads = next(plan)
+            steps += 1
+            if roads is not None:
+                del self._planning[key]
+                self._store(key, roads)
+                finished += 1
+        return finished
+
+    def region(self, rx: int, ry: int) -> np.ndarray:
+        """Get a region's road mask, waiting for (or finishing) its planning if needed."""
+        key = (rx, ry)
+        roads = self._regions.get(key)
+        if roads is not None:
+            self._regions.move_to_end(key)
+            return roads
+
+        if self._executor is None:
+            plan = self._planning.pop(key, None) or self._load_or_plan_steps(rx, ry)
+            for roads in plan:
+                pass
+        else:
+            future = self._pending.pop(key, None)
+            if future is None or future.cancel():
+                # Needed now: jump ahead of the prefetches that have not started
+                queued = [other for other, pending in self._pending.items() if pending.cancel()]
+                future = self._executor.submit(self._load_or_plan, rx, ry)
+                for other in queued:
+                    self._pending[other] = self._executor.submit(self._load_or_plan, *other)
+            roads = future.result()
+
+        self._store(key, roads)
+        return roads
+
+    def road_mask(self, x0: int, y0: int, width: int, height: int) -> np.ndarray:
+        """Get road flags for a rectangle of tiles inside one region (e.g. a chunk).
+
+        Returns:
+            Bool array of shape (height, width), indexed [y, x]
+        """
+        rx, ry = region_of(x0, y0)
+        ox, oy = region_origin(rx, ry)
+        return self.region(rx, ry)[y0 - oy : y0 - oy + height, x0 - ox : x0 - ox + width]
+
+    def close(self):
+        """Stop the background planner, dropping prefetches that have not started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            self._pending.clear()
+        self._planning.clear()
@@ -0,0 +1,591 @@
+"""Binary save/load snapshots for Rivers of Reckoning.
+
+A save file is a small header followed by a journal of records. Each
+record carries one or more tagged sections (session metadata, player,
+exploration, ECS components, RNG streams, current cave, achievements) and a CRC32. Loading merges
+the records, latest section wins, so an autosave only has to append the
+sections that changed since the previous one. Everything is packed with
+``struct``; nothing is pickled.
+
+The procedural world itself is not stored: it is regenerated from the
+world seed on load.
+"""
+
+import os
+import queue
+import struct
+import sys
+import threading
+import zlib
+from typing import Dict, Optional, Tuple
+
+import esper
+
+from .achievements import AchievementTracker
+from .exploration import ExplorationMap
+from .seasons import season_index
+from .systems import (
+    Combat,
+    EnemyTag,
+    Health,
+    PlayerTag,
+    Position,
+    Renderable,
+    Stamina,
+    TimeOfDay,
+    TimePhase,
+    Velocity,
+    Weather,
+    WeatherType,
+    WorldState,
+    changes,
+    create_game_world,
+)
+from .world_gen import BiomeType
+
+SAVE_MAGIC = b"RORS"
+SAVE_VERSION = 4
+
+SECTION_META = b"META"
+SECTION_PLAYER = b"PLYR"
+SECTION_EXPLORED = b"EXPL"
+SECTION_ECS = b"ECS "
+SECTION_RNG = b"RNGS"
+SECTION_CAVE = b"CAVE"
+SECTION_ACHIEVEMENTS = b"ACHV"
+SECTION_CAVES_EXPLORED = b"CEXP"
+
+_FILE_HEADER = struct.Struct("<4sH")
+# section count, payload length, CRC32 of payload
+_RECORD_HEADER = struct.Struct("<BII")
+_SECTION_HEADER = struct.Struct("<4sI")
+
+# session seed, world seed, distance traveled, enemies defeated, biome
+_META = struct.Struct("<qqiiB")
+
+# in a cave, entrance x, entrance y
+_CAVE = struct.Struct("<?ii")
+
+# entrance x, entrance y, length of the cave's ExplorationMap bytes
+_CAVE_EXPLORED = struct.Struct("<iiI")
+
+_PLAYER_INT_FIELDS = (
+    "x",
+    "y",
+    "health",
+    "max_health",
+    "score",
+    "bonus_points",
+    "weaken_turns",
+    "confused",
+    "gold",
+    "sword_level",
+    "shield_level",
+    "boots_level",
+    "mana",
+    "max_mana",
+    "exp",
+    "level",
+    "exp_to_next",
+    "potions_used",
+    "bosses_defeated",
+)
+_PLAYER_BOOL_FIELDS = ("weaken_enemies", "extra_move", "block_next")
+_PLAYER = struct.Struct("<" + "i" * len(_PLAYER_INT_FIELDS) + "?" * len(_PLAYER_BOOL_FIELDS) + "Q")
+
+# UTF-8 byte length before each string
+_STR_LENGTH = struct.Struct("<H")
+_MT_STATE = struct.Struct("<625I?d")
+_PCG_STATE = struct.Struct("<16s16s?I")
+
+# Autosave stays synchronous where threads are unavailable (pygbag/WebAssembly)
+THREADS_AVAILABLE = sys.platform != "emscripten"
+
+
+# =============================================================================
+# LOW-LEVEL ENCODING
+# =============================================================================
+
+
+def _pack_str(s: str) -> bytes:
+    data = s.encode("utf-8")
+    if len(data) > 0xFFFF:
+        raise ValueError(f"String of {len(data)} bytes is too long to save")
+    return _STR_LENGTH.pack(len(data)) + data
+
+
+def _unpack_str(data: bytes, offset: int) -> Tuple[str, int]:
+    (length,) = _STR_LENGTH.unpack_from(data, offset)
+    start = offset + _STR_LENGTH.size
+    return bytes(data[start : start + length]).decode("utf-8"), start + length
+
+
+class _ComponentCodec:
+    """Packs one dataclass component type into a fixed struct plus strings."""
+
+    def __init__(self, cls, fields: Tuple[str, ...], fmt: str, strings: Tuple[str, ...] = (), enum=None):
+        self.cls = cls
+        self.fields = fields
+        self.struct = struct.Struct("<" + fmt)
+        self.strings = strings
+        self.enum = enum  # (field name, Enum class) stored as its value
+
+    def pack(self, component) -> bytes:
+        values = [getattr(component, name) for name in self.fields]
+        if self.enum:
+            name, _ = self.enum
+            idx = self.fields.index(name)
+            values[idx] = values[idx].value
+        data = self.struct.pack(*values)
+        return data + b"".join(_pack_str(getattr(component, name)) for name in self.strings)
+
+    def unpack(self, data: bytes, offset: int):
+        values = dict(zip(self.fields, self.struct.unpack_from(data, offset)))
+        offset += self.struct.size
+        if self.enum:
+            name, enum_cls = self.enum
+            values[name] = enum_cls(values[name])
+        for name in self.strings:
+            values[name], offset = _unpack_str(data, offset)
+        return self.cls(**values), offset
+
+
+# Position in this list is the on-disk component type id
+COMPONENT_CODECS = [
+    _ComponentCodec(Position, ("x", "y"), "dd"),
+    _ComponentCodec(Velocity, ("dx", "dy", "max_speed"), "ddd"),
+    _ComponentCodec(Health, ("current", "maximum", "regen_rate"), "did"),
+    _ComponentCodec(Stamina, ("current", "maximum", "regen_rate"), "ddd"),
+    _ComponentCodec(Combat, ("attack_damage", "armor", "dodge_chance", "attack_cooldown", "is_attacking"), "iddd?"),
+    _ComponentCodec(PlayerTag, ("gold", "score", "level", "experience", "exp_to_next", "mana", "max_mana"), "iiiiiii"),
+    _ComponentCodec(
+        EnemyTag,
+        ("detection_range", "attack_range", "is_boss", "wander_timer"),
+        "dd?d",
+        strings=("name", "state"),
+    ),
+    _ComponentCodec(Renderable, ("color", "size", "visible"), "ii?", strings=("sprite_id",)),
+    _ComponentCodec(TimeOfDay, ("hour", "phase", "time_scale", "day_count"), "dBdi", enum=("phase", TimePhase)),
+    _ComponentCodec(
+        Weather,
+        ("current", "intensity", "duration", "wind_speed", "wind_angle"),
+        "Bdddd",
+        enum=("current", WeatherType),
+    ),
+    _ComponentCodec(
+        WorldState,
+        ("difficulty", "enemies_defeated", "bosses_defeated", "distance_traveled"),
+        "diid",
+        strings=("current_biome",),
+    ),
+]
+_CODEC_IDS = {codec.cls: i for i, codec in enumerate(COMPONENT_CODECS)}
+
+
+# =============================================================================
+# SECTIONS
+# =============================================================================
+
+
+def _pack_meta(game) -> bytes:
+    biome = game.current_biome.value if game.current_biome else 0
+    return _META.pack(game.seed, game.map.world.seed, game.distance_traveled, game.enemies_defeated, biome)
+
+
+def _pack_player(player) -> bytes:
+    unlocks = 0
+    for idx in player.spell_unlocks:
+        unlocks |= 1 << idx
+    values = [getattr(player, name) for name in _PLAYER_INT_FIELDS]
+    values += [getattr(player, name) for name in _PLAYER_BOOL_FIELDS]
+    out = [_PLAYER.pack(*values, unlocks), _pack_str(player.difficulty), struct.pack("<B", len(player.gear))]
+    out.extend(_pack_str(name) for name in sorted(player.gear))
+    return b"".join(out)
+
+
+def _unpack_player(player, data: bytes):
+    values = _PLAYER.unpack_from(data, 0)
+    offset = _PLAYER.size
+    n_int = len(_PLAYER_INT_FIELDS)
+    for name, value in zip(_PLAYER_INT_FIELDS, values[:n_int]):
+        setattr(player, name, value)
+    for name, value in zip(_PLAYER_BOOL_FIELDS, values[n_int:-1]):
+        setattr(player, name, value)
+    unlocks = values[-1]
+    player.spell_unlocks = {i for i in range(64) if unlocks & (1 << i)}
+    player.difficulty, offset = _unpack_str(data, offset)
+    count = data[offset]
+    offset += 1
+    player.gear = set()
+    for _ in range(count):
+        name, offset = _unpack_str(data, offset)
+        player.gear.add(name)
+
+
+def _pack_ecs() -> bytes:
+    out = []
+    count = 0
+    for ent in esper.get_entities():
+        comps = [c for c in esper.components_for_entity(ent) if type(c) in _CODEC_IDS]
+        if not comps:
+            # e.g. an entity parked in an EntityPool
+            continue
+        out.append(struct.pack("<B", len(comps)))
+        for comp in comps:
+            out.append(struct.pack("<B", _CODEC_IDS[type(comp)]))
+            out.append(COMPONENT_CODECS[_CODEC_IDS[type(comp)]].pack(comp))
+        count += 1
+    return struct.pack("<I", count) + b"".join(out)
+
+
+def _unpack_ecs(data: bytes):
+    esper.clear_database()
+    (count,) = struct.unpack_from("<I", data, 0)
+    offset = 4
+    for _ in range(count):
+        n_comps = data[offset]
+        offset += 1
+        comps = []
+        for _ in range(n_comps):
+            codec = COMPONENT_CODECS[data[offset]]
+            comp, offset = codec.unpack(data, offset + 1)
+            comps.append(comp)
+        changes.mark_all(esper.create_entity(*comps), [type(comp) for comp in comps])
+
+
+def _pack_rng(rng) -> bytes:
+    out = [struct.pack("<B", len(rng._streams))]
+    for key, stream in sorted(rng._streams.items()):
+        _, internal, gauss = stream.getstate()
+        out.append(_pack_str(key))
+        out.append(_MT_STATE.pack(*internal, gauss is not None, gauss or 0.0))
+        if stream._np is None:
+            out.append(b"\x00")
+        else:
+            state = stream._np.bit_generator.state
+            out.append(b"\x01")
+            out.append(
+                _PCG_STATE.pack(
+                    state["state"]["state"].to_bytes(16, "little"),
+                    state["state"]["inc"].to_bytes(16, "little"),
+                    bool(state["has_uint32"]),
+                    state["uinteger"],
+                )
+            )
+    return b"".join(out)
+
+
+def _unpack_rng(rng, data: bytes):
+    count = data[0]
+    offset = 1
+    for _ in range(count):
+        key, offset = _unpack_str(data, offset)
+        values = _MT_STATE.unpack_from(data, offset)
+        offset += _MT_STATE.size
+        stream = rng.stream(key)
+        stream.setstate((3, tuple(values[:625]), values[626] if values[625] else None))
+        has_np = data[offset]
+        offset += 1
+        if has_np:
+            state, inc, has_uint32, uinteger = _PCG_STATE.unpack_from(data, offset)
+            offset += _PCG_STATE.size
+            stream.generator.bit_generator.state = {
+                "bit_generator": "PCG64",
+                "state": {"state": int.from_bytes(state, "little"), "inc": int.from_bytes(inc, "little")},
+                "has_uint32": int(has_uint32),
+                "uinteger": uinteger,
+            }
+
+
+def _pack_cave(game_map) -> bytes:
+    if game_map.in_cave:
+        return _CAVE.pack(True, *game_map.world.entrance)
+    return _CAVE.pack(False, 0, 0)
+
+
+def _pack_caves_explored(player) -> bytes:
+    out = [struct.pack("<H", len(player.cave_explored))]
+    for (x, y), explored in sorted(player.cave_explored.items()):
+        data = explored.to_bytes()
+        out.append(_CAVE_EXPLORED.pack(x, y, len(data)))
+        out.append(data)
+    return b"".join(out)
+
+
+def _unpack_caves_explored(player, data: bytes):
+    (count,) = struct.unpack_from("<H", data, 0)
+    offset = 2
+    player.cave_explored = {}
+    for _ in range(count):
+        x, y, length = _CAVE_EXPLORED.unpack_from(data, offset)
+        offset += _CAVE_EXPLORED.size
+        player.cave_explored[(x, y)] = ExplorationMap.from_bytes(data[offset : offset + length])
+        offset += length
+
+
+def snapshot_sections(game) -> Dict[bytes, bytes]:
+    """Capture the full game state as tagged binary sections.
+
+    This runs on the frame thread and only packs bytes; no I/O happens here.
+
+    Args:
+        game: A started Game
+
+    Returns:
+        Mapping of section tag to payload
+    """
+    return {
+        SECTION_META: _pack_meta(game) + _pack_str(game.state),
+        SECTION_PLAYER: _pack_player(game.player),
+        SECTION_EXPLORED: game.player.explored.to_bytes(),
+        SECTION_CAVES_EXPLORED: _pack_caves_explored(game.player),
+        SECTION_ECS: _pack_ecs(),
+        SECTION_RNG: _pack_rng(game.rng),
+        SECTION_CAVE: _pack_cave(game.map),
+        SECTION_ACHIEVEMENTS: game.achievements.to_bytes(),
+    }
+
+
+def restore_sections(sections: Dict[bytes, bytes], game=None):
+    """Rebuild a game from tagged sections.
+
+    Args:
+        sections: Mapping produced by snapshot_sections or read_save
+        game: Game to restore into (keeps its engine); a headless one if None
+
+    Returns:
+        The restored Game
+    """
+    from .game import Game
+    from .map import Map
+    from .player import Player
+    from .rng import RNGService
+
+    meta = sections[SECTION_META]
+    session_seed, world_seed, distance, defeated, biome = _META.unpack_from(meta, 0)
+    state, _ = _unpack_str(meta, _META.size)
+
+    if game is None:
+        game = Game(test_mode=True, seed=session_seed)
+    game.rng = RNGService(session_seed)
+    game.seed = session_seed
+    if SECTION_RNG in sections:
+        _unpack_rng(game.rng, sections[SECTION_RNG])
+
+    game.close()
+    game.map = Map(seed=world_seed, rng=game.rng.stream("map"), roads=True, road_cache_dir=game.road_cache_dir, seasonal=True)
+    game.ecs_world = create_game_world(rng=game.rng, world_gen=game.map.world)
+    if SECTION_CAVE in sections:
+        in_cave, entrance_x, entrance_y = _CAVE.unpack(sections[SECTION_CAVE])
+        if in_cave:
+            game.map.enter_cave(entrance_x, entrance_y)
+            game.ecs_world.set_terrain(game.map.world)
+    if SECTION_ECS in sections:
+        _unpack_ecs(sections[SECTION_ECS])
+        # Bring a seasonal world to the saved day's season before anything reads tiles
+        for _, (time,) in esper.get_components(TimeOfDay):
+            game.map.surface.set_season(season_index(time.day_count))
+
+    game.player = Player("Normal", rng=game.rng.stream("player"))
+    _unpack_player(game.player, sections[SECTION_PLAYER])
+    counters = None
+    if SECTION_ACHIEVEMENTS in sections:
+        game.player.achievements, counters = AchievementTracker.unpack(sections[SECTION_ACHIEVEMENTS])
+    game.track_achievements(counters)
+    game.ecs_world.place_player(game.player.x + 0.5, game.player.y + 0.5)
+    if SECTION_EXPLORED in sections:
+        game.player.explored = ExplorationMap.from_bytes(sections[SECTION_EXPLORED])
+    if SECTION_CAVES_EXPLORED in sections:
+        _unpack_caves_explored(game.player, sections[SECTION_CAVES_EXPLORED])
+
+    game.map.update_camera(game.player.x, game.player.y)
+
+    game.distance_traveled = distance
+    game.enemies_defeated = defeated
+    game.current_biome = BiomeType(biome) if biome else game.map.get_current_biome()
+    game.state = state
+    game.enemies = []
+    game.event_message = None
+    game.announcements = []
+    return game
+
+
+# =============================================================================
+# FILE FORMAT
+# =============================================================================
+
+
+def _encode_record(sections: Dict[bytes, bytes]) -> bytes:
+    payload = b"".join(_SECTION_HEADER.pack(tag, len(data)) + data for tag, data in sections.items())
+    return _RECORD_HEADER.pack(len(sections), len(payload), zlib.crc32(payload)) + payload
+
+
+def read_save(path) -> Dict[bytes, bytes]:
+    """Read a save file and merge its records.
+
+    A truncated or corrupt trailing record (e.g. from a crash mid-write)
+    is ignored, so the previous autosave state is recovered.
+
+    Args:
+        path: Save file path
+
+    Returns:
+        Mapping of section tag to latest payload
+
+    Raises:
+        ValueError: If the file is not a supported save
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if len(data) < _FILE_HEADER.size:
+        raise ValueError("Save file is truncated")
+    magic, version = _FILE_HEADER.unpack_from(data, 0)
+    if magic != SAVE_MAGIC:
+        raise ValueError("Not a save file")
+    if version != SAVE_VERSION:
+        raise ValueError(f"Unsupported save version {version}")
+
+    sections = {}
+    offset = _FILE_HEADER.size
+    view = memoryview(data)
+    while offset + _RECORD_HEADER.size <= len(data):
+        count, length, crc = _RECORD_HEADER.unpack_from(data, offset)
+        start = offset + _RECORD_HEADER.size
+        payload = view[start : start + length]
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            break
+        pos = 0
+        for _ in range(count):
+            tag, size = _SECTION_HEADER.unpack_from(payload, pos)
+            pos += _SECTION_HEADER.size
+            sections[tag] = bytes(payload[pos : pos + size])
+            pos += size
+        offset = start + length
+
+    if SECTION_META not in sections or SECTION_PLAYER not in sections:
+        raise ValueError("Save file has no complete snapshot")
+    return sections
+
+
+def _write_full(path, sections: Dict[bytes, bytes]):
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(_FILE_HEADER.pack(SAVE_MAGIC, SAVE_VERSION))
+        f.write(_encode_record(sections))
+    os.replace(tmp, path)
+
+
+def save_game(game, path):
+    """Write a full snapshot of the game.
+
+    Args:
+        game: A started Game
+        path: Destination file (replaced atomically)
+    """
+    _write_full(path, snapshot_sections(game))
+
+
+def road_cache_dir(path) -> str:
+    """Directory for planned road regions beside a save file, shared by the saves next to it.
+
+    Regions are keyed by world seed and options, so saves of different worlds can share it.
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(path)), "road-cache")
+
+
+def load_game(path, game=None):
+    """Load a snapshot written by save_game or an Autosaver.
+
+    Args:
+        path: Save file path
+        game: Game to restore into (keeps its engine); a headless one if None
+
+    Returns:
+        The restored Game
+    """
+    return restore_sections(read_save(path), game)
+
+
+class Autosaver:
+    """Incremental autosave that only writes sections changed since the last save.
+
+    Snapshots are packed on the calling thread (cheap), compared with the
+    previous snapshot, and the changed sections are appended to the save
+    journal by a background writer thread, so disk I/O never stalls a frame.
+    The journal is compacted into a single record every ``compact_every``
+    appends.
+    """
+
+    def __init__(self, path, threaded: Optional[bool] = None, compact_every: int = 32):
+        """Initialize the autosaver.
+
+        Args:
+            path: Save file path (overwritten on the first autosave)
+            threaded: Write on a background thread (default: when available)
+            compact_every: Appended records before the journal is rewritten
+        """
+        self.path = path
+        self.threaded = THREADS_AVAILABLE if threaded is None else threaded
+        self.compact_every = compact_every
+        self._last: Dict[bytes, bytes] = {}
+        # Writer-side view of the file contents, used when compacting
+        self._written: Dict[bytes, bytes] = {}
+        self._records = 0
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = None
+        if self.threaded:
+            self._thread = threading.Thread(target=self._worker, name="autosave", daemon=True)
+            self._thread.start()
+
+    def autosave(self, game) -> int:
+        """Snapshot the game and queue the sections that changed.
+
+        Args:
+            game: A started Game
+
+        Returns:
+            Number of sections queued for writing
+        """
+        sections = snapshot_sections(game)
+        changed = {tag: data for tag, data in sections.items() if self._last.get(tag) != data}
+        if not changed:
+            return 0
+        self._last.update(changed)
+        if self.threaded:
+            self._queue.put(changed)
+        else:
+            self._write(changed)
+        return len(changed)
+
+    def _write(self, changed: Dict[bytes, bytes]):
+        self._written.update(changed)
+        if self._records == 0 or self._records >= self.compact_every:
+            _write_full(self.path, self._written)
+            self._records = 1
+        else:
+            with open(self.path, "ab") as f:
+                f.write(_encode_record(changed))
+            self._records += 1
+
+    def _worker(self):
+        while True:
+            changed = self._queue.get()
+            try:
+                if changed is None:
+                    return
+                self._write(changed)
+            finally:
+                self._queue.task_done()
+
+    def flush(self):
+        """Block until every queued autosave has been written."""
+        if self.threaded:
+            self._queue.join()
+
+    def close(self):
+        """Flush pending writes and stop the writer thread."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,120 @@
+"""Seasonal climate for a time-varying world.
+
+Seasons shift the world's moisture and temperature with a low-frequency
+3D noise field whose third axis is time, plus a yearly temperature swing
+(warm summers, cold winters). Time is quantized into season slices of
+SEASON_DAYS in-game days; within a slice the climate, and so every
+generated chunk, is fixed.
+
+The seasonal offset varies over hundreds of tiles, so it is evaluated
+only on a coarse ClimateLattice per slice and interpolated, which keeps
+the (unvectorized) 3D noise off the per-tile path. The static climate
+fields keep all their detail; the offset only moves biome borders.
+"""
+
+import math
+from typing import Dict, Tuple
+
+import numpy as np
+from opensimplex import OpenSimplex
+
+from .climate import ClimateLattice
+
+# In-game days per season slice, and slices per year
+SEASON_DAYS = 2
+SEASONS_PER_YEAR = 4
+
+# Feature scale of the seasonal offset, and how far the noise moves along time per slice
+SEASON_SCALE = 0.02
+SEASON_DRIFT = 0.35
+
+# Peak seasonal offsets: noise-driven moisture and temperature drift, and the yearly swing
+MOISTURE_DRIFT = 0.2
+TEMPERATURE_DRIFT = 0.15
+TEMPERATURE_SWING = 0.1
+
+# Lattice spacing for the seasonal offset
+SEASON_STEP = 16
+
+# The next slice is prefetched over this many final in-game hours of a slice,
+# spending at most PREFETCH_BUDGET seconds of each frame
+PREFETCH_HOURS = 12.0
+PREFETCH_BUDGET = 0.004
+
+
+def season_index(day_count: int) -> int:
+    """Season slice of an in-game day (day_count starts at 1)."""
+    return (day_count - 1) // SEASON_DAYS
+
+
+def hours_until_next_season(day_count: int, hour: float) -> float:
+    """In-game hours left in the current season slice."""
+    day_in_season = (day_count - 1) % SEASON_DAYS
+    return (SEASON_DAYS - day_in_season) * 24.0 - hour
+
+
+class SeasonalClimate:
+    """Per-slice seasonal climate offsets, keeping at most two slices."""
+
+    def __init__(self, moisture_noise: OpenSimplex, temperature_noise: OpenSimplex):
+        """Initialize the seasonal climate.
+
+        Args:
+            moisture_noise: Generator whose 3D noise drives moisture drift
+            temperature_noise: Generator whose 3D noise drives temperature drift
+        """
+        self.moisture_noise = moisture_noise
+        self.temperature_noise = temperature_noise
+        self._slices: Dict[int, ClimateLattice] = {}
+
+    def offset_fields(self, xs: np.ndarray, ys: np.ndarray, season: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Seasonal (moisture, temperature) offsets on a regular grid of tile coordinates.
+
+        Args:
+            xs: Tile X coordinates, constant along each column
+            ys: Tile Y coordinates, constant along each row
+            season: Season slice
+
+        Returns:
+            Tuple of (moisture offset, temperature offset), shaped like xs
+        """
+        x_axis = xs[0] * SEASON_SCALE
+        y_axis = ys[:, 0] * SEASON_SCALE
+        z_axis = np.array([season * SEASON_DRIFT])
+        swing = TEMPERATURE_SWING * math.sin(2 * math.pi * season / SEASONS_PER_YEAR)
+        moisture = MOISTURE_DRIFT * self.moisture_noise.noise3array(x_axis, y_axis, z_axis)[0]
+        temperature = swing + TEMPERATURE_DRIFT * self.temperature_noise.noise3array(x_axis, y_axis, z_axis)[0]
+        return moisture, temperature
+
+    def lattice(self, season: int) -> ClimateLattice:
+        """Get a slice's offset lattice, creating it if needed."""
+        lattice = self._slices.get(season)
+        if lattice is None:
+            lattice = ClimateLattice(lambda xs, ys: self.offset_fields(xs, ys, season), step=SEASON_STEP)
+            self._slices[season] = lattice
+        return lattice
+
+    def retain(self, *seasons: int):
+        """Drop every slice but the given ones (the current and next season)."""
+        for season in list(self._slices):
+            if season not in seasons:
+                del self._slices[season]
+
+    def apply(
+        self, moisture: np.ndarray, temperature: np.ndarray, x0: int, y0: int, season: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Shift a chunk's static climate by a slice's offsets.
+
+        Args:
+            moisture: Static moisture of the rectangle
+            temperature: Static temperature of the rectangle
+            x0: Left tile X coordinate
+            y0: Top tile Y coordinate
+            season: Season slice
+
+        Returns:
+            Tuple of seasonal (moisture, temperature), clipped to [0, 1]
+        """
+        height, width = moisture.shape
+        moisture_offset, temperature_offset = self.lattice(season).sample(x0, y0, width, height)
+        return np.clip(moisture + moisture_offset, 0.0, 1.0), np.clip(temperature + temperature_offset, 0.0, 1.0)
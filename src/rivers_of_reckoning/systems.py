@@ -10,13 +10,27 @@ This module provides a lightweight wrapper for game systems.
 import esper
 import random
 import math
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum, auto
 
+import numpy as np
+
+from .flowfield import FlowField
+from .fov import FieldOfView
+from .los import LineOfSight
+from .map_data import ENEMY_TYPES
+from .pathfinding import HierarchicalPathfinder
+from .world_gen import BIOME_CONFIGS, CHUNK_SHIFT
+
 
 # =============================================================================
 # COMPONENTS (pure data)
 # =============================================================================
+#
+# Components are slotted dataclasses: no per-instance __dict__, so they are
+# smaller and faster to read, and a recycled instance (see EntityPool) can
+# be reinitialized in place.
 
 class TimePhase(Enum):
     DAWN = auto()
@@ -33,14 +47,14 @@ class WeatherType(Enum):
     STORM = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """2D position in the world."""
     x: float = 0.0
     y: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Velocity:
     """Movement velocity."""
     dx: float = 0.0
@@ -48,7 +62,7 @@ class Velocity:
     max_speed: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Health:
     """Health for damageable entities."""
     current: int = 10
@@ -56,7 +70,7 @@ class Health:
     regen_rate: float = 0.0  # HP per second
 
 
-@dataclass
+@dataclass(slots=True)
 class Stamina:
     """Stamina for actions."""
     current: float = 100.0
@@ -64,7 +78,7 @@ class Stamina:
     regen_rate: float = 5.0  # Per second
 
 
-@dataclass
+@dataclass(slots=True)
 class Combat:
     """Combat statistics."""
     attack_damage: int = 2
@@ -74,7 +88,7 @@ class Combat:
     is_attacking: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerTag:
     """Identifies the player entity."""
     gold: int = 0
@@ -86,7 +100,7 @@ class PlayerTag:
     max_mana: int = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class EnemyTag:
     """Identifies enemy entities with AI state."""
     name: str = "Goblin"
@@ -97,7 +111,7 @@ class EnemyTag:
     wander_timer: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Renderable:
     """Visual rendering data."""
     color: int = 8  # Color palette index
@@ -106,7 +120,7 @@ class Renderable:
     sprite_id: str = "default"
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeOfDay:
     """Global time system (singleton component)."""
     hour: float = 6.0       # 0-24
@@ -115,7 +129,7 @@ class TimeOfDay:
     day_count: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class Weather:
     """Global weather system (singleton component)."""
     current: WeatherType = WeatherType.CLEAR
@@ -125,7 +139,78 @@ class Weather:
     wind_angle: float = 0.0  # Radians
 
 
-@dataclass
+# Sight radius in tiles for a biome with visibility 1.0 in clear daylight
+MAX_VIEW_RADIUS = 8
+
+# Sight multipliers at full weather intensity, and per time of day
+WEATHER_VISIBILITY = {
+    WeatherType.CLEAR: 1.0,
+    WeatherType.RAIN: 0.8,
+    WeatherType.FOG: 0.35,
+    WeatherType.SNOW: 0.7,
+    WeatherType.STORM: 0.5,
+}
+PHASE_VISIBILITY = {
+    TimePhase.DAWN: 0.75,
+    TimePhase.DAY: 1.0,
+    TimePhase.DUSK: 0.75,
+    TimePhase.NIGHT: 0.5,
+}
+
+
+def get_view_radius(visibility: float, weather: Weather = None, time: TimeOfDay = None) -> int:
+    """Compute the sight radius from biome visibility, weather and time of day.
+
+    Args:
+        visibility: BiomeConfig.visibility (0-1)
+        weather: Current Weather, if any
+        time: Current TimeOfDay, if any
+
+    Returns:
+        Sight radius in tiles (at least 1)
+    """
+    factor = visibility
+    if weather is not None:
+        factor *= 1 - (1 - WEATHER_VISIBILITY.get(weather.current, 1.0)) * weather.intensity
+    if time is not None:
+        factor *= PHASE_VISIBILITY.get(time.phase, 1.0)
+    return max(1, round(MAX_VIEW_RADIUS * factor))
+
+
+def current_view_radius(world_gen, x: int, y: int) -> int:
+    """Get the sight radius at a tile under the current weather and time of day.
+
+    Args:
+        world_gen: ProceduralWorld providing the biome
+        x: Tile X coordinate
+        y: Tile Y coordinate
+
+    Returns:
+        Sight radius in tiles
+    """
+    _, biome = world_gen.get_tile(x, y)
+    weather = next((w for _, w in esper.get_component(Weather)), None)
+    time = next((t for _, t in esper.get_component(TimeOfDay)), None)
+    return get_view_radius(BIOME_CONFIGS[biome].visibility, weather, time)
+
+
+# Spawning: chunks within SPAWN_RADIUS of the player's chunk are populated
+# up to CHUNK_POPULATION_CAP scaled by their spawn chance, at SPAWN_RATE
+# per missing enemy per second; enemies appear at least MIN_SPAWN_DISTANCE
+# tiles from the player and are despawned beyond DESPAWN_DISTANCE
+SPAWN_RADIUS = 1
+CHUNK_POPULATION_CAP = 4
+SPAWN_RATE = 0.2
+MIN_SPAWN_DISTANCE = 7
+DESPAWN_DISTANCE = 48
+
+# Combat: seconds between an attacking enemy's hits, and how far (in
+# tiles) the player reaches with an attack
+ENEMY_ATTACK_COOLDOWN = 1.5
+PLAYER_REACH = 1.5
+
+
+@dataclass(slots=True)
 class WorldState:
     """Global world state (singleton component)."""
     current_biome: str = "marsh"
@@ -135,6 +220,121 @@ class WorldState:
     distance_traveled: float = 0.0
 
 
+# Terrain layers whose pathfinding and sight services GameWorld keeps:
+# the surface and the cave most recently entered
+MAX_TERRAIN_SERVICES = 2
+
+
+# =============================================================================
+# CHANGE TRACKING
+# =============================================================================
+
+# Removals older than this many ticks are forgotten
+REMOVAL_HISTORY = 600
+
+
+class ChangeTracker:
+    """Records which entities' components changed on which tick.
+
+    Processors mark the components they write; consumers remember the
+    tick they last looked at and ask for the entities changed since, so
+    they only handle deltas instead of rescanning every entity. Each
+    component type keeps its entities ordered by last change, so a query
+    walks back from the newest change and stops at the first older one.
+    """
+
+    def __init__(self):
+        self.tick = 0
+        self._changed = {}  # component type -> OrderedDict of entity -> tick, oldest first
+        self._removed = OrderedDict()  # entity -> tick, oldest first
+        self._removals_from = 0  # first tick whose removals are all still recorded
+
+    def reset(self):
+        """Forget all changes, e.g. when the ECS database is cleared."""
+        self.tick = 0
+        self._changed.clear()
+        self._removed.clear()
+        self._removals_from = 0
+
+    def advance(self) -> int:
+        """Start the next tick and get its number."""
+        self.tick += 1
+        while self._removed and next(iter(self._removed.values())) < self.tick - REMOVAL_HISTORY:
+            _, forgotten = self._removed.popitem(last=False)
+            self._removals_from = forgotten + 1
+        return self.tick
+
+    def covers(self, tick: int) -> bool:
+        """Check whether every removal since a tick is still recorded.
+
+        Consumers that looked last before the truncated history have to
+        rescan instead of applying deltas.
+        """
+        return tick >= self._removals_from
+
+    def mark(self, component_type: type, ent: int):
+        """Record that an entity's component changed this tick."""
+        log = self._changed.get(component_type)
+        if log is None:
+            log = self._changed[component_type] = OrderedDict()
+        log[ent] = self.tick
+        log.move_to_end(ent)
+        if ent in self._removed:
+            # A recycled entity ID is alive again
+            del self._removed[ent]
+
+    def mark_all(self, ent: int, component_types):
+        """Record that several of an entity's components changed, e.g. on creation."""
+        for component_type in component_types:
+            self.mark(component_type, ent)
+
+    def remove(self, ent: int):
+        """Record that an entity was deleted this tick."""
+        for log in self._changed.values():
+            log.pop(ent, None)
+        self._removed[ent] = self.tick
+        self._removed.move_to_end(ent)
+
+    @staticmethod
+    def _since(log: OrderedDict, tick: int) -> list:
+        found = []
+        for ent in reversed(log):
+            if log[ent] < tick:
+                break
+            found.append(ent)
+        return found
+
+    def changed_since(self, component_type: type, tick: int) -> list:
+        """Get the entities whose component changed at or after a tick.
+
+        Pass the tick at which you last looked; changes made later during
+        that same tick are included, so none are missed.
+
+        Args:
+            component_type: Component class
+            tick: First tick of interest
+
+        Returns:
+            List of entity IDs, most recently changed first
+        """
+        log = self._changed.get(component_type)
+        return self._since(log, tick) if log else []
+
+    def removed_since(self, tick: int) -> list:
+        """Get the entities deleted at or after a tick.
+
+        Raises:
+            ValueError: If removals since the tick were already forgotten (see covers)
+        """
+        if not self.covers(tick):
+            raise ValueError(f"Removals before tick {self._removals_from} are no longer recorded")
+        return self._since(self._removed, tick)
+
+
+# The tracker for esper's module-level database; GameWorld resets it along with the database
+changes = ChangeTracker()
+
+
 # =============================================================================
 # SYSTEMS (using esper 3.x module-level API)
 # =============================================================================
@@ -146,21 +346,34 @@ class MovementProcessor(esper.Processor):
         self.world_gen = world_gen
 
     def process(self, dt: float = 1 / 60):
-        """Update positions based on velocity."""
-        for ent, (pos, vel) in esper.get_components(Position, Velocity):
-            new_x = pos.x + vel.dx * dt
-            new_y = pos.y + vel.dy * dt
-
-            if self.world_gen is not None:
-                if self.world_gen.is_walkable(int(new_x), int(new_y)):
-                    pos.x = new_x
-                    pos.y = new_y
-            else:
+        """Update positions based on velocity.
+
+        Collision for all moving entities is checked with one batched
+        walkability query instead of one tile lookup per entity.
+        """
+        movers = esper.get_components(Position, Velocity)
+        if not movers:
+            return
+
+        new_positions = [(pos.x + vel.dx * dt, pos.y + vel.dy * dt) for _, (pos, vel) in movers]
+        if self.world_gen is not None:
+            # The tile under a position is its floor, also for negative coordinates
+            coords = np.floor(np.array(new_positions, dtype=np.float64)).astype(np.int64)
+            walkable = self.world_gen.is_walkable_many(coords[:, 0], coords[:, 1]).tolist()
+        else:
+            walkable = [True] * len(new_positions)
+
+        for (ent, (pos, vel)), (new_x, new_y), ok in zip(movers, new_positions, walkable):
+            if not vel.dx and not vel.dy:
+                continue
+            if ok:
                 pos.x = new_x
                 pos.y = new_y
+                changes.mark(Position, ent)
 
             vel.dx *= 0.9
             vel.dy *= 0.9
+            changes.mark(Velocity, ent)
 
 
 class TimeProcessor(esper.Processor):
@@ -183,13 +396,29 @@ class TimeProcessor(esper.Processor):
                 time.phase = TimePhase.DUSK
             else:
                 time.phase = TimePhase.NIGHT
+            changes.mark(TimeOfDay, ent)
+
+
+class SeasonProcessor(esper.Processor):
+    """Keeps a seasonal world's climate slice in step with the calendar."""
+
+    def __init__(self, world_gen=None):
+        self.world_gen = world_gen
+
+    def process(self, dt: float = 1 / 60):
+        """Prefetch or switch season slices as the days pass."""
+        if self.world_gen is None or getattr(self.world_gen, "seasons", None) is None:
+            return
+        for ent, (time,) in esper.get_components(TimeOfDay):
+            self.world_gen.update_season(time.day_count, time.hour)
 
 
 class WeatherProcessor(esper.Processor):
     """Manages weather changes."""
 
-    def __init__(self):
+    def __init__(self, rng=None):
         self.transition_speed = 0.1
+        self.rng = rng if rng is not None else random
 
     def process(self, dt: float = 1 / 60):
         """Update weather state."""
@@ -199,8 +428,9 @@ class WeatherProcessor(esper.Processor):
             if weather.duration <= 0:
                 self._change_weather(weather)
 
-            weather.wind_angle += random.uniform(-0.1, 0.1) * dt
-            weather.wind_speed = max(0, weather.wind_speed + random.uniform(-0.5, 0.5) * dt)
+            weather.wind_angle += self.rng.uniform(-0.1, 0.1) * dt
+            weather.wind_speed = max(0, weather.wind_speed + self.rng.uniform(-0.5, 0.5) * dt)
+            changes.mark(Weather, ent)
 
     def _change_weather(self, weather: Weather):
         """Transition to new weather."""
@@ -213,7 +443,7 @@ class WeatherProcessor(esper.Processor):
         ]
 
         total = sum(w for _, w in choices)
-        r = random.random() * total
+        r = self.rng.random() * total
         cumulative = 0
         for weather_type, weight in choices:
             cumulative += weight
@@ -221,29 +451,130 @@ class WeatherProcessor(esper.Processor):
                 weather.current = weather_type
                 break
 
-        weather.duration = random.uniform(60, 300)
-        weather.intensity = random.uniform(0.3, 1.0)
+        weather.duration = self.rng.uniform(60, 300)
+        weather.intensity = self.rng.uniform(0.3, 1.0)
 
         if weather.current == WeatherType.STORM:
-            weather.wind_speed = random.uniform(3, 6)
+            weather.wind_speed = self.rng.uniform(3, 6)
         elif weather.current == WeatherType.RAIN:
-            weather.wind_speed = random.uniform(1, 3)
+            weather.wind_speed = self.rng.uniform(1, 3)
         else:
-            weather.wind_speed = random.uniform(0, 1)
+            weather.wind_speed = self.rng.uniform(0, 1)
 
 
 class CombatProcessor(esper.Processor):
-    """Handles combat between entities."""
+    """Handles combat between entities.
+
+    Attack cooldowns count down every tick. An enemy in the attacking
+    state hits the player once its cooldown has run out, unless the
+    player dodges. Hits are collected in hits as (enemy name, damage)
+    for the game to apply to its Player (see GameWorld.take_player_hits).
+    """
+
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random
+        self.hits = []
 
     def process(self, dt: float = 1 / 60):
-        """Update combat state."""
+        """Update cooldowns and let attacking enemies hit the player."""
         for ent, (combat,) in esper.get_components(Combat):
             if combat.attack_cooldown > 0:
                 combat.attack_cooldown -= dt
+                changes.mark(Combat, ent)
+
+        player = next(((pos, combat) for _, (pos, combat, _) in esper.get_components(Position, Combat, PlayerTag)), None)
+        if player is None:
+            return
+        player_pos, player_combat = player
+        for ent, (pos, combat, enemy) in esper.get_components(Position, Combat, EnemyTag):
+            if enemy.state != "attacking" or combat.attack_cooldown > 0:
+                continue
+            if math.hypot(pos.x - player_pos.x, pos.y - player_pos.y) > enemy.attack_range:
+                continue
+            combat.attack_cooldown = ENEMY_ATTACK_COOLDOWN
+            changes.mark(Combat, ent)
+            if self.rng.random() >= player_combat.dodge_chance:
+                self.hits.append((enemy.name, combat.attack_damage))
 
 
 class AIProcessor(esper.Processor):
-    """Simple AI for enemies."""
+    """Simple AI for enemies.
+
+    Chasing enemies near the player follow a shared flow field toward the
+    player's tile. Farther away, with a pathfinder, they follow a walkable
+    path instead of steering straight at the player. Paths are kept per
+    enemy and only searched again when the player changes tile or the
+    enemy leaves its path, at most max_path_searches per tick.
+
+    With line of sight, enemies only notice the player within the
+    player's current sight radius (biome, weather, time of day) and with
+    no opaque tile in between. All candidates are checked in one batched
+    query per tick.
+    """
+
+    def __init__(self, rng=None, pathfinder=None, max_path_searches: int = 8, flow_field=None, line_of_sight=None):
+        self.rng = rng if rng is not None else random
+        self.pathfinder = pathfinder
+        self.flow_field = flow_field
+        self.line_of_sight = line_of_sight
+        self.max_path_searches = max_path_searches
+        self._paths = {}  # entity -> (goal tile, path list or None if unreachable)
+        self._searches_left = 0
+
+    def _chase_target(self, ent: int, pos: Position, player_pos: Position):
+        """Get the point a chasing enemy should steer toward."""
+        goal = (math.floor(player_pos.x), math.floor(player_pos.y))
+        if self.flow_field is not None:
+            # Recomputes only when the player changed tile
+            self.flow_field.update(goal)
+            target = self.flow_field.sample(pos.x, pos.y)
+            if target is not None:
+                return target
+
+        if self.pathfinder is None:
+            return player_pos.x, player_pos.y
+
+        start = (math.floor(pos.x), math.floor(pos.y))
+        cached = self._paths.get(ent)
+        if cached is None or cached[0] != goal or (cached[1] is not None and start not in cached[1]):
+            if self._searches_left <= 0:
+                return player_pos.x, player_pos.y
+            self._searches_left -= 1
+            cached = (goal, self.pathfinder.find_path(start, goal))
+            self._paths[ent] = cached
+
+        path = cached[1]
+        if path is None:
+            return player_pos.x, player_pos.y
+        del path[: path.index(start)]
+        if len(path) < 2:
+            return player_pos.x, player_pos.y
+        return path[1][0] + 0.5, path[1][1] + 0.5
+
+    def _detecting(self, player_pos: Position, enemies) -> set:
+        """Get the idle or wandering enemies that notice the player this tick."""
+        candidates = [
+            (ent, pos)
+            for ent, (pos, vel, enemy) in enemies
+            if enemy.state in ("idle", "wandering")
+            and math.hypot(pos.x - player_pos.x, pos.y - player_pos.y) < enemy.detection_range
+        ]
+        if self.line_of_sight is None or not candidates:
+            return {ent for ent, _ in candidates}
+
+        player_x = math.floor(player_pos.x)
+        player_y = math.floor(player_pos.y)
+        sight = current_view_radius(self.line_of_sight.world, player_x, player_y)
+        candidates = [
+            (ent, pos) for ent, pos in candidates if math.hypot(pos.x - player_pos.x, pos.y - player_pos.y) <= sight
+        ]
+        seen = self.line_of_sight.visible_many(
+            player_x,
+            player_y,
+            [math.floor(pos.x) for _, pos in candidates],
+            [math.floor(pos.y) for _, pos in candidates],
+        )
+        return {ent for (ent, _), ok in zip(candidates, seen.tolist()) if ok}
 
     def process(self, dt: float = 1 / 60):
         """Update enemy AI."""
@@ -255,18 +586,25 @@ class AIProcessor(esper.Processor):
         if player_pos is None:
             return
 
-        for ent, (pos, vel, enemy) in esper.get_components(Position, Velocity, EnemyTag):
+        enemies = esper.get_components(Position, Velocity, EnemyTag)
+        detecting = self._detecting(player_pos, enemies)
+
+        self._searches_left = self.max_path_searches
+        chasing = set()
+        for ent, (pos, vel, enemy) in enemies:
             dist_to_player = math.sqrt(
                 (pos.x - player_pos.x) ** 2 +
                 (pos.y - player_pos.y) ** 2
             )
+            detects_player = ent in detecting
+            state, dx, dy = enemy.state, vel.dx, vel.dy
 
             if enemy.state == "idle":
-                if dist_to_player < enemy.detection_range:
+                if detects_player:
                     enemy.state = "chasing"
-                elif random.random() < 0.01:
+                elif self.rng.random() < 0.01:
                     enemy.state = "wandering"
-                    enemy.wander_timer = random.uniform(2, 5)
+                    enemy.wander_timer = self.rng.uniform(2, 5)
 
             elif enemy.state == "wandering":
                 enemy.wander_timer -= dt
@@ -274,11 +612,11 @@ class AIProcessor(esper.Processor):
                     enemy.state = "idle"
                     vel.dx = 0
                     vel.dy = 0
-                elif random.random() < 0.1:
-                    vel.dx = random.uniform(-1, 1) * vel.max_speed
-                    vel.dy = random.uniform(-1, 1) * vel.max_speed
+                elif self.rng.random() < 0.1:
+                    vel.dx = self.rng.uniform(-1, 1) * vel.max_speed
+                    vel.dy = self.rng.uniform(-1, 1) * vel.max_speed
 
-                if dist_to_player < enemy.detection_range:
+                if detects_player:
                     enemy.state = "chasing"
 
             elif enemy.state == "chasing":
@@ -291,8 +629,10 @@ class AIProcessor(esper.Processor):
                     vel.dx = 0
                     vel.dy = 0
                 else:
-                    dx = player_pos.x - pos.x
-                    dy = player_pos.y - pos.y
+                    chasing.add(ent)
+                    target_x, target_y = self._chase_target(ent, pos, player_pos)
+                    dx = target_x - pos.x
+                    dy = target_y - pos.y
                     length = math.sqrt(dx * dx + dy * dy)
                     if length > 0:
                         vel.dx = (dx / length) * vel.max_speed
@@ -302,6 +642,76 @@ class AIProcessor(esper.Processor):
                 if dist_to_player > enemy.attack_range:
                     enemy.state = "chasing"
 
+            # Wandering also counts down its timer
+            if enemy.state != state or state == "wandering":
+                changes.mark(EnemyTag, ent)
+            if vel.dx != dx or vel.dy != dy:
+                changes.mark(Velocity, ent)
+
+        # Forget paths of enemies that stopped chasing or no longer exist
+        for ent in [ent for ent in self._paths if ent not in chasing]:
+            del self._paths[ent]
+
+
+class SpawnProcessor(esper.Processor):
+    """Keeps the chunks around the player populated with enemies.
+
+    Each chunk within SPAWN_RADIUS of the player's chunk has a population
+    budget of CHUNK_POPULATION_CAP scaled by the world's spawn chance at
+    its center. Missing enemies appear at SPAWN_RATE each per second on
+    random walkable tiles out of the player's immediate view; all of a
+    tick's spawns are checked in one batched walkability query and
+    created together. Enemies that die or fall behind beyond
+    DESPAWN_DISTANCE are despawned, their IDs and components recycled.
+    """
+
+    def __init__(self, world_gen=None, rng=None, pool: "EntityPool" = None):
+        self.world_gen = world_gen
+        self.rng = rng if rng is not None else random
+        self.pool = pool if pool is not None else EntityPool()
+
+    def chunk_budget(self, chunk_x: int, chunk_y: int) -> int:
+        """Get the number of enemies a chunk should hold."""
+        center = (chunk_x << CHUNK_SHIFT) + (1 << CHUNK_SHIFT) // 2, (chunk_y << CHUNK_SHIFT) + (1 << CHUNK_SHIFT) // 2
+        return round(CHUNK_POPULATION_CAP * self.world_gen.get_spawn_chance(*center))
+
+    def process(self, dt: float = 1 / 60):
+        """Despawn distant or dead enemies and top up nearby chunks."""
+        if self.world_gen is None:
+            return
+        player_pos = next((pos for _, (pos, _) in esper.get_components(Position, PlayerTag)), None)
+        if player_pos is None:
+            return
+
+        population = {}
+        gone = []
+        for ent, (pos, health, _) in esper.get_components(Position, Health, EnemyTag):
+            if health.current <= 0 or math.hypot(pos.x - player_pos.x, pos.y - player_pos.y) > DESPAWN_DISTANCE:
+                gone.append(ent)
+            else:
+                key = (math.floor(pos.x) >> CHUNK_SHIFT, math.floor(pos.y) >> CHUNK_SHIFT)
+                population[key] = population.get(key, 0) + 1
+        despawn_enemies(gone, self.pool)
+
+        candidates = []
+        player_cx = math.floor(player_pos.x) >> CHUNK_SHIFT
+        player_cy = math.floor(player_pos.y) >> CHUNK_SHIFT
+        for cy in range(player_cy - SPAWN_RADIUS, player_cy + SPAWN_RADIUS + 1):
+            for cx in range(player_cx - SPAWN_RADIUS, player_cx + SPAWN_RADIUS + 1):
+                missing = self.chunk_budget(cx, cy) - population.get((cx, cy), 0)
+                if missing <= 0 or self.rng.random() >= SPAWN_RATE * missing * dt:
+                    continue
+                x = (cx << CHUNK_SHIFT) + self.rng.randrange(1 << CHUNK_SHIFT)
+                y = (cy << CHUNK_SHIFT) + self.rng.randrange(1 << CHUNK_SHIFT)
+                if math.hypot(x + 0.5 - player_pos.x, y + 0.5 - player_pos.y) >= MIN_SPAWN_DISTANCE:
+                    candidates.append((x, y))
+        if not candidates:
+            return
+
+        walkable = self.world_gen.is_walkable_many([x for x, _ in candidates], [y for _, y in candidates]).tolist()
+        spawns = [(x + 0.5, y + 0.5, self.rng.choice(ENEMY_TYPES)["name"]) for (x, y), ok in zip(candidates, walkable) if ok]
+        spawn_enemies(spawns, rng=self.rng, pool=self.pool)
+
 
 class HealthRegenProcessor(esper.Processor):
     """Regenerates health over time."""
@@ -314,6 +724,7 @@ class HealthRegenProcessor(esper.Processor):
                     health.maximum,
                     health.current + health.regen_rate * dt
                 )
+                changes.mark(Health, ent)
 
 
 class StaminaRegenProcessor(esper.Processor):
@@ -327,6 +738,7 @@ class StaminaRegenProcessor(esper.Processor):
                     stamina.maximum,
                     stamina.current + stamina.regen_rate * dt
                 )
+                changes.mark(Stamina, ent)
 
 
 class GameWorld:
@@ -335,24 +747,217 @@ class GameWorld:
     Provides a simple interface for the game to interact with ECS.
     """
 
-    def __init__(self):
-        """Initialize the game world with all systems."""
+    def __init__(self, rng=None, world_gen=None):
+        """Initialize the game world with all systems.
+
+        Args:
+            rng: Optional RNGService; each processor gets its own stream
+            world_gen: Optional ProceduralWorld used for movement collision and enemy pathfinding
+        """
+        self.rng = rng
+        self.world_gen = world_gen
+        # Terrain layer -> (pathfinder, flow field, field of view, line of sight), most recently used last
+        self._services = OrderedDict()
+        self._use_services(world_gen)
+
         # Clear any existing state
         esper.clear_database()
-
-        # Add processors in execution order
-        esper.add_processor(MovementProcessor())
-        esper.add_processor(TimeProcessor())
-        esper.add_processor(WeatherProcessor())
-        esper.add_processor(AIProcessor())
-        esper.add_processor(CombatProcessor())
-        esper.add_processor(HealthRegenProcessor())
-        esper.add_processor(StaminaRegenProcessor())
+        changes.reset()
+        self._enemy_chunks = {}  # chunk -> {enemy entity: tile}
+        self._enemy_chunk_of = {}  # enemy entity -> chunk
+        self._indexed_tick = None  # tick of the last index update, None before the first full scan
+
+        # Add processors in execution order, replacing those of any
+        # previous GameWorld (clear_database keeps processors)
+        for processor in (
+            MovementProcessor(world_gen=world_gen),
+            TimeProcessor(),
+            SeasonProcessor(world_gen=world_gen),
+            WeatherProcessor(rng=rng.stream("weather") if rng is not None else None),
+            AIProcessor(
+                rng=rng.stream("ai") if rng is not None else None,
+                pathfinder=self.pathfinder,
+                flow_field=self.flow_field,
+                line_of_sight=self.line_of_sight,
+            ),
+            SpawnProcessor(world_gen=world_gen, rng=rng.stream("spawn") if rng is not None else None),
+            CombatProcessor(rng=rng.stream("combat") if rng is not None else None),
+            HealthRegenProcessor(),
+            StaminaRegenProcessor(),
+        ):
+            esper.remove_processor(type(processor))
+            esper.add_processor(processor)
 
         # Create singleton entities for global state
-        esper.create_entity(TimeOfDay(hour=8.0, phase=TimePhase.DAY))
-        esper.create_entity(Weather(current=WeatherType.CLEAR, duration=120.0))
-        esper.create_entity(WorldState())
+        for component in (TimeOfDay(hour=8.0, phase=TimePhase.DAY), Weather(current=WeatherType.CLEAR, duration=120.0), WorldState()):
+            changes.mark(type(component), esper.create_entity(component))
+
+    def set_terrain(self, world_gen):
+        """Switch the terrain used for collision, pathfinding and sight, e.g. on entering a cave.
+
+        Args:
+            world_gen: ProceduralWorld or CaveLayer to use from now on
+        """
+        self.world_gen = world_gen
+        self._use_services(world_gen)
+
+        esper.get_processor(MovementProcessor).world_gen = world_gen
+        esper.get_processor(SpawnProcessor).world_gen = world_gen
+        ai = esper.get_processor(AIProcessor)
+        ai.pathfinder = self.pathfinder
+        ai.flow_field = self.flow_field
+        ai.line_of_sight = self.line_of_sight
+        ai._paths.clear()
+
+        # Enemies belong to the layer they spawned on
+        enemies = [ent for ent, _ in esper.get_component(EnemyTag)]
+        despawn_enemies(enemies, esper.get_processor(SpawnProcessor).pool)
+
+    def _use_services(self, world_gen):
+        """Switch to a layer's pathfinding and sight services, reusing them if the layer was used recently."""
+        if world_gen is None:
+            self.pathfinder = self.flow_field = self.fov = self.line_of_sight = None
+            return
+        services = self._services.pop(world_gen, None)
+        if services is None:
+            services = (HierarchicalPathfinder(world_gen), FlowField(world_gen), FieldOfView(world_gen), LineOfSight(world_gen))
+        self._services[world_gen] = services
+        while len(self._services) > MAX_TERRAIN_SERVICES:
+            _, stale = self._services.popitem(last=False)
+            self._close_services(stale)
+        self.pathfinder, self.flow_field, self.fov, self.line_of_sight = services
+
+    @staticmethod
+    def _close_services(services):
+        pathfinder, flow_field, fov, line_of_sight = services
+        pathfinder.close()
+        flow_field.close()
+        fov.close()
+        line_of_sight.close()
+
+    def close(self):
+        """Detach all pathfinding and sight services from their layers' eviction listeners."""
+        for services in self._services.values():
+            self._close_services(services)
+        self._services.clear()
+
+    def place_player(self, x: float, y: float):
+        """Move the player's entity (creating it if needed) so systems can track the player.
+
+        Args:
+            x: Player X position
+            y: Player Y position
+        """
+        for ent, (pos, player) in esper.get_components(Position, PlayerTag):
+            pos.x = x
+            pos.y = y
+            changes.mark(Position, ent)
+            return
+        create_player(x, y)
+
+    def enemy_in_reach(self, dx: int, dy: int, reach: float = PLAYER_REACH):
+        """Get the nearest enemy within reach of the player on the side of a direction.
+
+        Args:
+            dx: X direction (-1, 0, or 1)
+            dy: Y direction (-1, 0, or 1)
+            reach: Maximum distance in tiles
+
+        Returns:
+            Enemy entity ID, or None
+        """
+        player_pos = next((pos for _, (pos, _) in esper.get_components(Position, PlayerTag)), None)
+        if player_pos is None:
+            return None
+        nearest, best = None, reach
+        for ent, (pos, enemy) in esper.get_components(Position, EnemyTag):
+            ox, oy = pos.x - player_pos.x, pos.y - player_pos.y
+            distance = math.hypot(ox, oy)
+            if ox * dx + oy * dy > 0 and distance <= best:
+                nearest, best = ent, distance
+        return nearest
+
+    def strike_enemy(self, ent: int, bonus: int = 0):
+        """Hit an enemy with the player's attack, despawning it if it dies.
+
+        Args:
+            ent: Enemy entity ID
+            bonus: Damage added to the player's attack damage (e.g. from gear)
+
+        Returns:
+            Tuple of (enemy name, damage dealt, whether it died)
+        """
+        damage = bonus
+        for _, (combat, _) in esper.get_components(Combat, PlayerTag):
+            damage += combat.attack_damage
+        health = esper.component_for_entity(ent, Health)
+        name = esper.component_for_entity(ent, EnemyTag).name
+        health.current -= damage
+        changes.mark(Health, ent)
+        if health.current <= 0:
+            despawn_enemies([ent], esper.get_processor(SpawnProcessor).pool)
+            return name, damage, True
+        return name, damage, False
+
+    def take_player_hits(self) -> list:
+        """Get and clear the hits enemies dealt the player since the last call.
+
+        Returns:
+            List of (enemy name, damage)
+        """
+        combat = esper.get_processor(CombatProcessor)
+        hits, combat.hits = combat.hits, []
+        return hits
+
+    def _index_enemy(self, ent: int, x: int, y: int):
+        """File an enemy under the chunk of its tile."""
+        chunk = (x >> CHUNK_SHIFT, y >> CHUNK_SHIFT)
+        old = self._enemy_chunk_of.get(ent)
+        if old is not None and old != chunk:
+            del self._enemy_chunks[old][ent]
+        self._enemy_chunks.setdefault(chunk, {})[ent] = (x, y)
+        self._enemy_chunk_of[ent] = chunk
+
+    def _unindex_enemy(self, ent: int):
+        chunk = self._enemy_chunk_of.pop(ent, None)
+        if chunk is not None:
+            del self._enemy_chunks[chunk][ent]
+
+    def _update_enemy_index(self):
+        """Bring the per-chunk enemy index up to date from the changes since the last update."""
+        if self._indexed_tick is None or not changes.covers(self._indexed_tick):
+            # Entities may have been created without tracking, e.g. by loading a save,
+            # or removed longer ago than the tracker remembers
+            self._enemy_chunks.clear()
+            self._enemy_chunk_of.clear()
+            for ent, (pos, enemy) in esper.get_components(Position, EnemyTag):
+                self._index_enemy(ent, math.floor(pos.x), math.floor(pos.y))
+        else:
+            for ent in changes.removed_since(self._indexed_tick):
+                self._unindex_enemy(ent)
+            for ent in changes.changed_since(Position, self._indexed_tick):
+                if ent in self._enemy_chunk_of or esper.has_component(ent, EnemyTag):
+                    pos = esper.component_for_entity(ent, Position)
+                    self._index_enemy(ent, math.floor(pos.x), math.floor(pos.y))
+        self._indexed_tick = changes.tick
+
+    def enemies_in_view(self, x0: int, y0: int, width: int, height: int):
+        """Get the enemies inside a rectangle of tiles, e.g. the camera view.
+
+        Only enemies that moved, appeared or vanished since the last call
+        are looked at; the rest come from a per-chunk index.
+
+        Returns:
+            List of (tile x, tile y, Renderable)
+        """
+        self._update_enemy_index()
+        found = []
+        for cy in range(y0 >> CHUNK_SHIFT, ((y0 + height - 1) >> CHUNK_SHIFT) + 1):
+            for cx in range(x0 >> CHUNK_SHIFT, ((x0 + width - 1) >> CHUNK_SHIFT) + 1):
+                for ent, (x, y) in self._enemy_chunks.get((cx, cy), {}).items():
+                    if x0 <= x < x0 + width and y0 <= y < y0 + height:
+                        found.append((x, y, esper.component_for_entity(ent, Renderable)))
+        return found
 
     def process(self, dt: float = 1 / 60):
         """Process all systems.
@@ -360,16 +965,35 @@ class GameWorld:
         Args:
             dt: Delta time in seconds
         """
+        changes.advance()
         esper.process(dt)
 
+    def visible_area(self, x: int, y: int):
+        """Get the tiles visible from a tile under current conditions.
+
+        Args:
+            x: Viewer X tile
+            y: Viewer Y tile
+
+        Returns:
+            VisibilityMask, or None if the world has no terrain
+        """
+        if self.fov is None:
+            return None
+        return self.fov.compute(x, y, current_view_radius(self.world_gen, x, y))
 
-def create_game_world() -> GameWorld:
+
+def create_game_world(rng=None, world_gen=None) -> GameWorld:
     """Create and configure the ECS world with all systems.
 
+    Args:
+        rng: Optional RNGService for deterministic simulation
+        world_gen: Optional ProceduralWorld used for movement collision
+
     Returns:
         Configured GameWorld
     """
-    return GameWorld()
+    return GameWorld(rng=rng, world_gen=world_gen)
 
 
 def create_player(x: float = 5.0, y: float = 5.0) -> int:
@@ -382,7 +1006,7 @@ def create_player(x: float = 5.0, y: float = 5.0) -> int:
     Returns:
         Player entity ID
     """
-    return esper.create_entity(
+    components = (
         Position(x=x, y=y),
         Velocity(max_speed=3.0),
         Health(current=10, maximum=10, regen_rate=0.5),
@@ -391,13 +1015,158 @@ def create_player(x: float = 5.0, y: float = 5.0) -> int:
         PlayerTag(),
         Renderable(color=8, size=1, sprite_id="player"),
     )
+    ent = esper.create_entity(*components)
+    changes.mark_all(ent, [type(component) for component in components])
+    return ent
+
+
+# Component classes of an enemy entity, in the order _init_enemy takes them
+ENEMY_COMPONENTS = (Position, Velocity, Health, Combat, EnemyTag, Renderable)
+
+
+def _init_enemy(components: tuple, x: float, y: float, name: str, is_boss: bool, rng):
+    """Roll an enemy's stats into its components, fresh or recycled, resetting every field in place."""
+    position, velocity, health, combat, tag, renderable = components
+    hp = 20 if is_boss else rng.randint(3, 8)
+    damage = 5 if is_boss else rng.randint(1, 3)
+    # Positional arguments, in field order, so no keyword dict is built per spawn
+    Position.__init__(position, x, y)
+    Velocity.__init__(velocity, 0.0, 0.0, 1.0 if is_boss else 1.5)
+    Health.__init__(health, hp, hp, 0.0)
+    Combat.__init__(combat, damage, 0.0, 0.1, 0.0, False)
+    EnemyTag.__init__(tag, name, "idle", 8.0 if is_boss else 5.0, 2.0 if is_boss else 1.5, is_boss, 0.0)
+    if is_boss:
+        Renderable.__init__(renderable, 8, 2, True, "boss")
+    else:
+        Renderable.__init__(renderable, 9, 1, True, "enemy")
+
+
+class EntityPool:
+    """Recycles despawned entities: their entity IDs and component instances.
+
+    A released entity is not deleted from the database. Its components are
+    detached and parked with its ID, keyed by its tuple of component
+    classes; acquiring an entity of the same kind reattaches them under the
+    same ID, for the caller to reinitialize in place. Steady-state spawning
+    and despawning then allocates neither components nor entities.
+
+    The counters cover entity and component reuse only. Small per-call
+    objects (a released entity's class and component tuples, the caller's
+    arguments) are still allocated and are not counted.
+    """
+
+    def __init__(self, limit: int = 64):
+        """Initialize the pool.
+
+        Args:
+            limit: Maximum number of released entities kept; beyond it they are deleted
+        """
+        self.limit = limit
+        self.created = 0  # entities allocated with fresh components
+        self.reused = 0  # entities taken from the pool
+        self.released = 0  # entities parked in the pool
+        self.discarded = 0  # entities deleted because the pool was full
+        self._free = {}  # tuple of component classes -> list of (entity, components)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def acquire(self, kinds: tuple):
+        """Get an entity with the given component classes, recycled if possible.
+
+        Fresh components hold their defaults and recycled ones their
+        previous values, so the caller reinitializes them either way.
+
+        Args:
+            kinds: Tuple of component classes, in the order they were attached
+
+        Returns:
+            Tuple of (entity ID, components in the order of kinds)
+        """
+        free = self._free.get(kinds)
+        if not free:
+            self.created += 1
+            components = tuple(cls() for cls in kinds)
+            return esper.create_entity(*components), components
+
+        ent, components = free.pop()
+        self._size -= 1
+        for component in components:
+            esper.add_component(ent, component)
+        self.reused += 1
+        return ent, components
+
+    def release(self, ent: int):
+        """Despawn an entity into the pool, or delete it if the pool is full."""
+        if self._size >= self.limit:
+            esper.delete_entity(ent, immediate=True)
+            self.discarded += 1
+            return
+        kinds = tuple(type(component) for component in esper.components_for_entity(ent))
+        components = tuple(esper.remove_component(ent, cls) for cls in kinds)
+        self._free.setdefault(kinds, []).append((ent, components))
+        self._size += 1
+        self.released += 1
+
+    def stats(self) -> dict:
+        """Get the allocation counters, e.g. to check for churn in steady-state play."""
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "released": self.released,
+            "discarded": self.discarded,
+            "pooled": self._size,
+        }
+
+
+def spawn_enemies(spawns, rng=None, pool: EntityPool = None, is_boss: bool = False) -> list:
+    """Create a batch of enemy entities.
+
+    Args:
+        spawns: Iterable of (x, y, name)
+        rng: Random stream for stat rolls (defaults to the random module)
+        pool: Optional EntityPool to take entities from
+        is_boss: Whether these are boss enemies
+
+    Returns:
+        List of enemy entity IDs, in the order of spawns
+    """
+    rng = rng if rng is not None else random
+    entities = []
+    for x, y, name in spawns:
+        if pool is None:
+            components = tuple(cls() for cls in ENEMY_COMPONENTS)
+            ent = esper.create_entity(*components)
+        else:
+            ent, components = pool.acquire(ENEMY_COMPONENTS)
+        _init_enemy(components, x, y, name, is_boss, rng)
+        changes.mark_all(ent, ENEMY_COMPONENTS)
+        entities.append(ent)
+    return entities
+
+
+def despawn_enemies(entities, pool: EntityPool = None):
+    """Delete enemy entities, or return them to a pool.
+
+    Args:
+        entities: Enemy entity IDs
+        pool: Optional EntityPool that receives them
+    """
+    for ent in entities:
+        if pool is not None:
+            pool.release(ent)
+        else:
+            esper.delete_entity(ent, immediate=True)
+        changes.remove(ent)
 
 
 def create_enemy(
     x: float,
     y: float,
     name: str = "Goblin",
-    is_boss: bool = False
+    is_boss: bool = False,
+    rng=None,
 ) -> int:
     """Create an enemy entity.
 
@@ -406,27 +1175,9 @@ def create_enemy(
         y: Y position
         name: Enemy name
         is_boss: Whether this is a boss enemy
+        rng: Random stream for stat rolls (defaults to the random module)
 
     Returns:
         Enemy entity ID
     """
-    health = 20 if is_boss else random.randint(3, 8)
-    damage = 5 if is_boss else random.randint(1, 3)
-
-    return esper.create_entity(
-        Position(x=x, y=y),
-        Velocity(max_speed=1.5 if not is_boss else 1.0),
-        Health(current=health, maximum=health),
-        Combat(attack_damage=damage),
-        EnemyTag(
-            name=name,
-            is_boss=is_boss,
-            detection_range=8.0 if is_boss else 5.0,
-            attack_range=2.0 if is_boss else 1.5,
-        ),
-        Renderable(
-            color=8 if is_boss else 9,
-            size=2 if is_boss else 1,
-            sprite_id="boss" if is_boss else "enemy"
-        ),
-    )
+    return spawn_enemies([(x, y, name)], rng=rng, is_boss=is_boss)[0]
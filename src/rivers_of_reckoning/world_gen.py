@@ -4,16 +4,28 @@ Inspired by Otterfall's SDF-based terrain and biome systems.
 Uses noise functions to generate coherent, natural-looking worlds.
 """
 
+import abc
+import math
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Tuple, List
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
 from opensimplex import OpenSimplex
 
+from .climate import ClimateLattice
+from .distance import distance_transform
+from .hydrology import Hydrology
+from .noise import fbm2, noise2
+from .rng import CHANNEL_POI, CHANNEL_TILES, hash_positions, random_at, random_at_many
+from .seasons import PREFETCH_BUDGET, PREFETCH_HOURS, SeasonalClimate, hours_until_next_season, season_index
+
 # Initialize noise generators with different seeds for variety
 TERRAIN_NOISE = OpenSimplex(seed=42)
 MOISTURE_NOISE = OpenSimplex(seed=137)
 TEMPERATURE_NOISE = OpenSimplex(seed=256)
-CAVE_NOISE = OpenSimplex(seed=789)
 
 
 class BiomeType(Enum):
@@ -37,6 +49,7 @@ class TileType(Enum):
     ROCK = "R"
     CAVE_FLOOR = "_"
     CAVE_WALL = "X"
+    ROAD = "="
 
 
 @dataclass
@@ -124,6 +137,73 @@ BIOME_CONFIGS = {
 }
 
 
+# Chunk geometry: the world is generated and cached in square chunks
+CHUNK_SHIFT = 4
+CHUNK_SIZE = 1 << CHUNK_SHIFT
+CHUNK_MASK = CHUNK_SIZE - 1
+
+# Tiles that block movement
+BLOCKING_TILES = (TileType.WATER, TileType.TREE, TileType.ROCK, TileType.STONE, TileType.CAVE_WALL)
+
+# Tiles that block sight
+OPAQUE_TILES = (TileType.TREE, TileType.ROCK, TileType.STONE, TileType.CAVE_WALL)
+
+# Cave noise level a chunk's best walkable tile must exceed to hold a cave entrance
+CAVE_ENTRANCE_LEVEL = 0.83
+
+# Points of interest: candidate sites per chunk, chance each is active,
+# minimum spacing in tiles (at most CHUNK_SIZE), per-region index size in chunks
+# and regions the index keeps
+POI_CANDIDATES = 2
+POI_CHANCE = 0.4
+POI_SPACING = 10
+POI_REGION_SHIFT = 3
+POI_MAX_REGIONS = 256
+
+# Tiles each distance field measures to (see ChunkedLayer.distance_to)
+DISTANCE_FEATURES = {
+    "water": (TileType.WATER,),
+    "cover": (TileType.TREE,),
+    "walls": BLOCKING_TILES,
+}
+
+# Hillshade: terrain relief in tiles of height per unit of the terrain field,
+# light from the north-west 45 degrees up, and how far a tile's lighting
+# must differ from flat ground to be shaded dark or lit
+HILLSHADE_RELIEF = 4.0
+HILLSHADE_LIGHT = (-0.5, -0.5, math.sqrt(0.5))
+HILLSHADE_THRESHOLD = 0.15
+SHADE_DARK, SHADE_FLAT, SHADE_LIT = 0, 1, 2
+
+# Stamina cost multiplier for travelling on a road, on top of the biome's
+ROAD_STAMINA_FACTOR = 0.5
+
+# Integer codes used by chunk arrays (index into these lists)
+TILE_TYPES = list(TileType)
+BIOME_TYPES = list(BiomeType)
+TILE_CODES = {tile: i for i, tile in enumerate(TILE_TYPES)}
+BIOME_CODES = {biome: i for i, biome in enumerate(BIOME_TYPES)}
+WALKABLE_LUT = np.array([tile not in BLOCKING_TILES for tile in TILE_TYPES], dtype=bool)
+OPAQUE_LUT = np.array([tile in OPAQUE_TILES for tile in TILE_TYPES], dtype=bool)
+DISTANCE_FIELDS = list(DISTANCE_FEATURES)
+DISTANCE_LUT = np.array([[tile in features for tile in TILE_TYPES] for features in DISTANCE_FEATURES.values()], dtype=bool)
+
+# Display color of each tile in each biome, indexed [biome code, tile code] (see ProceduralWorld.get_color)
+_TILE_COLORS = {
+    TileType.WATER: 12,  # Blue
+    TileType.TREE: 11,  # Light green
+    TileType.ROCK: 13,  # Gray
+    TileType.STONE: 5,  # Dark gray
+    TileType.SAND: 10,  # Yellow
+    TileType.DIRT: 4,  # Brown
+    TileType.ROAD: 15,  # Peach
+}
+COLOR_LUT = np.array(
+    [[_TILE_COLORS.get(tile, BIOME_CONFIGS[biome].base_color) for tile in TILE_TYPES] for biome in BIOME_TYPES],
+    dtype=np.uint8,
+)
+
+
 def fbm(noise: OpenSimplex, x: float, y: float, octaves: int = 4, persistence: float = 0.5) -> float:
     """Fractal Brownian Motion - layered noise for natural-looking terrain.
 
@@ -234,25 +314,7 @@ def get_biome_at(x: int, y: int) -> BiomeType:
     return determine_biome(moisture, temperature)
 
 
-def is_cave_entrance(x: int, y: int, scale: float = 0.15) -> bool:
-    """Check if this position should be a cave entrance.
-
-    Uses noise to place caves semi-randomly but coherently.
-
-    Args:
-        x: X coordinate
-        y: Y coordinate
-        scale: Noise scale
-
-    Returns:
-        True if this should be a cave entrance
-    """
-    cave_value = CAVE_NOISE.noise2(x * scale, y * scale)
-    # Caves are rare - only spawn at very specific noise values
-    return 0.85 < cave_value < 0.9
-
-
-def generate_tile(x: int, y: int, biome: BiomeType, terrain_value: float) -> TileType:
+def generate_tile(x: int, y: int, biome: BiomeType, terrain_value: float, seed: int = 0) -> TileType:
     """Generate a tile type based on biome and terrain.
 
     Args:
@@ -260,15 +322,15 @@ def generate_tile(x: int, y: int, biome: BiomeType, terrain_value: float) -> Til
         y: Y coordinate
         biome: The biome at this position
         terrain_value: Terrain elevation [-1, 1]
+        seed: World seed keying the decoration hash
 
     Returns:
         TileType for this position
     """
     config = BIOME_CONFIGS[biome]
 
-    # Use deterministic randomness based on position
-    rand_seed = (x * 73856093) ^ (y * 19349663)
-    rand_val = ((rand_seed % 1000) / 1000.0)
+    # Use deterministic randomness based on seed and position
+    rand_val = random_at(seed, x, y, CHANNEL_TILES)
 
     # Water at low terrain values
     if terrain_value < -0.3:
@@ -299,26 +361,682 @@ def generate_tile(x: int, y: int, biome: BiomeType, terrain_value: float) -> Til
         return TileType.DIRT
 
 
-class ProceduralWorld:
+def determine_biomes(moisture: np.ndarray, temperature: np.ndarray) -> np.ndarray:
+    """Vectorized determine_biome over arrays.
+
+    Args:
+        moisture: Moisture levels [0, 1]
+        temperature: Temperature levels [0, 1]
+
+    Returns:
+        Array of biome codes (indices into BIOME_TYPES)
+    """
+    return np.select(
+        [
+            temperature < 0.25,
+            (temperature > 0.75) & (moisture < 0.3),
+            moisture > 0.6,
+            moisture > 0.35,
+        ],
+        [
+            BIOME_CODES[BiomeType.TUNDRA],
+            BIOME_CODES[BiomeType.DESERT],
+            BIOME_CODES[BiomeType.MARSH],
+            BIOME_CODES[BiomeType.FOREST],
+        ],
+        BIOME_CODES[BiomeType.GRASSLAND],
+    ).astype(np.uint8)
+
+
+def _density_lut(*fields: str) -> np.ndarray:
+    """Per-biome cumulative density thresholds, summed like generate_tile."""
+    values = []
+    for biome in BIOME_TYPES:
+        config = BIOME_CONFIGS[biome]
+        total = getattr(config, fields[0])
+        for field in fields[1:]:
+            total = total + getattr(config, field)
+        values.append(total)
+    return np.array(values, dtype=np.float64)
+
+
+_WATER_LUT = _density_lut("water_density")
+_TREE_LUT = _density_lut("water_density", "tree_density")
+_ROCK_LUT = _density_lut("water_density", "tree_density", "rock_density")
+
+
+def generate_tiles(xs: np.ndarray, ys: np.ndarray, biomes: np.ndarray, terrain: np.ndarray, seed: int = 0) -> np.ndarray:
+    """Vectorized generate_tile over arrays of positions.
+
+    Args:
+        xs: Integer X coordinates
+        ys: Integer Y coordinates
+        biomes: Biome codes at each position
+        terrain: Terrain elevation [-1, 1] at each position
+        seed: World seed keying the decoration hash
+
+    Returns:
+        Array of tile codes (indices into TILE_TYPES)
+    """
+    rand_val = random_at_many(seed, xs, ys, CHANNEL_TILES)
+
+    is_biome = {biome: biomes == BIOME_CODES[biome] for biome in BIOME_TYPES}
+    base = np.select(
+        [
+            is_biome[BiomeType.DESERT],
+            is_biome[BiomeType.TUNDRA] & (rand_val > 0.7),
+            is_biome[BiomeType.TUNDRA],
+            is_biome[BiomeType.FOREST] | is_biome[BiomeType.GRASSLAND],
+            is_biome[BiomeType.MARSH] & (rand_val > 0.5),
+            is_biome[BiomeType.MARSH],
+        ],
+        [
+            TILE_CODES[TileType.SAND],
+            TILE_CODES[TileType.STONE],
+            TILE_CODES[TileType.GRASS],
+            TILE_CODES[TileType.GRASS],
+            TILE_CODES[TileType.DIRT],
+            TILE_CODES[TileType.GRASS],
+        ],
+        TILE_CODES[TileType.DIRT],
+    )
+    return np.select(
+        [
+            terrain < -0.3,
+            terrain > 0.6,
+            rand_val < _WATER_LUT[biomes],
+            rand_val < _TREE_LUT[biomes],
+            rand_val < _ROCK_LUT[biomes],
+        ],
+        [
+            TILE_CODES[TileType.WATER],
+            TILE_CODES[TileType.ROCK],
+            TILE_CODES[TileType.WATER],
+            TILE_CODES[TileType.TREE],
+            TILE_CODES[TileType.ROCK],
+        ],
+        base,
+    ).astype(np.uint8)
+
+
+class POIType(Enum):
+    """Kinds of point of interest placed in the world."""
+    CHEST = auto()
+    SHRINE = auto()
+    SHOP = auto()
+    CAVE_MOUTH = auto()
+
+
+# Cumulative chance of each placed kind (cave mouths come from cave entrances)
+POI_KIND_WEIGHTS = ((POIType.CHEST, 0.5), (POIType.SHRINE, 0.8), (POIType.SHOP, 1.0))
+
+
+@dataclass(frozen=True)
+class PointOfInterest:
+    """A point of interest on one tile."""
+
+    x: int
+    y: int
+    kind: POIType
+
+
+def poi_candidates(seed: int, chunk_xs, chunk_ys) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Seeded candidate POI sites of chunks, POI_CANDIDATES per chunk.
+
+    Every field comes from one counter-based hash of (chunk, candidate),
+    so any chunk's candidates can be computed without generating it.
+
+    Args:
+        seed: World seed
+        chunk_xs: Chunk X coordinates (array-like)
+        chunk_ys: Chunk Y coordinates (array-like)
+
+    Returns:
+        Tuple of flat arrays (x, y, active, kind roll [0, 1), priority)
+    """
+    chunk_xs = np.repeat(np.asarray(chunk_xs, dtype=np.int64), POI_CANDIDATES)
+    chunk_ys = np.repeat(np.asarray(chunk_ys, dtype=np.int64), POI_CANDIDATES)
+    slots = np.tile(np.arange(POI_CANDIDATES), len(chunk_xs) // POI_CANDIDATES)
+    # Candidate slot in the high bits of x keeps every (chunk, slot) pair distinct
+    h = hash_positions(seed, chunk_xs + (slots << 40), chunk_ys, CHANNEL_POI)
+    xs = (chunk_xs << CHUNK_SHIFT) + (h & np.uint64(CHUNK_MASK)).astype(np.int64)
+    ys = (chunk_ys << CHUNK_SHIFT) + ((h >> np.uint64(4)) & np.uint64(CHUNK_MASK)).astype(np.int64)
+    active = ((h >> np.uint64(8)) & np.uint64(0xFFFF)) < int(POI_CHANCE * 0x10000)
+    kind_roll = ((h >> np.uint64(24)) & np.uint64(0xFFFF)).astype(np.float64) / 0x10000
+    priority = h >> np.uint64(40)
+    return xs, ys, active, kind_roll, priority
+
+
+def cave_entrance_peak(cave: np.ndarray, walkable: np.ndarray) -> Optional[Tuple[int, int]]:
+    """Find a chunk's cave entrance: its walkable cave-noise peak, if above CAVE_ENTRANCE_LEVEL.
+
+    Args:
+        cave: The chunk's cave noise [local_y, local_x]
+        walkable: The chunk's bool static road-free walkability [local_y, local_x]
+
+    Returns:
+        Local (y, x) of the entrance, or None
+    """
+    cave = np.where(walkable, cave, -np.inf)
+    peak = np.unravel_index(np.argmax(cave), cave.shape)
+    return (int(peak[0]), int(peak[1])) if cave[peak] > CAVE_ENTRANCE_LEVEL else None
+
+
+def place_pois(seed: int, chunk_x: int, chunk_y: int, walkable: np.ndarray) -> List[PointOfInterest]:
+    """Place a chunk's POIs with order-independent Poisson-disk thinning.
+
+    An active candidate survives if no active candidate with a higher
+    priority (in this or a neighbouring chunk) lies within POI_SPACING.
+    That only depends on the seed, so placement agrees across chunk
+    borders whatever order chunks are generated in. Survivors on blocked
+    tiles are dropped afterwards, so they still space their neighbours.
+
+    Args:
+        seed: World seed
+        chunk_x: Chunk X coordinate
+        chunk_y: Chunk Y coordinate
+        walkable: The chunk's bool walkability [local_y, local_x]
+
+    Returns:
+        List of PointOfInterest in the chunk
+    """
+    offsets = np.arange(-1, 2)
+    xs, ys, active, kind_roll, priority = poi_candidates(
+        seed, np.tile(offsets, 3) + chunk_x, np.repeat(offsets, 3) + chunk_y
+    )
+    xs, ys, kind_roll, priority = xs[active], ys[active], kind_roll[active], priority[active]
+    own = ((xs >> CHUNK_SHIFT) == chunk_x) & ((ys >> CHUNK_SHIFT) == chunk_y)
+
+    pois = []
+    for i in np.flatnonzero(own).tolist():
+        close = (xs - xs[i]) ** 2 + (ys - ys[i]) ** 2 < POI_SPACING**2
+        close[i] = False
+        if (priority[close] > priority[i]).any() or not walkable[ys[i] & CHUNK_MASK, xs[i] & CHUNK_MASK]:
+            continue
+        kind = next(kind for kind, cumulative in POI_KIND_WEIGHTS if kind_roll[i] < cumulative)
+        pois.append(PointOfInterest(int(xs[i]), int(ys[i]), kind))
+    return pois
+
+
+class POIIndex:
+    """Spatial index of generated POIs, bucketed by region and chunk.
+
+    Regions are kept in LRU order and the least recently used is dropped
+    past max_regions. POIs only depend on the seed, so a dropped chunk is
+    simply placed again the next time it is asked for.
+    """
+
+    def __init__(self, max_regions: int = POI_MAX_REGIONS):
+        """Initialize an empty index.
+
+        Args:
+            max_regions: Maximum number of regions kept
+        """
+        self.max_regions = max_regions
+        self._regions: "OrderedDict[Tuple[int, int], Dict[Tuple[int, int], List[PointOfInterest]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return sum(len(pois) for chunks in self._regions.values() for pois in chunks.values())
+
+    def add_chunk(self, chunk_x: int, chunk_y: int, pois: List[PointOfInterest]):
+        """Record a chunk's POIs (an empty list marks the chunk as indexed)."""
+        key = (chunk_x >> POI_REGION_SHIFT, chunk_y >> POI_REGION_SHIFT)
+        region = self._regions.get(key)
+        if region is None:
+            region = self._regions[key] = {}
+            while len(self._regions) > self.max_regions:
+                self._regions.popitem(last=False)
+        else:
+            self._regions.move_to_end(key)
+        region[(chunk_x, chunk_y)] = pois
+
+    def chunk(self, chunk_x: int, chunk_y: int) -> Optional[List[PointOfInterest]]:
+        """Get a chunk's POIs, or None if the chunk has not been indexed."""
+        key = (chunk_x >> POI_REGION_SHIFT, chunk_y >> POI_REGION_SHIFT)
+        region = self._regions.get(key)
+        if region is None:
+            return None
+        self._regions.move_to_end(key)
+        return region.get((chunk_x, chunk_y))
+
+
+def quantize_elevation(terrain: np.ndarray) -> np.ndarray:
+    """Quantize terrain values [-1, 1] to uint8 elevations [0, 255]."""
+    return np.round((np.clip(terrain, -1.0, 1.0) + 1.0) * 127.5).astype(np.uint8)
+
+
+def hillshade(terrain: np.ndarray) -> np.ndarray:
+    """Bake shade levels from terrain elevation gradients.
+
+    Args:
+        terrain: Terrain values with a one-tile border around the shaded area
+
+    Returns:
+        uint8 SHADE_DARK / SHADE_FLAT / SHADE_LIT per interior tile
+    """
+    z = terrain * HILLSHADE_RELIEF
+    dzdx = (z[1:-1, 2:] - z[1:-1, :-2]) / 2
+    dzdy = (z[2:, 1:-1] - z[:-2, 1:-1]) / 2
+    # Lambert term of the surface normal (-dzdx, -dzdy, 1) against the light
+    lx, ly, lz = HILLSHADE_LIGHT
+    light = (lz - dzdx * lx - dzdy * ly) / np.sqrt(dzdx * dzdx + dzdy * dzdy + 1)
+    shade = np.full(light.shape, SHADE_FLAT, dtype=np.uint8)
+    shade[light < lz - HILLSHADE_THRESHOLD] = SHADE_DARK
+    shade[light > lz + HILLSHADE_THRESHOLD] = SHADE_LIT
+    return shade
+
+
+@dataclass
+class WorldChunk:
+    """One generated CHUNK_SIZE x CHUNK_SIZE block of the world.
+
+    Arrays are indexed [local_y, local_x]. The walkability and opacity
+    masks are packed one bit per tile (little-endian bit order, tile index
+    ly * size + lx); walkability is also kept as a Python int for fast
+    scalar lookups. The raster slot is filled by the renderer with the
+    chunk's shaded palette colors, so it lives and dies with the chunk.
+    """
+    cx: int
+    cy: int
+    tiles: np.ndarray       # uint8 tile codes
+    biomes: np.ndarray      # uint8 biome codes
+    walkable: np.ndarray    # packed walkability bits (uint8, CHUNK_SIZE**2 / 8)
+    walk_bits: int          # same bits as a Python int
+    opaque: np.ndarray      # packed sight-blocking bits, same layout as walkable
+    cells: list             # flat list of (TileType, BiomeType) tuples
+    elevation: np.ndarray   # uint8 quantized terrain elevation
+    shade: np.ndarray       # uint8 baked hillshade level (SHADE_DARK/FLAT/LIT)
+    raster: Optional[np.ndarray] = None  # palette colors, baked on first draw
+
+
+def build_chunk(
+    chunk_x: int,
+    chunk_y: int,
+    tiles: np.ndarray,
+    biomes: np.ndarray,
+    elevation: Optional[np.ndarray] = None,
+    shade: Optional[np.ndarray] = None,
+) -> WorldChunk:
+    """Assemble a WorldChunk, deriving its packed masks and cell list.
+
+    Args:
+        chunk_x: Chunk X coordinate
+        chunk_y: Chunk Y coordinate
+        tiles: uint8 tile codes, shape (CHUNK_SIZE, CHUNK_SIZE)
+        biomes: uint8 biome codes, same shape
+        elevation: uint8 quantized elevation, same shape (level ground if None)
+        shade: uint8 hillshade levels, same shape (unshaded if None)
+
+    Returns:
+        The WorldChunk
+    """
+    walkable = np.packbits(WALKABLE_LUT[tiles].ravel(), bitorder="little")
+    cells = [(TILE_TYPES[t], BIOME_TYPES[b]) for t, b in zip(tiles.ravel().tolist(), biomes.ravel().tolist())]
+    return WorldChunk(
+        cx=chunk_x,
+        cy=chunk_y,
+        tiles=tiles,
+        biomes=biomes,
+        walkable=walkable,
+        walk_bits=int.from_bytes(walkable.tobytes(), "little"),
+        opaque=np.packbits(OPAQUE_LUT[tiles].ravel(), bitorder="little"),
+        cells=cells,
+        elevation=np.full(tiles.shape, 128, dtype=np.uint8) if elevation is None else elevation,
+        shade=np.full(tiles.shape, SHADE_FLAT, dtype=np.uint8) if shade is None else shade,
+    )
+
+
+class ChunkedLayer(abc.ABC):
+    """A tile layer generated and cached in chunks.
+
+    Provides chunk caching (LRU, with eviction listeners) and the tile,
+    walkability, opacity and distance-field queries shared by the surface
+    world and cave interiors. Subclasses implement _generate_chunk_data.
+    """
+
+    def __init__(self, max_chunks: int = 4096):
+        """Initialize the layer.
+
+        Args:
+            max_chunks: Maximum number of chunks kept in the cache
+        """
+        self.max_chunks = max_chunks
+        self._cache: "OrderedDict[Tuple[int, int], WorldChunk]" = OrderedDict()  # Cache generated chunks
+        self._eviction_listeners: List[Callable[[int, int], None]] = []
+        self._distances: "OrderedDict[Tuple[int, int], np.ndarray]" = OrderedDict()  # distance fields of cached chunks
+
+    @abc.abstractmethod
+    def _generate_chunk_data(self, chunk_x: int, chunk_y: int) -> WorldChunk:
+        """Generate one chunk of this layer."""
+
+    def get_chunk(self, chunk_x: int, chunk_y: int) -> WorldChunk:
+        """Get a generated chunk, generating and caching it if needed.
+
+        Args:
+            chunk_x: Chunk X coordinate
+            chunk_y: Chunk Y coordinate
+
+        Returns:
+            The WorldChunk
+        """
+        key = (chunk_x, chunk_y)
+        chunk = self._cache.get(key)
+        if chunk is not None:
+            self._cache.move_to_end(key)
+            return chunk
+
+        chunk = self._generate_chunk_data(chunk_x, chunk_y)
+        self._cache[key] = chunk
+        while len(self._cache) > self.max_chunks:
+            evicted, _ = self._cache.popitem(last=False)
+            self._notify_evicted(*evicted)
+        return chunk
+
+    def add_eviction_listener(self, callback: Callable[[int, int], None]):
+        """Register a callback invoked with (chunk_x, chunk_y) when a chunk leaves the cache.
+
+        Lets systems that cache data derived from chunks drop it in step
+        with the world.
+
+        Args:
+            callback: Function taking the evicted chunk's coordinates
+        """
+        self._eviction_listeners.append(callback)
+
+    def remove_eviction_listener(self, callback: Callable[[int, int], None]):
+        """Unregister a callback added with add_eviction_listener, e.g. when its owner is discarded."""
+        if callback in self._eviction_listeners:
+            self._eviction_listeners.remove(callback)
+
+    def _notify_evicted(self, chunk_x: int, chunk_y: int):
+        self._distances.pop((chunk_x, chunk_y), None)
+        for callback in self._eviction_listeners:
+            callback(chunk_x, chunk_y)
+
+    def get_tile(self, x: int, y: int) -> Tuple[TileType, BiomeType]:
+        """Get the tile and biome at a position.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            Tuple of (TileType, BiomeType)
+        """
+        chunk = self.get_chunk(x >> CHUNK_SHIFT, y >> CHUNK_SHIFT)
+        return chunk.cells[((y & CHUNK_MASK) << CHUNK_SHIFT) | (x & CHUNK_MASK)]
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        """Check if a position is walkable.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            True if the tile can be walked on
+        """
+        chunk = self.get_chunk(x >> CHUNK_SHIFT, y >> CHUNK_SHIFT)
+        return bool((chunk.walk_bits >> (((y & CHUNK_MASK) << CHUNK_SHIFT) | (x & CHUNK_MASK))) & 1)
+
+    def _gather_bits(self, xs, ys, mask: str) -> np.ndarray:
+        """Look up one packed per-chunk mask for many positions at once."""
+        xs = np.asarray(xs, dtype=np.int64)
+        ys = np.asarray(ys, dtype=np.int64)
+        if xs.size == 0:
+            return np.zeros(xs.shape, dtype=bool)
+
+        cxs = (xs >> CHUNK_SHIFT).ravel()
+        cys = (ys >> CHUNK_SHIFT).ravel()
+        unique_keys, inverse = np.unique(np.stack([cxs, cys]), axis=1, return_inverse=True)
+        masks = np.empty((unique_keys.shape[1], CHUNK_SIZE * CHUNK_SIZE // 8), dtype=np.uint8)
+        for i, (cx, cy) in enumerate(unique_keys.T.tolist()):
+            masks[i] = getattr(self.get_chunk(cx, cy), mask)
+
+        index = (((ys & CHUNK_MASK) << CHUNK_SHIFT) | (xs & CHUNK_MASK)).ravel()
+        bits = (masks[inverse.ravel(), index >> 3] >> (index & 7)) & 1
+        return bits.astype(bool).reshape(xs.shape)
+
+    def is_walkable_many(self, xs, ys) -> np.ndarray:
+        """Check walkability for many positions in one vectorized query.
+
+        Args:
+            xs: Integer X coordinates (array-like)
+            ys: Integer Y coordinates (array-like, same shape as xs)
+
+        Returns:
+            Boolean array, True where the tile can be walked on
+        """
+        return self._gather_bits(xs, ys, "walkable")
+
+    def is_opaque(self, x: int, y: int) -> bool:
+        """Check if a position blocks line of sight.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            True if the tile blocks sight
+        """
+        chunk = self.get_chunk(x >> CHUNK_SHIFT, y >> CHUNK_SHIFT)
+        index = ((y & CHUNK_MASK) << CHUNK_SHIFT) | (x & CHUNK_MASK)
+        return bool((int(chunk.opaque[index >> 3]) >> (index & 7)) & 1)
+
+    def is_opaque_many(self, xs, ys) -> np.ndarray:
+        """Check sight blocking for many positions in one vectorized query.
+
+        Args:
+            xs: Integer X coordinates (array-like)
+            ys: Integer Y coordinates (array-like, same shape as xs)
+
+        Returns:
+            Boolean array, True where the tile blocks sight
+        """
+        return self._gather_bits(xs, ys, "opaque")
+
+    def distance_fields(self, chunk_x: int, chunk_y: int) -> np.ndarray:
+        """Get a chunk's distance fields, deriving and caching them if needed.
+
+        The fields are computed over the chunk padded with a halo of
+        CHUNK_SIZE tiles from its eight neighbours (generating them if
+        needed), so values are seam-correct. They are dropped when the
+        chunk leaves the cache.
+
+        Args:
+            chunk_x: Chunk X coordinate
+            chunk_y: Chunk Y coordinate
+
+        Returns:
+            uint8 array [len(DISTANCE_FIELDS), CHUNK_SIZE, CHUNK_SIZE] of squared
+            distances to the nearest feature tile, capped at DISTANCE_CAP**2
+        """
+        key = (chunk_x, chunk_y)
+        fields = self._distances.get(key)
+        if fields is not None:
+            self._distances.move_to_end(key)
+            return fields
+
+        padded = np.empty((3 * CHUNK_SIZE, 3 * CHUNK_SIZE), dtype=np.uint8)
+        for dy in range(3):
+            for dx in range(3):
+                tiles = self.get_chunk(chunk_x + dx - 1, chunk_y + dy - 1).tiles
+                padded[dy * CHUNK_SIZE : (dy + 1) * CHUNK_SIZE, dx * CHUNK_SIZE : (dx + 1) * CHUNK_SIZE] = tiles
+        fields = np.stack([distance_transform(features, CHUNK_SIZE) for features in DISTANCE_LUT[:, padded]])
+
+        self._distances[key] = fields
+        while len(self._distances) > self.max_chunks:
+            self._distances.popitem(last=False)
+        return fields
+
+    def _field_index(self, field: str) -> int:
+        if field not in DISTANCE_FEATURES:
+            raise ValueError(f"Unknown distance field {field!r}, expected one of {DISTANCE_FIELDS}")
+        return DISTANCE_FIELDS.index(field)
+
+    def distance_to(self, field: str, x: int, y: int) -> float:
+        """Get the distance from a position to the nearest tile of a distance field's features.
+
+        Args:
+            field: Name of the field, a key of DISTANCE_FEATURES
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            Euclidean distance in tiles (0 on a feature tile); anything
+            farther than DISTANCE_CAP is reported as DISTANCE_CAP
+        """
+        fields = self.distance_fields(x >> CHUNK_SHIFT, y >> CHUNK_SHIFT)
+        return math.sqrt(int(fields[self._field_index(field), y & CHUNK_MASK, x & CHUNK_MASK]))
+
+    def distance_to_many(self, field: str, xs, ys) -> np.ndarray:
+        """Look up a distance field for many positions in one vectorized query.
+
+        Args:
+            field: Name of the field, a key of DISTANCE_FEATURES
+            xs: Integer X coordinates (array-like)
+            ys: Integer Y coordinates (array-like, same shape as xs)
+
+        Returns:
+            Float array of distances, capped at DISTANCE_CAP as in distance_to
+        """
+        index = self._field_index(field)
+        xs = np.asarray(xs, dtype=np.int64)
+        ys = np.asarray(ys, dtype=np.int64)
+        squared = np.empty(xs.shape, dtype=np.uint8)
+        cxs, cys = xs >> CHUNK_SHIFT, ys >> CHUNK_SHIFT
+        for cx, cy in set(zip(cxs.ravel().tolist(), cys.ravel().tolist())):
+            inside = (cxs == cx) & (cys == cy)
+            squared[inside] = self.distance_fields(cx, cy)[index, ys[inside] & CHUNK_MASK, xs[inside] & CHUNK_MASK]
+        return np.sqrt(squared.astype(np.float64))
+
+    def get_spawn_chance(self, x: int, y: int) -> float:
+        """Get enemy spawn chance at a position.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            Spawn chance [0, 1]
+        """
+        _, biome = self.get_tile(x, y)
+        config = BIOME_CONFIGS[biome]
+        return config.enemy_spawn_rate
+
+    def get_stamina_modifier(self, x: int, y: int) -> float:
+        """Get the stamina drain multiplier for moving onto a position.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            The biome's stamina modifier, reduced by ROAD_STAMINA_FACTOR on roads
+        """
+        tile, biome = self.get_tile(x, y)
+        modifier = BIOME_CONFIGS[biome].stamina_modifier
+        return modifier * ROAD_STAMINA_FACTOR if tile == TileType.ROAD else modifier
+
+    def generate_chunk(self, chunk_x: int, chunk_y: int, chunk_size: int = 16) -> List[List[Tuple[TileType, BiomeType]]]:
+        """Generate a chunk of the world.
+
+        Args:
+            chunk_x: Chunk X coordinate
+            chunk_y: Chunk Y coordinate
+            chunk_size: Size of the chunk
+
+        Returns:
+            2D list of (TileType, BiomeType) tuples
+        """
+        if chunk_size == CHUNK_SIZE:
+            cells = self.get_chunk(chunk_x, chunk_y).cells
+            return [cells[row * CHUNK_SIZE : (row + 1) * CHUNK_SIZE] for row in range(CHUNK_SIZE)]
+
+        chunk = []
+        start_x = chunk_x * chunk_size
+        start_y = chunk_y * chunk_size
+
+        for y in range(chunk_size):
+            row = []
+            for x in range(chunk_size):
+                world_x = start_x + x
+                world_y = start_y + y
+                row.append(self.get_tile(world_x, world_y))
+            chunk.append(row)
+
+        return chunk
+
+    def clear_cache(self):
+        """Clear the chunk cache to free memory."""
+        evicted = list(self._cache)
+        self._cache.clear()
+        for key in evicted:
+            self._notify_evicted(*key)
+
+    def pois_in_view(self, x0: int, y0: int, width: int, height: int) -> List[PointOfInterest]:
+        """Get the points of interest in a rectangle of tiles (none by default)."""
+        return []
+
+
+class ProceduralWorld(ChunkedLayer):
     """Procedurally generated world using noise functions.
 
     The world is infinite and generated on-demand based on position.
-    Each seed produces a unique world.
+    Each seed produces a unique world. Tiles are generated a whole
+    chunk at a time with vectorized noise and kept in an LRU chunk cache.
     """
 
-    def __init__(self, seed: int = 42):
+    def __init__(
+        self,
+        seed: int = 42,
+        max_chunks: int = 4096,
+        rivers: bool = True,
+        max_caves: int = 8,
+        climate_step: int = 1,
+        roads: bool = False,
+        road_cache_dir: Optional[str] = None,
+        seasonal: bool = False,
+    ):
         """Initialize the procedural world.
 
         Args:
             seed: Random seed for consistent generation
+            max_chunks: Maximum number of chunks kept in the cache
+            rivers: Whether to carve rivers from the hydrology pass
+            max_caves: Maximum number of generated cave interiors kept
+            climate_step: Sample moisture and temperature every this many tiles and
+                interpolate between (1 evaluates them at every tile)
+            roads: Whether to lay roads between points of interest (see roads.py)
+            road_cache_dir: Directory where planned road regions are cached on disk
+            seasonal: Whether the climate shifts with in-game seasons (see seasons.py)
         """
+        super().__init__(max_chunks)
         self.seed = seed
-        self._cache: dict = {}  # Cache generated chunks
 
         # Create unique noise generators for this seed
         self.terrain_noise = OpenSimplex(seed=seed)
         self.moisture_noise = OpenSimplex(seed=seed + 1000)
         self.temperature_noise = OpenSimplex(seed=seed + 2000)
+        self.cave_noise = OpenSimplex(seed=seed + 3000)
+
+        self.max_caves = max_caves
+        self._caves: OrderedDict = OrderedDict()  # entrance -> CaveLayer
+        self.hydrology = Hydrology(self._regional_height) if rivers else None
+        self.climate = ClimateLattice(self._climate_fields, step=climate_step) if climate_step > 1 else None
+        self.pois = POIIndex()  # filled as chunks are generated; outlives chunk eviction, bounded by region
+        self.roads = None
+        if roads:
+            from .roads import RoadNetwork
+
+            self.roads = RoadNetwork(seed, climate_step=climate_step, rivers=rivers, cache_dir=road_cache_dir)
+
+        # Seasonal mode: chunks of the current slice live in the chunk cache,
+        # the next slice's are prefetched beside it before the season turns over
+        self.season = 0
+        self.seasons = SeasonalClimate(self.moisture_noise, self.temperature_noise) if seasonal else None
+        self._next_season: Optional[int] = None
+        self._next_chunks: "OrderedDict[Tuple[int, int], WorldChunk]" = OrderedDict()
 
     def _fbm(self, noise: OpenSimplex, x: float, y: float, octaves: int = 4) -> float:
         """Fractal Brownian Motion for this world's noise."""
@@ -362,109 +1080,314 @@ class ProceduralWorld:
         else:
             return BiomeType.GRASSLAND
 
-    def get_tile(self, x: int, y: int) -> Tuple[TileType, BiomeType]:
-        """Get the tile and biome at a position.
+    def _climate_fields(self, xs: np.ndarray, ys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Moisture and temperature [0, 1] for arrays of tile coordinates."""
+        moisture = (fbm2(self.moisture_noise, xs * 0.08, ys * 0.08, octaves=3) + 1) / 2
+        temperature = (fbm2(self.temperature_noise, xs * 0.06, ys * 0.06, octaves=2) + 1) / 2
+        return moisture, temperature
+
+    def _terrain_field(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Terrain elevation [-1, 1] for arrays of tile coordinates."""
+        return fbm2(self.terrain_noise, xs * 0.1, ys * 0.1, octaves=4)
+
+    def _cave_field(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Cave noise [-1, 1] for arrays of tile coordinates; entrances sit on its peaks."""
+        return noise2(self.cave_noise, xs * 0.15, ys * 0.15)
+
+    def _regional_height(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Low-frequency terrain elevation that rivers drain across."""
+        return fbm2(self.terrain_noise, xs * 0.015, ys * 0.015, octaves=3)
+
+    def _surface_tiles(
+        self, xs: np.ndarray, ys: np.ndarray, moisture: np.ndarray, temperature: np.ndarray, terrain: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Biome and road-free tile codes of a chunk under a given climate, rivers included."""
+        biomes = determine_biomes(moisture, temperature)
+        tiles = generate_tiles(xs, ys, biomes, terrain, self.seed)
+        if self.hydrology is not None:
+            rivers = self.hydrology.river_mask(int(xs[0, 0]), int(ys[0, 0]), CHUNK_SIZE, CHUNK_SIZE)
+            tiles[rivers] = TILE_CODES[TileType.WATER]
+        return biomes, tiles
+
+    def _static_climate(self, chunk_x: int, chunk_y: int, xs: np.ndarray, ys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """A chunk's moisture and temperature before any seasonal shift."""
+        if self.climate is not None:
+            return self.climate.sample(chunk_x * CHUNK_SIZE, chunk_y * CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE)
+        return self._climate_fields(xs, ys)
+
+    def _place_chunk_pois(
+        self, chunk_x: int, chunk_y: int, xs: np.ndarray, ys: np.ndarray, tiles: np.ndarray
+    ) -> List[PointOfInterest]:
+        """Place and index a chunk's POIs and cave mouth from its static road-free tiles.
+
+        POIs and the cave entrance come from the static climate, so they do
+        not depend on the season a chunk happens to be generated in first.
+        """
+        # At most one cave entrance per chunk, at its walkable cave-noise peak
+        walkable = WALKABLE_LUT[tiles]
+        peak = cave_entrance_peak(self._cave_field(xs, ys), walkable)
+        if peak is not None:
+            walkable[peak] = False
+        pois = place_pois(self.seed, chunk_x, chunk_y, walkable)
+        if peak is not None:
+            pois.append(PointOfInterest(int(xs[peak]), int(ys[peak]), POIType.CAVE_MOUTH))
+        self.pois.add_chunk(chunk_x, chunk_y, pois)
+        return pois
+
+    def chunk_pois(self, chunk_x: int, chunk_y: int) -> List[PointOfInterest]:
+        """Get a chunk's points of interest, its cave mouth included.
+
+        A chunk not indexed yet has them placed from its static road-free
+        tiles, without generating the chunk: no roads are planned and the
+        chunk cache is left alone.
 
         Args:
-            x: X coordinate
-            y: Y coordinate
+            chunk_x: Chunk X coordinate
+            chunk_y: Chunk Y coordinate
 
         Returns:
-            Tuple of (TileType, BiomeType)
+            List of PointOfInterest in the chunk
         """
-        cache_key = (x, y)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        pois = self.pois.chunk(chunk_x, chunk_y)
+        if pois is None:
+            ys, xs = np.mgrid[0:CHUNK_SIZE, 0:CHUNK_SIZE]
+            xs = xs + chunk_x * CHUNK_SIZE
+            ys = ys + chunk_y * CHUNK_SIZE
+            pois = self._place_chunk_pois(chunk_x, chunk_y, xs, ys, self._static_tiles(chunk_x, chunk_y))
+        return pois
+
+    def _static_tiles(self, chunk_x: int, chunk_y: int) -> np.ndarray:
+        """A chunk's road-free tile codes under the static climate, computed without the chunk cache."""
+        ys, xs = np.mgrid[0:CHUNK_SIZE, 0:CHUNK_SIZE]
+        xs = xs + chunk_x * CHUNK_SIZE
+        ys = ys + chunk_y * CHUNK_SIZE
+        moisture, temperature = self._static_climate(chunk_x, chunk_y, xs, ys)
+        return self._surface_tiles(xs, ys, moisture, temperature, self._terrain_field(xs, ys))[1]
+
+    def _generate_chunk_data(self, chunk_x: int, chunk_y: int, season: Optional[int] = None) -> WorldChunk:
+        """Generate a chunk's tile, biome and walkability arrays (for the current season by default)."""
+        ys, xs = np.mgrid[0:CHUNK_SIZE, 0:CHUNK_SIZE]
+        xs = xs + chunk_x * CHUNK_SIZE
+        ys = ys + chunk_y * CHUNK_SIZE
+
+        moisture, temperature = self._static_climate(chunk_x, chunk_y, xs, ys)
+        # Terrain with a one-tile border, for the hillshade gradients
+        halo_ys, halo_xs = np.mgrid[-1 : CHUNK_SIZE + 1, -1 : CHUNK_SIZE + 1]
+        terrain_halo = self._terrain_field(halo_xs + chunk_x * CHUNK_SIZE, halo_ys + chunk_y * CHUNK_SIZE)
+        terrain = terrain_halo[1:-1, 1:-1]
+
+        biomes, tiles = self._surface_tiles(xs, ys, moisture, temperature, terrain)
+        pois = self.pois.chunk(chunk_x, chunk_y)
+        if pois is None:
+            pois = self._place_chunk_pois(chunk_x, chunk_y, xs, ys, tiles)
+        if self.seasons is not None:
+            season = self.season if season is None else season
+            moisture, temperature = self.seasons.apply(moisture, temperature, chunk_x * CHUNK_SIZE, chunk_y * CHUNK_SIZE, season)
+            biomes, tiles = self._surface_tiles(xs, ys, moisture, temperature, terrain)
+
+        entrance = next((poi for poi in pois if poi.kind == POIType.CAVE_MOUTH), None)
+        peak = None
+        if entrance is not None:
+            peak = (entrance.y - chunk_y * CHUNK_SIZE, entrance.x - chunk_x * CHUNK_SIZE)
+            tiles[peak] = TILE_CODES[TileType.CAVE_FLOOR]
+
+        if self.roads is not None:
+            # Roads are planned over the road-free tiles above, so they go on last
+            # (never over a cave entrance)
+            roads = self.roads.road_mask(chunk_x * CHUNK_SIZE, chunk_y * CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE).copy()
+            if peak is not None:
+                roads[peak] = False
+            tiles[roads] = TILE_CODES[TileType.ROAD]
+
+        # Water lies flat whatever the terrain under it
+        shade = hillshade(terrain_halo)
+        shade[tiles == TILE_CODES[TileType.WATER]] = SHADE_FLAT
+        return build_chunk(chunk_x, chunk_y, tiles, biomes, quantize_elevation(terrain), shade)
+
+    def update_season(self, day_count: int, hour: float, budget: float = PREFETCH_BUDGET):
+        """Follow the in-game calendar in seasonal mode; call once per frame.
+
+        Near the end of a season slice this prefetches the next slice's
+        chunks within the frame budget; once the day turns into the next
+        slice it switches over.
 
-        # Use instance methods that use this world's noise generators
-        moisture = self._get_moisture(x, y)
-        temperature = self._get_temperature(x, y)
-        biome = self._determine_biome(moisture, temperature)
-        terrain_value = self._get_terrain_value(x, y)
-        tile = generate_tile(x, y, biome, terrain_value)
+        Args:
+            day_count: Current in-game day (from 1)
+            hour: Current in-game hour
+            budget: Seconds of this frame that prefetching may spend
+        """
+        if self.seasons is None:
+            return
+        season = season_index(day_count)
+        if season != self.season:
+            self.set_season(season)
+        elif hours_until_next_season(day_count, hour) <= PREFETCH_HOURS:
+            self.prefetch_season(season + 1, budget)
 
-        result = (tile, biome)
-        self._cache[cache_key] = result
-        return result
+    def prefetch_season(self, season: int, budget: float = PREFETCH_BUDGET) -> int:
+        """Generate a season slice's version of cached chunks, most recently used first.
 
-    def is_walkable(self, x: int, y: int) -> bool:
-        """Check if a position is walkable.
+        Always generates at least one missing chunk, then stops before the
+        next one would likely overrun the budget. Only one slice besides
+        the current one is kept.
 
         Args:
-            x: X coordinate
-            y: Y coordinate
+            season: Season slice to prefetch
+            budget: Seconds to spend
 
         Returns:
-            True if the tile can be walked on
+            Number of chunks generated
         """
-        tile, _ = self.get_tile(x, y)
-        return tile not in (TileType.WATER, TileType.TREE, TileType.ROCK, TileType.STONE, TileType.CAVE_WALL)
+        if self._next_season != season:
+            self._next_season = season
+            self._next_chunks.clear()
+            self.seasons.retain(self.season, season)
+
+        start = time.perf_counter()
+        generated = 0
+        for key in reversed(self._cache):
+            if key in self._next_chunks:
+                continue
+            # Stop before a chunk that would likely overrun the budget
+            elapsed = time.perf_counter() - start
+            if generated and elapsed * (generated + 1) / generated > budget:
+                break
+            self._next_chunks[key] = self._generate_chunk_data(*key, season=season)
+            # Keep least recently used first, like the chunk cache
+            self._next_chunks.move_to_end(key, last=False)
+            generated += 1
+        return generated
+
+    def set_season(self, season: int):
+        """Switch to a season slice, using its prefetched chunks if any.
+
+        Every chunk of the previous slice is reported to the eviction
+        listeners, so data derived from its tiles is dropped.
 
-    def get_spawn_chance(self, x: int, y: int) -> float:
-        """Get enemy spawn chance at a position.
+        Args:
+            season: Season slice to switch to
+        """
+        if self.seasons is None or season == self.season:
+            return
+        previous = list(self._cache)
+        self._cache = self._next_chunks if season == self._next_season else OrderedDict()
+        self._next_chunks = OrderedDict()
+        self._next_season = None
+        self.season = season
+        self.seasons.retain(season)
+        for key in previous:
+            self._notify_evicted(*key)
+
+    def pois_in_view(self, x0: int, y0: int, width: int, height: int) -> List[PointOfInterest]:
+        """Get the points of interest in a rectangle of tiles, e.g. the camera view.
+
+        Chunks not indexed yet are indexed first (see chunk_pois).
 
         Args:
-            x: X coordinate
-            y: Y coordinate
+            x0: Left tile X coordinate
+            y0: Top tile Y coordinate
+            width: Width in tiles
+            height: Height in tiles
 
         Returns:
-            Spawn chance [0, 1]
+            List of PointOfInterest inside the rectangle
         """
-        _, biome = self.get_tile(x, y)
-        config = BIOME_CONFIGS[biome]
-        return config.enemy_spawn_rate
+        found = []
+        for chunk_y in range(y0 >> CHUNK_SHIFT, ((y0 + height - 1) >> CHUNK_SHIFT) + 1):
+            for chunk_x in range(x0 >> CHUNK_SHIFT, ((x0 + width - 1) >> CHUNK_SHIFT) + 1):
+                pois = self.chunk_pois(chunk_x, chunk_y)
+                found.extend(poi for poi in pois if x0 <= poi.x < x0 + width and y0 <= poi.y < y0 + height)
+        return found
 
-    def get_color(self, x: int, y: int) -> int:
-        """Get the display color for a tile.
+    def nearest_poi(self, x: int, y: int, kind: Optional[POIType] = None, max_radius: int = 64) -> Optional[PointOfInterest]:
+        """Find the nearest point of interest, searching chunk rings outward.
 
         Args:
-            x: X coordinate
-            y: Y coordinate
+            x: Origin X tile
+            y: Origin Y tile
+            kind: Only consider this kind (any kind if None)
+            max_radius: Search radius in tiles
 
         Returns:
-            Color palette index
+            The nearest PointOfInterest within the radius, or None
         """
-        tile, biome = self.get_tile(x, y)
-        config = BIOME_CONFIGS[biome]
+        best, best_distance = None, max_radius**2
+        origin_x, origin_y = x >> CHUNK_SHIFT, y >> CHUNK_SHIFT
+        for ring in range(max_radius // CHUNK_SIZE + 2):
+            if ((ring - 1) * CHUNK_SIZE) ** 2 > best_distance:
+                break
+            for chunk_x in range(origin_x - ring, origin_x + ring + 1):
+                for chunk_y in range(origin_y - ring, origin_y + ring + 1):
+                    if max(abs(chunk_x - origin_x), abs(chunk_y - origin_y)) != ring:
+                        continue
+                    for poi in self.chunk_pois(chunk_x, chunk_y):
+                        distance = (poi.x - x) ** 2 + (poi.y - y) ** 2
+                        if (kind is None or poi.kind == kind) and distance <= best_distance:
+                            best, best_distance = poi, distance
+        return best
+
+    def cave_entrance(self, chunk_x: int, chunk_y: int) -> Optional[Tuple[int, int]]:
+        """Get the cave entrance in a chunk, if it has one.
 
-        # Tile-specific colors
-        color_map = {
-            TileType.WATER: 12,    # Blue
-            TileType.TREE: 11,     # Light green
-            TileType.ROCK: 13,     # Gray
-            TileType.STONE: 5,     # Dark gray
-            TileType.SAND: 10,     # Yellow
-            TileType.GRASS: config.base_color,
-            TileType.DIRT: 4,      # Brown
-        }
+        Args:
+            chunk_x: Chunk X coordinate
+            chunk_y: Chunk Y coordinate
 
-        return color_map.get(tile, config.base_color)
+        Returns:
+            (x, y) of the entrance tile, or None
+        """
+        for poi in self.chunk_pois(chunk_x, chunk_y):
+            if poi.kind == POIType.CAVE_MOUTH:
+                return poi.x, poi.y
+        return None
 
-    def generate_chunk(self, chunk_x: int, chunk_y: int, chunk_size: int = 16) -> List[List[Tuple[TileType, BiomeType]]]:
-        """Generate a chunk of the world.
+    def is_cave_entrance(self, x: int, y: int) -> bool:
+        """Check if a surface tile is a cave entrance."""
+        return self.cave_entrance(x >> CHUNK_SHIFT, y >> CHUNK_SHIFT) == (x, y)
+
+    def get_cave(self, x: int, y: int):
+        """Get the cave interior below an entrance, generating it if needed.
 
         Args:
-            chunk_x: Chunk X coordinate
-            chunk_y: Chunk Y coordinate
-            chunk_size: Size of the chunk
+            x: Entrance X coordinate
+            y: Entrance Y coordinate
 
         Returns:
-            2D list of (TileType, BiomeType) tuples
+            CaveLayer for the entrance
+
+        Raises:
+            ValueError: If there is no cave entrance at (x, y)
         """
-        chunk = []
-        start_x = chunk_x * chunk_size
-        start_y = chunk_y * chunk_size
+        from .caves import CaveLayer
+
+        key = (x, y)
+        cave = self._caves.get(key)
+        if cave is not None:
+            self._caves.move_to_end(key)
+            return cave
+        if not self.is_cave_entrance(x, y):
+            raise ValueError(f"No cave entrance at ({x}, {y})")
+
+        cave = CaveLayer(self.seed, key)
+        self._caves[key] = cave
+        while len(self._caves) > self.max_caves:
+            self._caves.popitem(last=False)
+        return cave
+
+    def close(self):
+        """Stop background road planning, e.g. when the world is discarded."""
+        if self.roads is not None:
+            self.roads.close()
 
-        for y in range(chunk_size):
-            row = []
-            for x in range(chunk_size):
-                world_x = start_x + x
-                world_y = start_y + y
-                row.append(self.get_tile(world_x, world_y))
-            chunk.append(row)
+    def get_color(self, x: int, y: int) -> int:
+        """Get the display color for a tile.
 
-        return chunk
+        Args:
+            x: X coordinate
+            y: Y coordinate
 
-    def clear_cache(self):
-        """Clear the tile cache to free memory."""
-        self._cache.clear()
+        Returns:
+            Color palette index
+        """
+        tile, biome = self.get_tile(x, y)
+        return int(COLOR_LUT[BIOME_CODES[biome], TILE_CODES[tile]])
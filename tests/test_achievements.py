@@ -0,0 +1,112 @@
+from rivers_of_reckoning.achievements import (
+    ACHIEVEMENT_UNLOCKED,
+    BOSS_DEFEATED,
+    ENEMY_DEFEATED,
+    PLAYER_DIED,
+    TILE_EXPLORED,
+    AchievementTracker,
+    EventBus,
+)
+from rivers_of_reckoning.engine import HeadlessEngine
+from rivers_of_reckoning.game import Game
+from rivers_of_reckoning.map_data import EXPLORER_TILE_GOAL
+from rivers_of_reckoning.savegame import load_game, save_game
+
+
+def test_achievements_unlock_when_their_counter_reaches_the_goal():
+    bus = EventBus()
+    tracker = AchievementTracker(bus)
+    unlocked = []
+    bus.subscribe(ACHIEVEMENT_UNLOCKED, lambda name: unlocked.append(name))
+
+    bus.publish(TILE_EXPLORED, total=999)
+    bus.publish(ENEMY_DEFEATED)
+    bus.publish(ENEMY_DEFEATED)
+    assert unlocked == ["First Blood"]
+
+    bus.publish(TILE_EXPLORED, total=1200)
+    bus.publish(TILE_EXPLORED, total=1100)
+    assert tracker.counters["tiles_explored"] == 1200
+    assert unlocked == ["First Blood", "Explorer"]
+
+    # Dying rules out Untouchable but not Boss Slayer
+    bus.publish(PLAYER_DIED)
+    bus.publish(BOSS_DEFEATED, amount=2)
+    assert tracker.unlocked == {"First Blood", "Explorer", "Boss Slayer"}
+
+    data = tracker.to_bytes()
+    assert len(data) == 24
+    names, counters = AchievementTracker.unpack(data)
+    assert names == tracker.unlocked and counters == tracker.counters
+
+    tracker.detach()
+    bus.publish(ENEMY_DEFEATED)
+    assert tracker.counters["enemies_defeated"] == 2
+
+
+def test_game_events_drive_achievements_across_saves(tmp_path):
+    g = Game(test_mode=True, seed=5)
+    g.start_game()
+    g.state = "playing"
+    for _ in range(3):
+        g.player.heal(1)
+    assert "Potion Master" not in g.player.achievements
+
+    path = tmp_path / "save.bin"
+    save_game(g, path)
+    restored = load_game(path)
+    assert restored.achievements.counters["potions_used"] == 3
+
+    restored.player.heal(1)
+    restored.player.heal(1)
+    assert "Potion Master" in restored.player.achievements
+    assert restored.announcements == ["Achievement unlocked: Potion Master!"]
+    g.close()
+    restored.close()
+
+
+def test_untouchable_is_lost_by_dying_earlier_in_the_session(tmp_path):
+    def win(g):
+        g.start_game()
+        g.state = "playing"
+        g.bus.publish(BOSS_DEFEATED)
+        g.bus.publish(BOSS_DEFEATED)
+        return g.player.achievements
+
+    spotless = Game(test_mode=True, seed=5)
+    assert {"Boss Slayer", "Untouchable"} <= win(spotless)
+    spotless.close()
+
+    g = Game(seed=5, engine=HeadlessEngine())
+    g.start_game()
+    g.state = "playing"
+    g.player.take_damage(g.player.health)
+    g.update_playing()
+    assert g.state == "gameover"
+    achievements = win(g)
+    assert "Boss Slayer" in achievements and "Untouchable" not in achievements
+
+    # The death also survives a save and load
+    path = tmp_path / "save.bin"
+    save_game(g, path)
+    restored = load_game(path)
+    assert win(restored) == {"Boss Slayer"}
+    g.close()
+    restored.close()
+
+
+def test_unlock_announcement_survives_the_same_moves_event():
+    g = Game(test_mode=True, seed=5)
+    g.start_game()
+    g.state = "playing"
+    g.player.explored.update((10_000 + i, 0) for i in range(EXPLORER_TILE_GOAL))
+    g.rng.stream("events").random = lambda: 0.0  # every move rolls a random event
+
+    moved = next(
+        (dx, dy) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)) if g.map.is_walkable(g.player.x + dx, g.player.y + dy)
+    )
+    g.move_player(*moved)
+    assert "Explorer" in g.player.achievements
+    assert g.event_message.startswith("[")
+    assert g.announcements == ["Achievement unlocked: Explorer!"]
+    g.close()
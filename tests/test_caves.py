@@ -0,0 +1,130 @@
+import math
+
+import esper
+import numpy as np
+import pytest
+
+from rivers_of_reckoning.caves import CAVE_RADIUS, CaveLayer, generate_cave, label_regions
+from rivers_of_reckoning.game import Game
+from rivers_of_reckoning.systems import EnemyTag, Position, SpawnProcessor
+from rivers_of_reckoning.world_gen import ProceduralWorld, TileType
+
+
+def find_entrance(world):
+    return next(e for cx in range(-8, 8) for cy in range(-8, 8) if (e := world.cave_entrance(cx, cy)))
+
+
+def test_generated_cave_is_connected():
+    for seed in range(5):
+        walls = generate_cave(np.random.default_rng(seed), 64, (32, 32))
+        assert not walls[32, 32]
+        assert walls[0].all() and walls[-1].all() and walls[:, 0].all() and walls[:, -1].all()
+        _, count = label_regions(~walls)
+        assert count == 1
+
+
+def test_cave_layer_is_deterministic_and_walkable():
+    cave = CaveLayer(7, (100, -20))
+    assert np.array_equal(cave.walls, CaveLayer(7, (100, -20)).walls)
+    assert cave.get_tile(100, -20)[0] == TileType.CAVE_FLOOR
+    assert cave.get_tile(100 + CAVE_RADIUS + 5, -20)[0] == TileType.CAVE_WALL
+
+    ys, xs = np.mgrid[-20 - CAVE_RADIUS : -20 + CAVE_RADIUS, 100 - CAVE_RADIUS : 100 + CAVE_RADIUS]
+    assert np.array_equal(cave.is_walkable_many(xs.ravel(), ys.ravel()), ~cave.walls.ravel())
+
+
+def test_world_caches_caves_per_entrance():
+    world = ProceduralWorld(seed=42)
+    x, y = find_entrance(world)
+    assert world.is_cave_entrance(x, y)
+    assert world.get_cave(x, y) is world.get_cave(x, y)
+    with pytest.raises(ValueError):
+        world.get_cave(x + 1, y)
+
+
+def game_beside_entrance():
+    g = Game(test_mode=True, seed=3)
+    g.start_game()
+    g.state = "playing"
+    surface = g.map.surface
+    x, y, dx, dy = next(
+        (x, y, dx, dy)
+        for cx in range(-8, 8)
+        for cy in range(-8, 8)
+        if (entrance := surface.cave_entrance(cx, cy))
+        for x, y in [entrance]
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+        if surface.is_walkable(x - dx, y - dy)
+    )
+    g.player.x, g.player.y = x - dx, y - dy
+    return g, dx, dy
+
+
+def test_player_enters_and_leaves_cave():
+    g, dx, dy = game_beside_entrance()
+    g.move_player(dx, dy)
+    assert g.map.in_cave
+    assert g.ecs_world.world_gen is g.map.world
+
+    g.move_player(-dx, -dy)
+    assert g.map.in_cave
+    g.move_player(dx, dy)
+    assert not g.map.in_cave
+    assert g.ecs_world.world_gen is g.map.surface
+    g.close()
+
+
+def test_cave_round_trips_reuse_services_and_keep_fog_apart():
+    g, dx, dy = game_beside_entrance()
+    surface = g.map.surface
+    g.move_player(dx, dy)
+    cave = g.map.world
+    g.move_player(-dx, -dy)
+    g.move_player(dx, dy)
+    listeners = (len(surface._eviction_listeners), len(cave._eviction_listeners))
+    for _ in range(10):
+        g.move_player(dx, dy)
+        g.move_player(-dx, -dy)
+        g.move_player(dx, dy)
+    assert not g.map.in_cave
+    assert (len(surface._eviction_listeners), len(cave._eviction_listeners)) == listeners
+
+    # Walking deep in the cave reveals cave fog only
+    ex, ey = cave.entrance
+    g.player.x, g.player.y = ex - dx, ey - dy
+    g.move_player(dx, dy)
+    assert g.map.world is cave
+    x, y = next(
+        (x, y)
+        for x in range(ex - CAVE_RADIUS, ex + CAVE_RADIUS)
+        for y in range(ey - CAVE_RADIUS, ey + CAVE_RADIUS)
+        if abs(x - ex) + abs(y - ey) > 12 and cave.is_walkable(x, y) and cave.is_walkable(x + 1, y)
+    )
+    surface_tiles = len(g.player.explored)
+    g.player.x, g.player.y = x, y
+    g.move_player(1, 0)
+    assert g.map.in_cave and (x + 1, y) in g.player.explored_layer(cave.entrance)
+    assert len(g.player.explored) == surface_tiles
+    g.close()
+
+
+def test_enemies_stay_on_the_layer_they_spawned_on():
+    g, dx, dy = game_beside_entrance()
+    g.ecs_world.place_player(g.player.x + 0.5, g.player.y + 0.5)
+    spawner = esper.get_processor(SpawnProcessor)
+
+    def populate():
+        for _ in range(60 * 30):
+            spawner.process(1 / 60)
+        return [(math.floor(pos.x), math.floor(pos.y)) for _, (pos, _) in esper.get_components(Position, EnemyTag)]
+
+    assert populate()
+    g.move_player(dx, dy)
+    assert g.map.in_cave and not esper.get_component(EnemyTag)
+    cave_enemies = populate()
+    assert cave_enemies and all(g.map.world.is_walkable(x, y) for x, y in cave_enemies)
+
+    g.move_player(-dx, -dy)
+    g.move_player(dx, dy)
+    assert not g.map.in_cave and not esper.get_component(EnemyTag)
+    g.close()
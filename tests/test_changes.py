@@ -0,0 +1,74 @@
+import random
+
+import esper
+import pytest
+
+from rivers_of_reckoning.rng import RNGService
+from rivers_of_reckoning.systems import (
+    REMOVAL_HISTORY,
+    Health,
+    PlayerTag,
+    Position,
+    TimeOfDay,
+    Velocity,
+    changes,
+    create_enemy,
+    create_game_world,
+    despawn_enemies,
+)
+
+
+def test_processors_report_only_changed_entities():
+    game_world = create_game_world(rng=RNGService(3))
+    game_world.place_player(5.0, 5.0)
+    still = create_enemy(20.5, 20.5, rng=random.Random(1))
+    moving = create_enemy(30.5, 30.5, rng=random.Random(2))
+    player = next(ent for ent, _ in esper.get_components(PlayerTag))
+    esper.component_for_entity(player, Health).current = 5
+
+    game_world.process(1 / 60)
+    seen = changes.tick
+    esper.component_for_entity(moving, Velocity).dx = 1.0
+    game_world.process(1 / 60)
+
+    assert changes.changed_since(Position, seen + 1) == [moving]
+    assert changes.changed_since(Health, seen + 1) == [player]
+    assert len(changes.changed_since(TimeOfDay, seen + 1)) == 1
+    assert still not in changes.changed_since(Velocity, seen)
+
+    despawn_enemies([moving])
+    assert changes.removed_since(seen) == [moving]
+    assert moving not in changes.changed_since(Position, 0)
+
+
+def test_enemies_in_view_follow_movement_and_despawns():
+    game_world = create_game_world(rng=RNGService(3))
+    first = create_enemy(3.5, 3.5, rng=random.Random(1))
+    second = create_enemy(40.5, 3.5, rng=random.Random(2))
+    assert [(x, y) for x, y, _ in game_world.enemies_in_view(0, 0, 16, 16)] == [(3, 3)]
+
+    # Moving across a chunk border reindexes the enemy
+    esper.component_for_entity(second, Velocity).dx = -60 * 30.0
+    game_world.process(1 / 60)
+    assert sorted((x, y) for x, y, _ in game_world.enemies_in_view(0, 0, 16, 16)) == [(3, 3), (10, 3)]
+
+    despawn_enemies([first])
+    assert [(x, y) for x, y, _ in game_world.enemies_in_view(0, 0, 16, 16)] == [(10, 3)]
+
+
+def test_enemy_index_rescans_after_the_removal_history_runs_out():
+    game_world = create_game_world(rng=RNGService(3))
+    kept = create_enemy(3.5, 3.5, rng=random.Random(1))
+    gone = create_enemy(5.5, 5.5, rng=random.Random(2))
+    assert len(game_world.enemies_in_view(0, 0, 16, 16)) == 2
+    seen = changes.tick
+
+    despawn_enemies([gone])
+    for _ in range(REMOVAL_HISTORY + 100):
+        game_world.process(1 / 60)
+    assert not changes.covers(seen)
+    with pytest.raises(ValueError):
+        changes.removed_since(seen)
+
+    assert [(x, y) for x, y, _ in game_world.enemies_in_view(0, 0, 16, 16)] == [(3, 3)]
+    assert esper.entity_exists(kept)
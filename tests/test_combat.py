@@ -0,0 +1,77 @@
+import math
+import random
+
+import esper
+
+from rivers_of_reckoning.engine import HeadlessEngine
+from rivers_of_reckoning.game import Game
+from rivers_of_reckoning.systems import (
+    ENEMY_ATTACK_COOLDOWN,
+    Combat,
+    CombatProcessor,
+    EnemyTag,
+    Health,
+    PlayerTag,
+    SpawnProcessor,
+    create_enemy,
+    create_game_world,
+)
+
+
+def never_dodge():
+    for _, (combat, _) in esper.get_components(Combat, PlayerTag):
+        combat.dodge_chance = 0.0
+
+
+def test_attacking_enemies_hit_the_player_once_per_cooldown():
+    game_world = create_game_world()
+    game_world.place_player(0.5, 0.5)
+    never_dodge()
+    enemy = create_enemy(1.5, 0.5, name="Orc", rng=random.Random(1))
+    esper.component_for_entity(enemy, EnemyTag).state = "attacking"
+    far = create_enemy(9.5, 0.5, rng=random.Random(1))
+    esper.component_for_entity(far, EnemyTag).state = "attacking"
+    damage = esper.component_for_entity(enemy, Combat).attack_damage
+
+    combat = esper.get_processor(CombatProcessor)
+    for _ in range(round(60 * ENEMY_ATTACK_COOLDOWN * 2.5)):
+        combat.process(1 / 60)
+    assert game_world.take_player_hits() == [("Orc", damage)] * 3
+    assert game_world.take_player_hits() == []
+
+
+def test_enemy_hits_reach_the_player_during_play():
+    g = Game(seed=5, engine=HeadlessEngine())
+    g.start_game()
+    g.state = "playing"
+    never_dodge()
+    enemy = create_enemy(g.player.x + 1.5, g.player.y + 0.5, name="Orc", rng=random.Random(1))
+    esper.component_for_entity(enemy, EnemyTag).state = "attacking"
+    damage = esper.component_for_entity(enemy, Combat).attack_damage
+    health = g.player.health
+
+    g.update_playing()
+    assert g.player.health == health - damage
+    assert g.event_message == f"Orc attacks! -{damage} HP"
+    g.close()
+
+
+def test_player_strikes_ecs_enemies_until_they_die():
+    g = Game(test_mode=True, seed=5)
+    g.start_game()
+    g.state = "playing"
+    start = (g.player.x, g.player.y)
+    enemy = create_enemy(g.player.x + 1.5, g.player.y + 0.5, name="Slime", rng=random.Random(2))
+    health = esper.component_for_entity(enemy, Health).current
+
+    strikes = 0
+    while esper.has_component(enemy, EnemyTag) and strikes < 20:
+        g.move_player(1, 0)
+        strikes += 1
+    # Attacking replaces the step; the dead enemy goes back to the spawn pool
+    assert (g.player.x, g.player.y) == start
+    assert strikes == math.ceil(health / 2)
+    assert g.enemies_defeated == 1
+    assert "First Blood" in g.player.achievements
+    assert len(esper.get_processor(SpawnProcessor).pool) == 1
+    g.close()
@@ -0,0 +1,70 @@
+import json
+
+import numpy as np
+import pytest
+
+from rivers_of_reckoning.events import (
+    DEFAULT_TABLE,
+    EventEngine,
+    EventTable,
+    GameEvent,
+    apply_effects,
+    build_alias_table,
+    default_event_engine,
+)
+from rivers_of_reckoning.player import Player
+from rivers_of_reckoning.rng import RNGService
+from rivers_of_reckoning.world_gen import BiomeType
+
+
+def test_alias_table_reproduces_weights():
+    weights = [5, 1, 3, 0.5, 10]
+    prob, alias = build_alias_table(weights)
+    # Each column gives prob[i] of its mass to i and the rest to alias[i]
+    mass = np.zeros(len(weights))
+    for i in range(len(weights)):
+        mass[i] += prob[i]
+        mass[alias[i]] += 1 - prob[i]
+    assert np.allclose(mass / len(weights), np.array(weights) / sum(weights))
+
+    table = EventTable([GameEvent(str(i), str(i), "") for i in range(len(weights))], weights)
+    drawn = np.bincount(table.sample_many(RNGService(1).stream("events"), 200_000), minlength=len(weights))
+    assert np.allclose(drawn / drawn.sum(), np.array(weights) / sum(weights), atol=0.01)
+
+
+def test_biomes_draw_from_their_own_tables():
+    engine = default_event_engine()
+    assert engine.table(BiomeType.MARSH) is engine.tables["marsh"]
+    assert engine.table("volcano") is engine.tables[DEFAULT_TABLE]
+
+    rng = RNGService(3).stream("events")
+    keys = {engine.table(BiomeType.TUNDRA).sample(rng).key for _ in range(500)}
+    assert keys == {event.key for event in engine.tables["tundra"].events}
+
+
+def test_declarative_effects_apply_and_round_trip():
+    engine = default_event_engine()
+    player = Player("Easy")
+    player.health = player.max_health - 1
+    gold, mana = player.gold, player.mana
+    apply_effects(player, engine.events["oasis"].effects)
+    assert player.health == player.max_health
+    assert player.mana == min(mana + 1, player.max_mana)
+
+    apply_effects(player, [("add", "gold", 5), ("damage", 2), ("set", "confused", 1)])
+    assert (player.gold, player.health, player.confused) == (gold + 5, player.max_health - 2, 1)
+
+    restored = EventEngine.from_data(json.loads(json.dumps(engine.to_data())))
+    assert restored.events == engine.events
+    assert np.allclose(restored.tables["marsh"].prob, engine.tables["marsh"].prob)
+
+
+def test_invalid_event_data_is_rejected():
+    events = {"trap": {"name": "Trap", "desc": "", "effects": [["damage", 3]]}}
+    with pytest.raises(ValueError):
+        EventEngine.from_data({"events": events, "tables": {"marsh": {"trap": 1}}})
+    with pytest.raises(ValueError):
+        EventEngine.from_data({"events": events, "tables": {DEFAULT_TABLE: {"treasure": 1}}})
+    with pytest.raises(ValueError):
+        bad = {"trap": {"name": "Trap", "desc": "", "effects": [["explode", 3]]}}
+        EventEngine.from_data({"events": bad, "tables": {DEFAULT_TABLE: {"trap": 1}}})
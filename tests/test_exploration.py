@@ -0,0 +1,53 @@
+from rivers_of_reckoning.exploration import ExplorationMap
+from rivers_of_reckoning.game import Game
+from rivers_of_reckoning.map_data import EXPLORER_TILE_GOAL
+
+
+def test_mark_query_and_count():
+    explored = ExplorationMap()
+    assert explored.mark(5, -3)
+    assert not explored.mark(5, -3)
+    assert explored.is_explored(5, -3)
+    assert (5, -3) in explored
+    assert (-5, 3) not in explored
+
+    assert explored.mark_area(-16, -16, 2) == 25
+    assert len(explored) == 26
+    assert set(explored) == {(5, -3)} | {(x, y) for x in range(-18, -13) for y in range(-18, -13)}
+
+
+def test_viewport_mask_spans_chunks():
+    explored = ExplorationMap()
+    explored.update([(-1, -1), (0, 0), (15, 16), (20, 3)])
+    mask = explored.viewport_mask(-2, -2, 24, 20)
+
+    assert mask.shape == (20, 24)
+    assert mask.sum() == 4
+    for x, y in [(-1, -1), (0, 0), (15, 16), (20, 3)]:
+        assert mask[y + 2, x + 2]
+
+
+def test_encoding_roundtrip_is_compact():
+    explored = ExplorationMap()
+    explored.mark_area(0, 0, 40)
+    explored.mark(1000, -1000)
+    data = explored.to_bytes()
+    restored = ExplorationMap.from_bytes(data)
+
+    assert len(restored) == len(explored)
+    assert set(restored) == set(explored)
+    assert len(data) < len(explored) // 8
+
+
+def test_explorer_achievement_unlocks_from_count():
+    g = Game(test_mode=True, seed=3)
+    g.start_game()
+    assert "Explorer" not in g.player.achievements
+
+    g.player.explored.mark_area(g.player.x + 100, g.player.y, 20)
+    assert len(g.player.explored) >= EXPLORER_TILE_GOAL
+    for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)] * 3:
+        g.move_player(dx, dy)
+    assert g.distance_traveled > 0
+    assert "Explorer" in g.player.achievements
+    g.close()
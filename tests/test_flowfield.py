@@ -0,0 +1,100 @@
+import math
+
+import esper
+
+from rivers_of_reckoning.flowfield import FlowField
+from rivers_of_reckoning.pathfinding import HierarchicalPathfinder
+from rivers_of_reckoning.systems import EnemyTag, PlayerTag, Position, Velocity, create_game_world
+from rivers_of_reckoning.world_gen import ProceduralWorld
+
+
+def walkable_target(world):
+    # A walkable tile in a reasonably open area, so the field has room to spread
+    field = FlowField(world, radius=16)
+    for x in range(200):
+        if world.is_walkable(x, 3):
+            field.update((x, 3))
+            if (field.distance > 0).sum() > 200:
+                return (x, 3)
+    raise AssertionError("no open area found")
+
+
+def test_field_descends_to_target():
+    world = ProceduralWorld(seed=42)
+    field = FlowField(world, radius=16)
+    target = walkable_target(world)
+    assert field.update(target)
+    assert not field.update(target)
+    assert field.distance_at(*target) == 0
+
+    pathfinder = HierarchicalPathfinder(world)
+    checked = 0
+    for x in range(target[0] - 16, target[0] + 17, 3):
+        for y in range(target[1] - 16, target[1] + 17, 3):
+            steps = field.distance_at(x, y)
+            if steps <= 0:
+                continue
+            # Following the field reaches the target in exactly `steps` moves
+            tile = (x, y)
+            for _ in range(steps):
+                nx, ny = field.sample(tile[0] + 0.5, tile[1] + 0.5)
+                tile = (math.floor(nx), math.floor(ny))
+                assert world.is_walkable(*tile)
+            assert tile == target
+            assert steps <= len(pathfinder.find_path((x, y), target)) - 1
+            checked += 1
+    assert checked > 10
+    assert field.sample(target[0] + 100.5, target[1]) is None
+
+
+def test_horde_shares_one_field():
+    world = ProceduralWorld(seed=42)
+    target = walkable_target(world)
+    game_world = create_game_world(world_gen=world)
+    esper.create_entity(Position(target[0] + 0.5, target[1] + 0.5), PlayerTag())
+
+    enemies = []
+    for x in range(target[0] - 12, target[0] + 13, 2):
+        for y in range(target[1] - 12, target[1] + 13, 2):
+            if game_world.flow_field.distance_at(x, y) != 0 and world.is_walkable(x, y):
+                enemies.append(
+                    esper.create_entity(
+                        Position(x + 0.5, y + 0.5), Velocity(max_speed=4.0), EnemyTag(state="chasing", detection_range=50)
+                    )
+                )
+
+    updates = []
+    original = game_world.flow_field.update
+    game_world.flow_field.update = lambda tile: updates.append(original(tile)) or updates[-1]
+    for _ in range(30):
+        esper.process(1 / 60)
+
+    assert len(enemies) > 50
+    assert updates.count(True) == 1
+
+
+def test_shifted_field_matches_a_fresh_one_and_follows_evictions():
+    world = ProceduralWorld(seed=42)
+    target = walkable_target(world)
+    field = FlowField(world, radius=16)
+    field.update(target)
+
+    queried = []
+    original = world.is_walkable_many
+    world.is_walkable_many = lambda xs, ys: queried.append(len(xs)) or original(xs, ys)
+    for dx, dy in [(1, 0), (0, 1), (-1, 0), (0, -1)]:
+        target = (target[0] + dx, target[1] + dy)
+        field.update(target)
+        fresh = FlowField(world, radius=16)
+        fresh.update(target)
+        assert (field.distance == fresh.distance).all()
+        assert (field.step_x == fresh.step_x).all() and (field.step_y == fresh.step_y).all()
+        fresh.close()
+    # Each one-tile move queries only the uncovered column or row
+    assert queried[::2] == [33] * 4
+
+    world.clear_cache()
+    assert field.target is None
+    assert field.update(target)
+    field.close()
+    assert field.invalidate_chunk not in world._eviction_listeners
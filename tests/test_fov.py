@@ -0,0 +1,58 @@
+import numpy as np
+
+from rivers_of_reckoning.fov import FieldOfView
+from rivers_of_reckoning.systems import TimeOfDay, TimePhase, Weather, WeatherType, get_view_radius
+from rivers_of_reckoning.world_gen import BIOME_CONFIGS, BiomeType, TileType
+
+
+class WallWorld:
+    """Open desert with a vertical wall of rock at x == 3."""
+
+    def __init__(self):
+        self.listeners = []
+
+    def add_eviction_listener(self, callback):
+        self.listeners.append(callback)
+
+    def is_opaque_many(self, xs, ys):
+        return np.asarray(xs) == 3
+
+    def get_tile(self, x, y):
+        return (TileType.ROCK if x == 3 else TileType.SAND), BiomeType.DESERT
+
+
+def test_shadowcasting_stops_at_walls():
+    fov = FieldOfView(WallWorld())
+    visible = fov.compute(0, 0, 6)
+
+    assert visible.is_visible(0, 0)
+    assert visible.is_visible(-6, 0)
+    assert not visible.is_visible(-6, -6)  # outside the circle
+    assert visible.is_visible(3, 0) and visible.is_visible(3, 2)
+    assert not any(visible.is_visible(x, y) for x in range(4, 7) for y in range(-6, 7))
+    assert visible.viewport_mask(-1, -1, 3, 3).all()
+
+
+def test_results_memoized_until_chunk_evicted():
+    world = WallWorld()
+    fov = FieldOfView(world)
+    first = fov.compute(0, 0, 5)
+    assert fov.compute(0, 0, 5) is first
+    assert fov.compute(0, 0, 4) is not first
+
+    world.listeners[0](5, 5)
+    assert fov.compute(0, 0, 5) is first
+    world.listeners[0](0, -1)
+    assert fov.compute(0, 0, 5) is not first
+
+
+def test_view_radius_shrinks_with_fog_and_night():
+    desert = BIOME_CONFIGS[BiomeType.DESERT].visibility
+    marsh = BIOME_CONFIGS[BiomeType.MARSH].visibility
+    clear_day = get_view_radius(desert, Weather(current=WeatherType.CLEAR), TimeOfDay(phase=TimePhase.DAY))
+
+    assert get_view_radius(marsh) < get_view_radius(desert) == clear_day
+    assert get_view_radius(desert, Weather(current=WeatherType.FOG, intensity=1.0)) < clear_day
+    assert get_view_radius(desert, Weather(current=WeatherType.STORM, intensity=1.0)) < clear_day
+    assert get_view_radius(desert, time=TimeOfDay(phase=TimePhase.NIGHT)) < clear_day
+    assert get_view_radius(0.0) == 1
@@ -2,7 +2,8 @@ import pytest
 from rivers_of_reckoning.player import Player
 from rivers_of_reckoning.enemy import Enemy
 from rivers_of_reckoning.map import Map
-from rivers_of_reckoning.map_data import MAP_SIZE, DIFFICULTY_LEVELS, ENEMY_TYPES, EVENT_TYPES
+from rivers_of_reckoning.events import apply_effects, default_event_engine
+from rivers_of_reckoning.map_data import MAP_SIZE, DIFFICULTY_LEVELS, ENEMY_TYPES
 from rivers_of_reckoning.game import Game
 
 
@@ -74,9 +75,8 @@ def test_player_cannot_move_through_walls():
 # --- Event Effects ---
 def test_event_effects():
     player = Player("Easy")
-    for event in EVENT_TYPES:
-        if event["effect"]:
-            event["effect"](player)
+    for event in default_event_engine().events.values():
+        apply_effects(player, event.effects)
     # Should have gained gold and lost HP at least once
     assert player.gold >= 0
     assert player.health <= player.max_health
@@ -111,11 +111,11 @@ def test_procedural_game_simulation():
 
     random.seed(0)
     # Simulate event
-    event = EVENT_TYPES[0]
-    if event["effect"]:
-        event["effect"](g.player)
-    g.event_message = event["desc"]
+    event = default_event_engine().events["treasure"]
+    apply_effects(g.player, event.effects)
+    g.event_message = event.desc
     assert g.event_message is not None
+    g.close()
 
 
 def test_game_headless_mode_player_movement_and_events():
@@ -155,3 +155,4 @@ def test_game_headless_mode_player_movement_and_events():
         # At minimum we can verify the game state is consistent
         assert g.map is not None
         assert g.player is not None
+    g.close()
@@ -0,0 +1,57 @@
+import numpy as np
+
+from rivers_of_reckoning.hydrology import REGION_SIZE, flow_accumulation, priority_flood
+from rivers_of_reckoning.world_gen import ProceduralWorld, TileType
+
+
+def test_priority_flood_drains_every_cell():
+    rng = np.random.default_rng(4)
+    height = rng.random((24, 24))
+    outlets = np.zeros_like(height, dtype=bool)
+    outlets[0, :] = outlets[-1, :] = outlets[:, 0] = outlets[:, -1] = True
+
+    filled, receiver, order = priority_flood(height, outlets)
+    assert (filled >= height).all()
+    inner = np.flatnonzero(~outlets.ravel())
+    assert (receiver[inner] >= 0).all()
+    assert (filled.ravel()[receiver[inner]] < filled.ravel()[inner]).all()
+
+    accumulation = flow_accumulation(receiver, order)
+    assert accumulation[outlets.ravel()].sum() == height.size
+
+
+def test_rivers_are_carved_as_water():
+    world = ProceduralWorld(seed=42)
+    mask = world.hydrology.river_mask(-64, -64, 192, 192)
+    assert 0.002 < mask.mean() < 0.05
+
+    ys, xs = np.nonzero(mask)
+    for x, y in list(zip(xs.tolist(), ys.tolist()))[::25]:
+        assert world.get_tile(x - 64, y - 64)[0] == TileType.WATER
+
+
+def test_rivers_independent_of_generation_order():
+    first = ProceduralWorld(seed=42)
+    second = ProceduralWorld(seed=42)
+    second.get_chunk(40, 40)
+    second.hydrology.region(1, 0)
+
+    # A window straddling the seam between regions (0, 0) and (1, 0)
+    x0 = REGION_SIZE - 32
+    assert np.array_equal(first.hydrology.river_mask(x0, 0, 64, 64), second.hydrology.river_mask(x0, 0, 64, 64))
+
+
+def test_rivers_continue_across_region_seams():
+    # 2 x 2 region windows (seed, first region X and Y) whose seams rivers cross
+    for seed, rx, ry in ((1, 0, -3), (3, -2, -1)):
+        mask = ProceduralWorld(seed=seed).hydrology.river_mask(
+            rx * REGION_SIZE, ry * REGION_SIZE, 2 * REGION_SIZE, 2 * REGION_SIZE
+        )
+        crossings = 0
+        for near, far in ((mask[:, REGION_SIZE - 1], mask[:, REGION_SIZE]), (mask[REGION_SIZE - 1, :], mask[REGION_SIZE, :])):
+            # Every river tile on one side of a seam has a river tile beside it on the other
+            for a, b in ((near, far), (far, near)):
+                for i in np.flatnonzero(a[2:-2]).tolist():
+                    assert b[i : i + 5].any()
+                    crossings += 1
+        assert crossings > 0
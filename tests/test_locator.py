@@ -0,0 +1,54 @@
+import numpy as np
+
+from rivers_of_reckoning.locator import INDEX_CELL, WorldLocator
+from rivers_of_reckoning.world_gen import BIOME_CODES, BiomeType, ProceduralWorld, determine_biomes
+
+
+def test_nearest_biome_matches_brute_force_over_regions():
+    world = ProceduralWorld(seed=3)
+    locator = WorldLocator(world)
+
+    # Tiles of each biome inside cells whose center has that biome
+    ys, xs = np.mgrid[-400:400, -400:400]
+    biomes = determine_biomes(*world._climate_fields(xs, ys))
+    centers = biomes[INDEX_CELL // 2 :: INDEX_CELL, INDEX_CELL // 2 :: INDEX_CELL]
+    cell_biomes = np.repeat(np.repeat(centers, INDEX_CELL, axis=0), INDEX_CELL, axis=1)
+
+    for biome in (BiomeType.TUNDRA, BiomeType.GRASSLAND, BiomeType.DESERT):
+        code = BIOME_CODES[biome]
+        mask = (biomes == code) & (cell_biomes == code)
+        for x, y in ((0, 0), (37, -52), (-90, 81)):
+            distances = np.hypot(xs[mask] - x, ys[mask] - y)
+            if distances.min() > 300:
+                continue
+            found = locator.nearest_biome(biome, x, y)
+            assert world.get_tile(*found)[1] == biome
+            assert np.hypot(found[0] - x, found[1] - y) == distances.min()
+
+
+def test_missing_biome_and_radius():
+    locator = WorldLocator(ProceduralWorld(seed=3))
+    assert locator.nearest_biome(BiomeType.CAVES, 0, 0, max_radius=600) is None
+    assert locator.nearest_biome(BiomeType.FOREST, 0, 0, max_radius=0) in (None, (0, 0))
+
+
+def test_nearest_cave_entrance():
+    world = ProceduralWorld(seed=42)
+    locator = WorldLocator(world)
+    found = locator.nearest_cave_entrance(0, 0)
+    assert world.is_cave_entrance(*found)
+
+    distance = np.hypot(*found)
+    for cx in range(-8, 8):
+        for cy in range(-8, 8):
+            entrance = world.cave_entrance(cx, cy)
+            if entrance is not None:
+                assert np.hypot(*entrance) >= distance
+
+
+def test_cave_entrance_search_leaves_the_world_cache_alone():
+    world = ProceduralWorld(seed=11, max_chunks=8)
+    world.get_chunk(0, 0)
+    found = WorldLocator(world).nearest_cave_entrance(0, 0, max_radius=1024)
+    assert list(world._cache) == [(0, 0)]
+    assert world.is_cave_entrance(*found)
@@ -0,0 +1,87 @@
+import random
+
+import esper
+import numpy as np
+
+from rivers_of_reckoning.los import LineOfSight
+from rivers_of_reckoning.systems import AIProcessor, EnemyTag, PlayerTag, Position, Velocity
+from rivers_of_reckoning.world_gen import BiomeType, ProceduralWorld, TileType
+
+
+class WallWorld:
+    """Open desert with a vertical wall of rock at x == 3."""
+
+    def __init__(self):
+        self._eviction_listeners = []
+
+    def add_eviction_listener(self, callback):
+        self._eviction_listeners.append(callback)
+
+    def remove_eviction_listener(self, callback):
+        self._eviction_listeners.remove(callback)
+
+    def is_opaque_many(self, xs, ys):
+        return np.asarray(xs) == 3
+
+    def get_tile(self, x, y):
+        return (TileType.ROCK if x == 3 else TileType.SAND), BiomeType.DESERT
+
+
+def ray_is_clear(world, x0, y0, x1, y1):
+    dx, dy = x1 - x0, y1 - y0
+    n = max(abs(dx), abs(dy))
+    for i in range(1, n):
+        x = x0 + (2 * i * dx + n) // (2 * n)
+        y = y0 + (2 * i * dy + n) // (2 * n)
+        if world.is_opaque(x, y):
+            return False
+    return True
+
+
+def test_batch_matches_single_rays():
+    world = ProceduralWorld(seed=8)
+    los = LineOfSight(world)
+    rng = random.Random(2)
+    xs = [rng.randint(-30, 30) for _ in range(300)]
+    ys = [rng.randint(-30, 30) for _ in range(300)]
+
+    batch = los.visible_many(0, 0, xs, ys)
+    assert batch.tolist() == [ray_is_clear(world, 0, 0, x, y) for x, y in zip(xs, ys)]
+    assert 0 < batch.sum() < len(xs)
+    assert los.visible(0, 0, 0, 0) and los.visible(0, 0, 1, 1)
+
+
+def test_answers_cached_until_their_chunks_change():
+    los = LineOfSight(WallWorld())
+    assert not los.visible(0, 0, 6, 1)
+    assert los.visible(0, 0, -6, 1)
+
+    los.world = None  # cached answers need no world lookups, also on later ticks
+    assert not los.visible(0, 0, 6, 1)
+    los.invalidate_chunk(-1, 0)
+    assert list(los._cache) == [(0, 0, 6, 1)]
+    los.invalidate_chunk(0, 0)
+    assert not los._cache and not los._by_chunk
+
+
+def test_world_evictions_invalidate_cached_answers():
+    world = ProceduralWorld(seed=8, rivers=False)
+    los = LineOfSight(world)
+    los.visible_many(0, 0, [5, -5, 20], [5, -5, 3])
+    assert len(los._cache) == 3
+    world.clear_cache()
+    assert not los._cache
+    los.close()
+    assert los.invalidate_chunk not in world._eviction_listeners
+
+
+def test_enemies_behind_walls_do_not_notice_player():
+    esper.clear_database()
+    ai = AIProcessor(rng=random.Random(0), line_of_sight=LineOfSight(WallWorld()))
+    esper.create_entity(Position(0.5, 0.5), PlayerTag())
+    behind_wall = esper.create_entity(Position(4.5, 0.5), Velocity(), EnemyTag())
+    in_view = esper.create_entity(Position(-2.5, 0.5), Velocity(), EnemyTag())
+
+    ai.process(1 / 60)
+    assert esper.component_for_entity(behind_wall, EnemyTag).state == "idle"
+    assert esper.component_for_entity(in_view, EnemyTag).state == "chasing"
@@ -0,0 +1,61 @@
+import numpy as np
+import pygame
+
+from rivers_of_reckoning.engine import HeadlessEngine
+from rivers_of_reckoning.game import Game
+from rivers_of_reckoning.overview import OVERVIEW_TILE, BiomePyramid
+from rivers_of_reckoning.world_gen import BIOME_CODES, ProceduralWorld
+
+
+def test_levels_sample_noise_directly():
+    world = ProceduralWorld(seed=21, rivers=False)
+    pyramid = BiomePyramid(world)
+
+    fine = pyramid.get(0, 0, 0)
+    assert np.array_equal(fine.biomes[:16, :16], world.get_chunk(0, 0).biomes)
+
+    coarse = pyramid.get(3, -1, 2)
+    span = pyramid.tile_span(3)
+    for i, j in ((0, 0), (5, 17), (OVERVIEW_TILE - 1, 3)):
+        x = -span + j * 8 + 4
+        y = 2 * span + i * 8 + 4
+        biome = world._determine_biome(world._get_moisture(x, y), world._get_temperature(x, y))
+        assert coarse.biomes[i, j] == BIOME_CODES[biome]
+
+
+def test_pyramid_cache_is_bounded():
+    pyramid = BiomePyramid(ProceduralWorld(seed=1), max_tiles=3)
+    first = pyramid.get(2, 0, 0)
+    assert pyramid.get(2, 0, 0) is first
+    for tx in range(1, 4):
+        pyramid.get(2, tx, 0)
+    assert not pyramid.cached(2, 0, 0) and pyramid.cached(2, 3, 0)
+
+
+def test_world_map_screen_reuses_surfaces():
+    engine = HeadlessEngine(render=True)
+    g = Game(seed=5, engine=engine)
+    g.start_game()
+    g.state = "playing"
+
+    engine.set_input([pygame.K_m], [pygame.K_m])
+    g.update()
+    assert g.state == "worldmap"
+
+    engine.set_input([], [])
+    for _ in range(200):
+        g.draw()
+    keys = [key for key, _ in g.world_map.visible_tiles()]
+    surfaces = [g.world_map._surfaces[key] for key in keys]
+    g.draw()
+    assert [g.world_map._surfaces[key] for key in keys] == surfaces
+
+    level = g.world_map.level
+    engine.set_input([pygame.K_s], [pygame.K_s])
+    g.update()
+    assert g.world_map.level == level + 1
+
+    engine.set_input([pygame.K_m], [pygame.K_m])
+    g.update()
+    assert g.state == "playing"
+    g.close()
@@ -0,0 +1,65 @@
+import esper
+
+from rivers_of_reckoning.pathfinding import HierarchicalPathfinder
+from rivers_of_reckoning.systems import EnemyTag, PlayerTag, Position, Velocity, create_game_world
+from rivers_of_reckoning.world_gen import ProceduralWorld
+
+
+def is_valid_path(world, path, start, goal):
+    steps = zip(path, path[1:])
+    return (
+        path[0] == start
+        and path[-1] == goal
+        and all(abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1 for a, b in steps)
+        and all(world.is_walkable(*tile) for tile in path[1:])
+    )
+
+
+def detour_case(world, pathfinder):
+    """Find an enemy/player tile pair within detection range whose path must go around obstacles."""
+    for x in range(0, 200):
+        for y in range(0, 40):
+            start, goal = (x, y), (x + 4, y)
+            if world.is_walkable(*start) and world.is_walkable(*goal):
+                path = pathfinder.find_path(start, goal)
+                if path is not None and len(path) - 1 >= 8:
+                    return start, goal, path
+    raise AssertionError("no detour found")
+
+
+def test_paths_cross_chunks_and_are_walkable():
+    world = ProceduralWorld(seed=42)
+    pathfinder = HierarchicalPathfinder(world)
+    start, goal, _ = detour_case(world, pathfinder)
+
+    targets = [(x, y) for x in range(start[0] - 40, start[0] + 40) for y in range(start[1] - 40, start[1] + 40)]
+    for target in targets[::97]:
+        path = pathfinder.find_path(start, target)
+        if path is not None:
+            assert is_valid_path(world, path, start, target)
+    assert pathfinder.find_path(start, start) == [start]
+
+
+def test_chunk_graphs_dropped_on_eviction():
+    world = ProceduralWorld(seed=42, max_chunks=64)
+    pathfinder = HierarchicalPathfinder(world)
+    pathfinder.graph(0, 0)
+    assert (0, 0) in pathfinder._graphs
+
+    for cx in range(100, 200):
+        world.get_chunk(cx, 0)
+    assert (0, 0) not in pathfinder._graphs
+
+
+def test_chasing_enemy_walks_around_obstacles():
+    world = ProceduralWorld(seed=42)
+    start, goal, path = detour_case(world, HierarchicalPathfinder(world))
+    create_game_world(world_gen=world)
+
+    esper.create_entity(Position(goal[0] + 0.5, goal[1] + 0.5), PlayerTag())
+    enemy = esper.create_entity(Position(start[0] + 0.5, start[1] + 0.5), Velocity(max_speed=4.0), EnemyTag(state="chasing"))
+    for _ in range(len(path) * 30):
+        esper.process(1 / 60)
+        if esper.component_for_entity(enemy, EnemyTag).state == "attacking":
+            break
+    assert esper.component_for_entity(enemy, EnemyTag).state == "attacking"
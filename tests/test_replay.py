@@ -0,0 +1,83 @@
+import pygame
+import pytest
+
+from rivers_of_reckoning.engine import Engine, HeadlessEngine
+from rivers_of_reckoning.replay import InputLog, InputRecorder, ReplayDriver, decode_keys, encode_keys
+
+
+def scripted_log(seed=31337):
+    """Press ENTER on the title screen, then walk around with idle gaps."""
+    recorder = InputRecorder(seed)
+    recorder.record_frame([], [])
+    recorder.record_frame([pygame.K_RETURN], [pygame.K_RETURN])
+    for key in [pygame.K_RIGHT, pygame.K_DOWN, pygame.K_LEFT, pygame.K_UP] * 15:
+        recorder.record_frame([key], [key])
+        for _ in range(5):
+            recorder.record_frame([], [])
+    return recorder.finish()
+
+
+def test_key_masks_roundtrip():
+    keys = {pygame.K_UP, pygame.K_SPACE, pygame.K_s}
+    assert decode_keys(encode_keys(keys)) == keys
+    # Unbound keys are dropped
+    assert encode_keys([pygame.K_z]) == 0
+
+
+def test_log_binary_roundtrip_is_compact():
+    log = scripted_log()
+    data = log.to_bytes()
+    restored = InputLog.from_bytes(data)
+
+    assert restored.seed == log.seed
+    assert list(restored.held) == list(log.held)
+    assert list(restored.pressed) == list(log.pressed)
+    # Idle frames collapse into runs
+    assert len(data) < len(log) * 4
+
+
+def test_replay_is_deterministic():
+    log = scripted_log()
+
+    def play():
+        driver = ReplayDriver(InputLog.from_bytes(log.to_bytes()))
+        game = driver.run()
+        game.close()
+        assert driver.finished
+        return game.state, game.player.x, game.player.y, game.player.health, game.distance_traveled
+
+    first = play()
+    assert first[0] in ("playing", "gameover")
+    assert play() == first
+
+
+def test_replay_until_frame():
+    driver = ReplayDriver(scripted_log())
+    game = driver.run(until_frame=2)
+    assert driver.frame == 2
+    assert game.state == "playing"
+    assert game.distance_traveled == 0
+    game.close()
+
+
+def test_logs_recorded_with_fewer_keys_still_load():
+    log = scripted_log()
+    data = bytearray(log.to_bytes())
+    # An older build bound 11 keys; key_count sits after magic and version
+    data[5] = 11
+    restored = InputLog.from_bytes(bytes(data))
+    assert list(restored.held) == list(log.held)
+
+    data[5] = 200
+    with pytest.raises(ValueError):
+        InputLog.from_bytes(bytes(data))
+
+
+@pytest.mark.filterwarnings("ignore:no fast renderer")
+def test_headless_engine_shares_the_engine_state(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    windowed = Engine()
+    headless = HeadlessEngine()
+    assert set(vars(windowed)) <= set(vars(headless))
+    assert headless.screen is None and not headless.render
+    pygame.display.quit()
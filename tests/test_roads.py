@@ -0,0 +1,131 @@
+import numpy as np
+
+from rivers_of_reckoning import roads as roads_module
+from rivers_of_reckoning.locator import WorldLocator
+from rivers_of_reckoning.roads import (
+    ROAD_REGION_SIZE,
+    RoadNetwork,
+    minimum_spanning_tree,
+    plan_region,
+    region_gates,
+    region_origin,
+)
+from rivers_of_reckoning.world_gen import BIOME_CONFIGS, ROAD_STAMINA_FACTOR, ProceduralWorld, TileType
+
+
+def test_minimum_spanning_tree_joins_every_point():
+    points = [(0, 0), (10, 0), (0, 10), (10, 10), (30, 5)]
+    edges = minimum_spanning_tree(points)
+    assert len(edges) == len(points) - 1
+    reached = {0}
+    for i, j in edges:
+        assert i in reached
+        reached.add(j)
+    assert reached == set(range(len(points)))
+    assert (1, 4) in edges or (3, 4) in edges
+
+
+def test_roads_reach_every_poi_and_meet_at_region_borders():
+    network = RoadNetwork(seed=42, threaded=False)
+    world = network._base
+
+    left, right = network.region(0, 0), network.region(1, 0)
+    ox, oy = region_origin(0, 0)
+    for poi in world.pois_in_view(ox, oy, ROAD_REGION_SIZE, ROAD_REGION_SIZE):
+        assert left[poi.y - oy, poi.x - ox]
+
+    # The east gate of one region sits next to the west gate of the next, both on roads
+    east = region_gates(42, 0, 0)[1]
+    west = region_gates(42, 1, 0)[0]
+    assert (west[0] - east[0], west[1] - east[1]) == (1, 0)
+    assert left[east[1] - oy, east[0] - ox]
+    rx, ry = region_origin(1, 0)
+    assert right[west[1] - ry, west[0] - rx]
+
+
+def test_road_regions_are_cached_on_disk(tmp_path, monkeypatch):
+    network = RoadNetwork(seed=7, cache_dir=str(tmp_path))
+    planned = network.region(0, 0)
+    network.close()
+    assert planned.any()
+
+    def fail(*args):
+        raise AssertionError("region should come from the disk cache")
+
+    monkeypatch.setattr(roads_module, "plan_region_steps", fail)
+    loaded = RoadNetwork(seed=7, cache_dir=str(tmp_path), threaded=False).region(0, 0)
+    assert np.array_equal(planned, loaded)
+
+
+def test_planner_world_matches_the_owner_and_cache_names_its_options(tmp_path):
+    world = ProceduralWorld(seed=42, rivers=False, roads=True, road_cache_dir=str(tmp_path))
+    ox, oy = region_origin(0, 0)
+    view = (ox, oy, ROAD_REGION_SIZE, ROAD_REGION_SIZE)
+    assert set(world.roads._base.pois_in_view(*view)) == set(world.pois_in_view(*view))
+
+    with_rivers = RoadNetwork(seed=42, cache_dir=str(tmp_path), threaded=False)
+    assert with_rivers._path(0, 0) != world.roads._path(0, 0)
+    coarse_climate = RoadNetwork(seed=42, climate_step=4, cache_dir=str(tmp_path), threaded=False)
+    assert coarse_climate._path(0, 0) != with_rivers._path(0, 0)
+    world.roads.close()
+
+
+def test_finished_prefetches_join_the_lru():
+    network = RoadNetwork(seed=42, threaded=True, max_regions=1)
+    network.prefetch(0, 0)
+    network.prefetch(1, 0)
+    for future in list(network._pending.values()):
+        future.result()
+    assert network.step() == 2
+    assert not network._pending
+    assert list(network._regions) == [(1, 0)]
+    network.close()
+
+
+def test_world_lays_roads_that_ease_stamina():
+    world = ProceduralWorld(seed=42, roads=True)
+    plain = ProceduralWorld(seed=42)
+    ox, oy = region_origin(0, 0)
+    road_tiles = np.argwhere(world.roads.region(0, 0))
+    assert len(road_tiles)
+
+    for ly, lx in road_tiles.tolist()[::25]:
+        x, y = ox + lx, oy + ly
+        tile, biome = world.get_tile(x, y)
+        if plain.is_cave_entrance(x, y):
+            continue
+        assert tile == TileType.ROAD
+        assert world.is_walkable(x, y)
+        expected = BIOME_CONFIGS[biome].stamina_modifier * ROAD_STAMINA_FACTOR
+        assert world.get_stamina_modifier(x, y) == expected
+        assert plain.get_stamina_modifier(x, y) == BIOME_CONFIGS[biome].stamina_modifier
+    world.roads.close()
+
+
+def test_without_threads_prefetched_regions_are_planned_a_slice_per_frame(monkeypatch):
+    network = RoadNetwork(seed=42, threaded=False)
+    network.prefetch(0, 0)
+    frames = 0
+    while network.step(budget=0.0) == 0:
+        frames += 1
+    # One step per frame: a chunk of base tiles or one routed edge
+    assert frames > ROAD_REGION_SIZE**2 // 256
+
+    def fail(*args):
+        raise AssertionError("region should already be planned")
+
+    expected = plan_region(ProceduralWorld(seed=42), 0, 0)
+    monkeypatch.setattr(roads_module, "plan_region_steps", fail)
+    assert np.array_equal(network.region(0, 0), expected)
+    assert network.step() == 0
+
+
+def test_poi_and_cave_entrance_lookups_skip_the_road_overlay():
+    world = ProceduralWorld(seed=42, roads=True)
+    assert world.nearest_poi(0, 0) is not None
+    assert WorldLocator(world).nearest_cave_entrance(0, 0, max_radius=512) is not None
+    entrance = next(e for cx in range(-8, 8) for cy in range(-8, 8) if (e := world.cave_entrance(cx, cy)))
+    assert world.is_cave_entrance(*entrance)
+    assert not world.roads._regions and not world.roads._pending
+    assert len(world._cache) == 0
+    world.close()
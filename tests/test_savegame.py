@@ -0,0 +1,130 @@
+import os
+
+import esper
+
+from rivers_of_reckoning.game import Game
+from rivers_of_reckoning.savegame import (
+    SECTION_ECS,
+    SECTION_PLAYER,
+    Autosaver,
+    load_game,
+    read_save,
+    road_cache_dir,
+    save_game,
+)
+from rivers_of_reckoning.systems import EnemyTag, PlayerTag, Position, TimeOfDay, Weather, create_enemy
+
+
+def started_game(seed=77):
+    g = Game(test_mode=True, seed=seed)
+    g.start_game()
+    g.state = "playing"
+    return g
+
+
+def walk(g, steps=20):
+    for dx, dy in [(1, 0), (0, 1), (-1, 0), (0, -1)] * (steps // 4):
+        g.move_player(dx, dy)
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    g = started_game()
+    create_enemy(30.5, 40.5, name="Orc", rng=g.rng.stream("spawn"))
+    g.player.explored.update({(1, 2), (2, 2), (3, 2)})
+    walk(g)
+    g.player.gold = 17
+    g.player.achievements.add("First Blood")
+    g.player.explored_layer((40, -12)).update({(41, -12), (42, -11)})
+    g.player.gear.add("Cloak of " + "Many Pockets " * 30)
+
+    path = tmp_path / "save.bin"
+    save_game(g, path)
+
+    restored = load_game(path)
+    assert restored.map.world.seed == g.map.world.seed
+    assert (restored.player.x, restored.player.y) == (g.player.x, g.player.y)
+    assert restored.player.gold == 17
+    assert restored.player.achievements == {"First Blood"}
+    assert restored.player.gear == g.player.gear
+    assert set(restored.player.explored) == set(g.player.explored)
+    assert (2, 2) in restored.player.explored
+    assert set(restored.player.explored_layer((40, -12))) == {(41, -12), (42, -11)}
+    assert (41, -12) not in restored.player.explored
+    assert restored.distance_traveled == g.distance_traveled
+    assert len(esper.get_component(TimeOfDay)) == 1
+    assert len(esper.get_component(Weather)) == 1
+    assert [(p.x, p.y) for _, (p, _) in esper.get_components(Position, EnemyTag)] == [(30.5, 40.5)]
+    assert [(p.x, p.y) for _, (p, _) in esper.get_components(Position, PlayerTag)] == [(g.player.x + 0.5, g.player.y + 0.5)]
+    g.close()
+    restored.close()
+
+
+def test_loaded_game_continues_identically(tmp_path):
+    g = started_game(seed=5)
+    walk(g, 12)
+    path = tmp_path / "save.bin"
+    save_game(g, path)
+
+    walk(g, 40)
+    restored = load_game(path)
+    walk(restored, 40)
+
+    assert (restored.player.x, restored.player.y, restored.player.health, restored.player.gold) == (
+        g.player.x,
+        g.player.y,
+        g.player.health,
+        g.player.gold,
+    )
+    g.close()
+    restored.close()
+
+
+def test_autosave_writes_only_changes(tmp_path):
+    g = started_game()
+    path = tmp_path / "auto.bin"
+    saver = Autosaver(path, threaded=True)
+
+    assert saver.autosave(g) == 8
+    assert saver.autosave(g) == 0
+
+    g.player.gold += 3
+    assert saver.autosave(g) == 1
+    saver.close()
+
+    sections = read_save(path)
+    restored = load_game(path)
+    assert restored.player.gold == g.player.gold
+    assert SECTION_PLAYER in sections and SECTION_ECS in sections
+    g.close()
+    restored.close()
+
+
+def test_truncated_journal_recovers_previous_state(tmp_path):
+    g = started_game()
+    path = tmp_path / "auto.bin"
+    saver = Autosaver(path, threaded=False)
+    saver.autosave(g)
+    good_gold = g.player.gold
+    g.player.gold += 50
+    saver.autosave(g)
+
+    data = path.read_bytes()
+    path.write_bytes(data[:-3])
+    restored = load_game(path)
+    assert restored.player.gold == good_gold
+    g.close()
+    restored.close()
+
+
+def test_road_regions_are_cached_beside_the_save(tmp_path):
+    path = tmp_path / "save.bin"
+    g = Game(test_mode=True, seed=77, road_cache_dir=road_cache_dir(path))
+    g.start_game()
+    save_game(g, path)
+    g.close()
+    assert g.map.surface.roads.cache_dir == str(tmp_path / "road-cache")
+    assert any(name.startswith("roads-") for name in os.listdir(tmp_path / "road-cache"))
+
+    restored = load_game(path, Game(test_mode=True, road_cache_dir=road_cache_dir(path)))
+    assert restored.map.surface.roads.cache_dir == str(tmp_path / "road-cache")
+    restored.close()
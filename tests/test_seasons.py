@@ -0,0 +1,75 @@
+import esper
+import numpy as np
+
+from rivers_of_reckoning.seasons import SEASON_DAYS, hours_until_next_season, season_index
+from rivers_of_reckoning.systems import TimeOfDay, create_game_world
+from rivers_of_reckoning.world_gen import ProceduralWorld
+
+
+def test_season_slices_follow_the_calendar():
+    assert season_index(1) == 0
+    assert season_index(SEASON_DAYS) == 0
+    assert season_index(SEASON_DAYS + 1) == 1
+    assert hours_until_next_season(1, 0.0) == SEASON_DAYS * 24
+    assert hours_until_next_season(SEASON_DAYS, 18.0) == 6.0
+
+
+def test_biomes_shift_between_seasons():
+    world = ProceduralWorld(seed=4, seasonal=True)
+    summer = np.stack([world.get_chunk(cx, 0).biomes for cx in range(-8, 8)])
+    world.set_season(3)
+    winter = np.stack([world.get_chunk(cx, 0).biomes for cx in range(-8, 8)])
+    assert (summer != winter).mean() > 0.05
+
+
+def test_next_season_is_prefetched_and_swapped_in():
+    world = ProceduralWorld(seed=9, seasonal=True, rivers=False)
+    keys = [(cx, cy) for cx in range(-3, 3) for cy in range(-3, 3)]
+    for key in keys:
+        world.get_chunk(*key)
+    evicted = []
+    world.add_eviction_listener(lambda cx, cy: evicted.append((cx, cy)))
+
+    # Far from the turnover nothing is prefetched
+    world.update_season(1, 8.0)
+    assert not world._next_chunks
+
+    # In the last hours of the season the cached chunks are prefetched a few per frame
+    frames = 0
+    while len(world._next_chunks) < len(keys):
+        world.update_season(SEASON_DAYS, 20.0, budget=0.0)
+        frames += 1
+    assert frames == len(keys)
+    assert set(world.seasons._slices) == {0, 1}
+    prefetched = dict(world._next_chunks)
+
+    world.update_season(SEASON_DAYS + 1, 0.0)
+    assert world.season == 1
+    assert all(world.get_chunk(*key) is prefetched[key] for key in keys)
+    assert sorted(evicted) == sorted(keys)
+    assert set(world.seasons._slices) == {1}
+
+    fresh = ProceduralWorld(seed=9, seasonal=True, rivers=False)
+    fresh.set_season(1)
+    assert np.array_equal(fresh.get_chunk(2, -1).tiles, prefetched[(2, -1)].tiles)
+
+
+def test_season_processor_advances_the_world():
+    world = ProceduralWorld(seed=2, seasonal=True, rivers=False)
+    game_world = create_game_world(world_gen=world)
+    for _, (time,) in esper.get_components(TimeOfDay):
+        time.day_count = 2 * SEASON_DAYS + 1
+    game_world.process(1 / 60)
+    assert world.season == 2
+
+
+def test_pois_do_not_depend_on_the_season_chunks_are_generated_in():
+    summer = ProceduralWorld(seed=4, seasonal=True)
+    winter = ProceduralWorld(seed=4, seasonal=True)
+    winter.set_season(3)
+    keys = [(cx, cy) for cx in range(-6, 6) for cy in range(-3, 3)]
+    for key in keys:
+        summer.get_chunk(*key)
+        winter.get_chunk(*key)
+    assert len(summer.pois) > 0
+    assert all(summer.pois.chunk(*key) == winter.pois.chunk(*key) for key in keys)
@@ -0,0 +1,110 @@
+import math
+import random
+
+import esper
+
+from rivers_of_reckoning.systems import (
+    DESPAWN_DISTANCE,
+    MIN_SPAWN_DISTANCE,
+    SPAWN_RADIUS,
+    Combat,
+    EnemyTag,
+    EntityPool,
+    Health,
+    Position,
+    SpawnProcessor,
+    Velocity,
+    create_game_world,
+    despawn_enemies,
+    spawn_enemies,
+)
+from rivers_of_reckoning.world_gen import CHUNK_SHIFT, ProceduralWorld
+
+
+def enemy_positions():
+    return [(pos.x, pos.y) for _, (pos, _) in esper.get_components(Position, EnemyTag)]
+
+
+def test_spawn_batches_recycle_pooled_components():
+    create_game_world()
+    pool = EntityPool(limit=2)
+    first = spawn_enemies([(1.5, 1.5, "Goblin"), (2.5, 2.5, "Orc"), (3.5, 3.5, "Slime")], rng=random.Random(1), pool=pool)
+    assert pool.created == 3
+    released = [esper.component_for_entity(ent, Health) for ent in first[:2]]
+    released[0].current = 0
+    for ent in first[:2]:
+        esper.component_for_entity(ent, Velocity).dx = 1.0
+        esper.component_for_entity(ent, Combat).attack_cooldown = 0.7
+        esper.component_for_entity(ent, EnemyTag).state = "chasing"
+
+    despawn_enemies(first, pool)
+    assert len(pool) == 2 and not enemy_positions()
+
+    again = spawn_enemies([(9.5, 9.5, "Orc")], rng=random.Random(1), pool=pool)
+    assert pool.reused == 1 and pool.created == 3 and pool.discarded == 1
+    assert again[0] in first[:2]
+    tag = esper.component_for_entity(again[0], EnemyTag)
+    assert (tag.name, tag.state) == ("Orc", "idle")
+    assert esper.component_for_entity(again[0], Position).x == 9.5
+    health = esper.component_for_entity(again[0], Health)
+    assert any(health is component for component in released)
+    assert health.current == health.maximum > 0
+    # Every field is reset in place, not only the rolled ones
+    assert esper.component_for_entity(again[0], Velocity) == Velocity(0.0, 0.0, 1.5)
+    assert esper.component_for_entity(again[0], Combat).attack_cooldown == 0.0
+
+
+def test_spawner_keeps_population_within_chunk_budgets():
+    world = ProceduralWorld(seed=12, rivers=False)
+    game_world = create_game_world(rng=None, world_gen=world)
+    game_world.place_player(0.5, 0.5)
+    spawner = esper.get_processor(SpawnProcessor)
+    spawner.rng = random.Random(3)
+
+    counts = []
+    for frame in range(60 * 60):
+        spawner.process(1 / 60)
+        if frame % 600 == 599:
+            counts.append(len(enemy_positions()))
+
+    budgets = {
+        (cx, cy): spawner.chunk_budget(cx, cy)
+        for cx in range(-SPAWN_RADIUS, SPAWN_RADIUS + 1)
+        for cy in range(-SPAWN_RADIUS, SPAWN_RADIUS + 1)
+    }
+    assert counts[-1] == counts[-2] == sum(budgets.values())
+    for x, y in enemy_positions():
+        assert world.is_walkable(math.floor(x), math.floor(y))
+        assert math.hypot(x - 0.5, y - 0.5) >= MIN_SPAWN_DISTANCE
+        chunk = (math.floor(x) >> CHUNK_SHIFT, math.floor(y) >> CHUNK_SHIFT)
+        assert (
+            sum(1 for ex, ey in enemy_positions() if (math.floor(ex) >> CHUNK_SHIFT, math.floor(ey) >> CHUNK_SHIFT) == chunk)
+            <= budgets[chunk]
+        )
+
+    # Walking away leaves the old enemies behind to be despawned and recycled
+    game_world.place_player(DESPAWN_DISTANCE * 3, 0.5)
+    spawner.process(1 / 60)
+    assert all(abs(x - DESPAWN_DISTANCE * 3) <= DESPAWN_DISTANCE for x, _ in enemy_positions())
+    assert len(spawner.pool) == min(counts[-1], spawner.pool.limit)
+
+
+def test_steady_state_spawning_recycles_instead_of_allocating():
+    world = ProceduralWorld(seed=12, rivers=False)
+    game_world = create_game_world(world_gen=world)
+    spawner = esper.get_processor(SpawnProcessor)
+    spawner.rng = random.Random(5)
+
+    # Walk back and forth between two spots, leaving each population behind
+    stats = []
+    for trip in range(8):
+        game_world.place_player(0.5 + (trip % 2) * DESPAWN_DISTANCE * 3, 0.5)
+        for _ in range(60 * 30):
+            spawner.process(1 / 60)
+        stats.append(spawner.pool.stats())
+
+    assert stats[-1]["reused"] > stats[1]["reused"]
+    assert stats[-1]["created"] == stats[2]["created"]
+    assert stats[-1]["discarded"] == 0
+    assert len(list(esper.get_entities())) == stats[-1]["created"] + 4
+    assert not hasattr(Position(), "__dict__")
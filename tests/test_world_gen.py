@@ -0,0 +1,187 @@
+import esper
+import numpy as np
+import pytest
+
+from rivers_of_reckoning.systems import Position, Velocity, create_game_world
+from rivers_of_reckoning.climate import INTERPOLATION_ERROR
+from rivers_of_reckoning.distance import DISTANCE_CAP
+from rivers_of_reckoning.world_gen import (
+    BLOCKING_TILES,
+    POI_SPACING,
+    POIIndex,
+    SHADE_DARK,
+    SHADE_FLAT,
+    SHADE_LIT,
+    TILE_CODES,
+    POIType,
+    ProceduralWorld,
+    TileType,
+    determine_biomes,
+    generate_tile,
+)
+
+
+def test_chunk_generation_matches_scalar_path():
+    world = ProceduralWorld(seed=11, rivers=False)
+    for x in range(-24, 24, 5):
+        for y in range(-24, 24, 5):
+            moisture = world._get_moisture(x, y)
+            temperature = world._get_temperature(x, y)
+            biome = world._determine_biome(moisture, temperature)
+            tile = generate_tile(x, y, biome, world._get_terrain_value(x, y), world.seed)
+            assert world.get_tile(x, y) == (tile, biome)
+            assert world.is_walkable(x, y) == (tile not in BLOCKING_TILES)
+
+
+def test_is_walkable_many_matches_scalar():
+    world = ProceduralWorld(seed=3)
+    xs = np.arange(-40, 40)
+    ys = np.arange(40, -40, -1)
+    expected = [world.is_walkable(x, y) for x, y in zip(xs.tolist(), ys.tolist())]
+    assert world.is_walkable_many(xs, ys).tolist() == expected
+    assert world.is_walkable_many([], []).shape == (0,)
+
+
+def test_chunk_cache_is_bounded():
+    world = ProceduralWorld(seed=3, max_chunks=4)
+    for cx in range(10):
+        world.get_tile(cx * 16, 0)
+    assert len(world._cache) == 4
+    assert (9, 0) in world._cache and (0, 0) not in world._cache
+
+
+def test_movement_blocked_by_terrain():
+    world = ProceduralWorld(seed=5)
+    blocked = next((x, 0) for x in range(200) if not world.is_walkable(x, 0))
+    create_game_world(world_gen=world)
+
+    mover = esper.create_entity(Position(blocked[0] - 0.5, 0.5), Velocity(60.0, 0.0))
+    free = esper.create_entity(Position(0.5, 0.5), Velocity(0.0, 0.0))
+    esper.process(1 / 60)
+
+    assert esper.component_for_entity(mover, Position).x == blocked[0] - 0.5
+    assert esper.component_for_entity(free, Position).x == 0.5
+
+
+def test_decoration_depends_on_seed():
+    a = ProceduralWorld(seed=1, rivers=False)
+    b = ProceduralWorld(seed=2, rivers=False)
+    for name in ("terrain_noise", "moisture_noise", "temperature_noise", "cave_noise"):
+        setattr(a, name, getattr(b, name))
+    # Same terrain and biomes, different decoration hash
+    assert not np.array_equal(a.get_chunk(0, 0).tiles, b.get_chunk(0, 0).tiles)
+
+
+def test_climate_lattice_error_and_biome_stability():
+    world = ProceduralWorld(seed=9, rivers=False, climate_step=4)
+    ys, xs = np.mgrid[-64:64, -64:64]
+    exact = world._climate_fields(xs, ys)
+    sampled = world.climate.sample(-64, -64, 128, 128)
+    for field, approx in zip(exact, sampled):
+        assert np.abs(field - approx).max() <= INTERPOLATION_ERROR[4]
+
+    # Biomes only change next to a border of the exact biome map
+    biomes = determine_biomes(*exact)
+    changed = biomes != determine_biomes(*sampled)
+    border = np.zeros(biomes.shape, dtype=bool)
+    for shift in (1, -1):
+        for axis in (0, 1):
+            border |= biomes != np.roll(biomes, shift, axis=axis)
+    near = border.copy()
+    for shift in (1, -1, 2, -2):
+        for axis in (0, 1):
+            near |= np.roll(border, shift, axis=axis)
+    assert not (changed & ~near).any()
+
+    chunk = world.get_chunk(1, -2)
+    assert np.array_equal(chunk.biomes, determine_biomes(*world.climate.sample(16, -32, 16, 16)))
+
+
+def test_pois_are_spaced_and_order_independent():
+    a = ProceduralWorld(seed=8)
+    b = ProceduralWorld(seed=8)
+    for cx in range(-4, 4):
+        for cy in range(-4, 4):
+            a.get_chunk(cx, cy)
+            b.get_chunk(-1 - cx, -1 - cy)
+
+    view = (-64, -64, 128, 128)
+    pois = a.pois_in_view(*view)
+    assert set(pois) == set(b.pois_in_view(*view))
+    assert len(pois) > 10
+
+    placed = [poi for poi in pois if poi.kind != POIType.CAVE_MOUTH]
+    for i, poi in enumerate(placed):
+        assert a.is_walkable(poi.x, poi.y)
+        for other in placed[i + 1 :]:
+            assert (poi.x - other.x) ** 2 + (poi.y - other.y) ** 2 >= POI_SPACING**2
+    for poi in pois:
+        if poi.kind == POIType.CAVE_MOUTH:
+            assert a.is_cave_entrance(poi.x, poi.y)
+
+
+def test_poi_index_is_bounded_over_a_long_walk():
+    world = ProceduralWorld(seed=8, rivers=False)
+    world.pois = POIIndex(max_regions=4)
+    start = world.pois_in_view(0, 0, 64, 64)
+    # A long walk east, one view at a time
+    for x in range(64, 64 * 40, 64):
+        world.pois_in_view(x, 0, 64, 64)
+        assert len(world.pois._regions) <= 4
+    assert world.pois.chunk(0, 0) is None
+    assert world.pois_in_view(0, 0, 64, 64) == start
+
+
+def test_nearest_poi():
+    world = ProceduralWorld(seed=8)
+    nearest = world.nearest_poi(10, 10, POIType.CHEST)
+    assert nearest.kind == POIType.CHEST
+    distance = (nearest.x - 10) ** 2 + (nearest.y - 10) ** 2
+    for poi in world.pois_in_view(-70, -70, 160, 160):
+        if poi.kind == POIType.CHEST:
+            assert (poi.x - 10) ** 2 + (poi.y - 10) ** 2 >= distance
+    assert world.nearest_poi(10, 10, max_radius=0) in (None, nearest)
+
+
+def test_distance_fields_match_brute_force_across_chunk_seams():
+    world = ProceduralWorld(seed=5)
+    xs, ys = np.meshgrid(np.arange(-24, 24), np.arange(-24, 24))
+    distances = world.distance_to_many("water", xs, ys)
+
+    # Brute force over a block wide enough to hold every feature within the cap
+    water = np.argwhere([[world.get_tile(x, y)[0] == TileType.WATER for x in range(-40, 40)] for y in range(-40, 40)])
+    water = water[:, ::-1] - 40
+    for x, y in [(-17, 3), (-16, -1), (0, 0), (15, 15), (16, -16), (7, -20), (23, 8)]:
+        nearest = min(DISTANCE_CAP, np.hypot(water[:, 0] - x, water[:, 1] - y).min())
+        assert world.distance_to("water", x, y) == pytest.approx(nearest)
+        assert distances[y + 24, x + 24] == pytest.approx(nearest)
+
+    assert world.distance_to("walls", 0, 0) <= world.distance_to("water", 0, 0)
+    with pytest.raises(ValueError):
+        world.distance_to("lava", 0, 0)
+
+    world.clear_cache()
+    assert not world._distances
+
+
+def test_chunks_bake_elevation_and_hillshade_into_their_raster():
+    from rivers_of_reckoning.map import SHADE_LUT, TILE_COLOR_LUT, Map
+
+    world = ProceduralWorld(seed=8)
+    chunks = [world.get_chunk(cx, cy) for cx in range(-2, 2) for cy in range(-2, 2)]
+    shade = np.stack([chunk.shade for chunk in chunks])
+    assert set(np.unique(shade).tolist()) == {SHADE_DARK, SHADE_FLAT, SHADE_LIT}
+    for chunk in chunks:
+        assert (chunk.shade[chunk.tiles == TILE_CODES[TileType.WATER]] == SHADE_FLAT).all()
+        terrain = world._get_terrain_value(chunk.cx * 16 + 3, chunk.cy * 16 + 5)
+        assert abs(int(chunk.elevation[5, 3]) - (terrain + 1) * 127.5) <= 0.5
+
+    game_map = Map(seed=8)
+    raster = game_map.chunk_raster(0, 0)
+    chunk = game_map.world.get_chunk(0, 0)
+    assert raster is game_map.chunk_raster(0, 0)
+    assert np.array_equal(raster, SHADE_LUT[chunk.shade, TILE_COLOR_LUT[chunk.tiles]])
+
+    # The baked raster goes with its chunk
+    game_map.world.clear_cache()
+    assert game_map.world.get_chunk(0, 0).raster is None